@@ -28,19 +28,24 @@ from five08.audit import (
     AuditEventInput,
     AuditResult,
     AuditSource,
+    ensure_audit_event_partitions,
     insert_audit_event,
 )
 from five08.logging import configure_observability
 from five08.queue import (
     EnqueuedJob,
+    JobSpec,
     QueueClient,
     JobStatus,
-    list_jobs,
+    list_jobs_async,
     enqueue_job,
-    get_job,
-    get_postgres_connection,
+    enqueue_jobs,
+    get_job_async,
+    open_postgres_connection,
     get_redis_connection,
     is_postgres_healthy,
+    close_postgres_pools,
+    close_async_postgres_pools,
 )
 from five08.backend.auth import (
     AuthSession,
@@ -73,6 +78,7 @@ from five08.worker.models import (
 
 logger = logging.getLogger(__name__)
 _ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_AUDIT_PARTITION_INTERVAL_SECONDS = 24 * 60 * 60
 
 
 class ResumeExtractRequest(BaseModel):
@@ -239,6 +245,16 @@ async def _crm_sync_scheduler(app: FastAPI) -> None:
         await asyncio.sleep(interval_seconds)
 
 
+async def _audit_partition_scheduler() -> None:
+    """Keep upcoming monthly audit_events partitions created ahead of time."""
+    while True:
+        try:
+            await asyncio.to_thread(ensure_audit_event_partitions, settings)
+        except Exception:
+            logger.exception("Failed ensuring audit_events partitions")
+        await asyncio.sleep(_AUDIT_PARTITION_INTERVAL_SECONDS)
+
+
 async def _email_resume_scheduler() -> None:
     """Run periodic mailbox polling for resume ingestion."""
     poller = ResumeMailboxProcessor(settings)
@@ -293,7 +309,7 @@ async def _is_postgres_connection_healthy(app: FastAPI) -> bool:
             await asyncio.to_thread(connection.close)
 
         try:
-            refreshed = await asyncio.to_thread(get_postgres_connection, settings)
+            refreshed = await asyncio.to_thread(open_postgres_connection, settings)
         except Exception:
             return False
 
@@ -302,14 +318,18 @@ async def _is_postgres_connection_healthy(app: FastAPI) -> bool:
 
 
 def _enqueue_espocrm_batch_sync(queue: QueueClient, event_ids: list[str]) -> None:
-    for event_id in event_ids:
-        enqueue_job(
-            queue=queue,
-            fn=JOB_FUNCTIONS["process_contact_skills_job"],
-            args=(event_id,),
-            settings=settings,
-            idempotency_key=f"espocrm:{event_id}",
-        )
+    enqueue_jobs(
+        queue,
+        [
+            JobSpec.for_call(
+                JOB_FUNCTIONS["process_contact_skills_job"],
+                (event_id,),
+                idempotency_key=f"espocrm:{event_id}",
+            )
+            for event_id in event_ids
+        ],
+        settings,
+    )
 
 
 async def _enqueue_espocrm_batch(queue: QueueClient, event_ids: list[str]) -> None:
@@ -319,14 +339,18 @@ async def _enqueue_espocrm_batch(queue: QueueClient, event_ids: list[str]) -> No
 def _enqueue_espocrm_people_sync_batch_sync(
     queue: QueueClient, event_ids: list[str], *, bucket: str
 ) -> None:
-    for event_id in event_ids:
-        enqueue_job(
-            queue=queue,
-            fn=JOB_FUNCTIONS["sync_person_from_crm_job"],
-            args=(event_id,),
-            settings=settings,
-            idempotency_key=f"crm-contact-sync:{event_id}:{bucket}",
-        )
+    enqueue_jobs(
+        queue,
+        [
+            JobSpec.for_call(
+                JOB_FUNCTIONS["sync_person_from_crm_job"],
+                (event_id,),
+                idempotency_key=f"crm-contact-sync:{event_id}:{bucket}",
+            )
+            for event_id in event_ids
+        ],
+        settings,
+    )
 
 
 async def _enqueue_espocrm_people_sync_batch(
@@ -706,7 +730,7 @@ async def job_status_handler(request: Request, job_id: str) -> JSONResponse:
     if not normalized_job_id:
         return JSONResponse({"error": "job_id_required"}, status_code=400)
 
-    job = await asyncio.to_thread(get_job, settings, normalized_job_id)
+    job = await get_job_async(settings, normalized_job_id)
     if job is None:
         return JSONResponse({"error": "job_not_found"}, status_code=404)
 
@@ -750,8 +774,7 @@ async def jobs_handler(
                 status_code=400,
             )
 
-    recent_jobs = await asyncio.to_thread(
-        list_jobs,
+    recent_jobs = await list_jobs_async(
         settings,
         created_after=cutoff,
         limit=limit,
@@ -784,7 +807,7 @@ async def rerun_job_handler(request: Request, job_id: str) -> JSONResponse:
     if not normalized_job_id:
         return JSONResponse({"error": "job_id_required"}, status_code=400)
 
-    source_job = await asyncio.to_thread(get_job, settings, normalized_job_id)
+    source_job = await get_job_async(settings, normalized_job_id)
     if source_job is None:
         return JSONResponse({"error": "job_not_found"}, status_code=404)
 
@@ -1654,12 +1677,15 @@ async def _lifespan(app: FastAPI) -> Any:
     redis_conn = get_redis_connection(settings)
     app.state.redis_conn = redis_conn
     app.state.postgres_conn_lock = asyncio.Lock()
-    app.state.postgres_conn = await asyncio.to_thread(get_postgres_connection, settings)
+    app.state.postgres_conn = await asyncio.to_thread(
+        open_postgres_connection, settings
+    )
     app.state.queue = build_queue_client()
     app.state.auth_store = RedisAuthStore(redis_conn)
     app.state.oidc_client = OIDCProviderClient(settings)
     app.state.discord_admin_verifier = DiscordAdminVerifier(settings)
     app.state.http_client = httpx.AsyncClient(follow_redirects=False)
+    app.state.audit_partition_task = asyncio.create_task(_audit_partition_scheduler())
 
     if settings.crm_sync_enabled:
         app.state.crm_sync_task = asyncio.create_task(_crm_sync_scheduler(app))
@@ -1674,6 +1700,12 @@ async def _lifespan(app: FastAPI) -> Any:
     try:
         yield
     finally:
+        if hasattr(app.state, "audit_partition_task"):
+            task = app.state.audit_partition_task
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
         if hasattr(app.state, "crm_sync_task"):
             task = app.state.crm_sync_task
             task.cancel()
@@ -1694,15 +1726,27 @@ async def _lifespan(app: FastAPI) -> Any:
                 await asyncio.to_thread(app.state.postgres_conn.close)
 
         with contextlib.suppress(Exception):
-            redis_conn.close()
+            await asyncio.to_thread(close_postgres_pools)
+
+        with contextlib.suppress(Exception):
+            await close_async_postgres_pools()
 
+        # redis_conn is the process-wide client from get_redis_connection and
+        # may be shared with other callers, so it is not closed here.
 
-def create_app(*, run_lifespan: bool = True) -> FastAPI:
-    """Create configured FastAPI app."""
+
+def create_app(
+    *, run_lifespan: bool = True, openapi_url: str | None = "/openapi.json"
+) -> FastAPI:
+    """Create configured FastAPI app.
+
+    Passing ``openapi_url=None`` also disables the interactive docs routes.
+    """
     app = FastAPI(
         title="508 Backend API",
         version="0.1.0",
         lifespan=_lifespan if run_lifespan else None,
+        openapi_url=openapi_url,
     )
 
     app.state.oidc_client = OIDCProviderClient(settings)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from datetime import datetime, timedelta, timezone
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import Any, Final
 
 import dramatiq
@@ -11,14 +15,19 @@ from dramatiq.brokers.redis import RedisBroker
 from five08.discord_webhook import DiscordWebhookLogger
 
 from five08.queue import (
+    JobOutcomeBuffer,
     JobRecord,
-    JobStatus,
+    claim_job,
+    compute_retry_delay,
     get_job,
+    get_redis_connection,
     job_is_terminal,
     mark_job_dead,
     mark_job_retry,
-    mark_job_running,
     mark_job_succeeded,
+    release_job_lock,
+    renew_job_lock,
+    try_acquire_job_lock,
 )
 from five08.worker.config import settings
 from five08.worker.crm.docuseal_processor import DocusealAgreementNonRetryableError
@@ -41,6 +50,9 @@ _WEBHOOK_SUCCESS_COLOR: Final[int] = 0x2ECC71
 
 DRAMATIQ_BROKER = RedisBroker(url=settings.redis_url)
 dramatiq.set_broker(DRAMATIQ_BROKER)
+_LOCK_REDIS = get_redis_connection(settings)
+_JOB_OUTCOMES = JobOutcomeBuffer(settings)
+atexit.register(_JOB_OUTCOMES.close)
 
 _JOB_WEBHOOK_LOGGER = DiscordWebhookLogger(
     webhook_url=settings.discord_logs_webhook_url,
@@ -179,22 +191,17 @@ def _extract_call_args(job: JobRecord) -> tuple[tuple[Any, ...], dict[str, Any]]
     return tuple(raw_args), raw_kwargs
 
 
-def _compute_retry_delay_seconds(attempt: int) -> int:
-    base = max(1, settings.job_retry_base_seconds)
-    capped = settings.job_retry_max_seconds
-    return min(base * (2 ** max(attempt - 1, 0)), capped)
-
-
 def _schedule_retry(job: JobRecord, attempts: int, *, error: str) -> None:
     job_id = job.id
-    delay_seconds = _compute_retry_delay_seconds(attempts)
-    retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=delay_seconds)
+    delay = compute_retry_delay(attempts, settings)
+    retry_at = datetime.now(tz=timezone.utc) + delay
     mark_job_retry(
         settings,
         job_id,
         attempts=attempts,
         run_after=retry_at,
         last_error=error,
+        buffer=_JOB_OUTCOMES,
     )
     if _should_log_job_event(event_type="retrying", job_type=job.type):
         _log_job_event(
@@ -206,30 +213,107 @@ def _schedule_retry(job: JobRecord, attempts: int, *, error: str) -> None:
             worker_name=settings.worker_name,
             error=error,
         )
-    execute_job.send_with_options(args=(job_id,), delay=delay_seconds * 1000)
+    execute_job.send_with_options(
+        args=(job_id,), delay=int(delay.total_seconds() * 1000)
+    )
 
 
-def _run_job(job_id: str) -> None:
+def _log_unclaimed_job(job_id: str) -> None:
+    """Explain why `claim_job` declined a delivery (cold path)."""
     job = get_job(settings, job_id)
     if job is None:
         logger.warning("Skipping job_id=%s (not found)", job_id)
-        return
-    if job_is_terminal(job.status):
+    elif job_is_terminal(job.status):
         logger.info("Skipping job_id=%s already terminal (%s)", job_id, job.status)
+    else:
+        logger.warning("Skipping job_id=%s in status %s", job_id, job.status)
+
+
+def _defer_locked_job(job_id: str) -> None:
+    """Redeliver a job whose lock is held after a short, bounded delay.
+
+    The holder is often just finishing up (e.g. a retry message that arrived
+    before its sender released the lock), so the delay is the retry base
+    rather than the full lock TTL. If the holder finishes first the
+    redelivery finds the job terminal and is skipped; if the holder died, a
+    redelivery picks the job up once the lock expires instead of the message
+    being acked and lost.
+    """
+    delay_ms = min(
+        max(1, settings.job_retry_base_seconds) * 1000,
+        settings.effective_job_lock_ttl_ms,
+    )
+    logger.info(
+        "Deferring job_id=%s by %sms (execution lock held elsewhere)",
+        job_id,
+        delay_ms,
+    )
+    execute_job.send_with_options(args=(job_id,), delay=delay_ms)
+
+
+@contextmanager
+def _job_lock_heartbeat(job_id: str, token: str) -> Iterator[None]:
+    """Keep renewing the execution lock while a job runs."""
+    stop = threading.Event()
+    interval_seconds = settings.effective_job_lock_ttl_ms / 3000
+
+    def _renew() -> None:
+        while not stop.wait(interval_seconds):
+            try:
+                if not renew_job_lock(_LOCK_REDIS, settings, job_id, token):
+                    logger.warning("Lost execution lock for job_id=%s", job_id)
+                    return
+            except Exception:
+                logger.exception("Failed renewing execution lock job_id=%s", job_id)
+
+    heartbeat = threading.Thread(
+        target=_renew, name=f"job-lock-heartbeat-{job_id}", daemon=True
+    )
+    heartbeat.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        heartbeat.join()
+
+
+def _run_job(job_id: str) -> None:
+    lock_token = try_acquire_job_lock(
+        _LOCK_REDIS, settings, job_id, worker_name=settings.worker_name
+    )
+    if lock_token is None:
+        _defer_locked_job(job_id)
         return
-    if job.status == JobStatus.RUNNING and job.locked_by != settings.worker_name:
-        logger.warning(
-            "Skipping job_id=%s locked by worker=%s",
-            job_id,
-            job.locked_by,
-        )
+    try:
+        try:
+            with _job_lock_heartbeat(job_id, lock_token):
+                _run_claimed_job(job_id)
+        finally:
+            # Persist this job's outcome before the lock is released and the
+            # actor returns (and Dramatiq acks), so a redelivery never finds a
+            # finished job still marked running.
+            _JOB_OUTCOMES.flush()
+    finally:
+        release_job_lock(_LOCK_REDIS, settings, job_id, lock_token)
+
+
+def _run_claimed_job(job_id: str) -> None:
+    job = claim_job(settings, job_id)
+    if job is None:
+        _log_unclaimed_job(job_id)
         return
 
     handler = _HANDLERS.get(job.type)
     if handler is None:
         error = f"Unknown job type: {job.type}"
         logger.error("Marking job dead id=%s error=%s", job_id, error)
-        mark_job_dead(settings, job_id, attempts=job.attempts, last_error=error)
+        mark_job_dead(
+            settings,
+            job_id,
+            attempts=job.attempts,
+            last_error=error,
+            buffer=_JOB_OUTCOMES,
+        )
         _log_job_event(
             event_type="dead",
             job_id=job.id,
@@ -241,7 +325,6 @@ def _run_job(job_id: str) -> None:
         )
         return
 
-    mark_job_running(settings, job_id, worker_name=settings.worker_name)
     if _should_log_job_event(event_type="started", job_type=job.type):
         _log_job_event(
             event_type="started",
@@ -260,6 +343,7 @@ def _run_job(job_id: str) -> None:
             job_id,
             result=result,
             base_payload=job.payload,
+            buffer=_JOB_OUTCOMES,
         )
         logger.info("Completed job_id=%s type=%s", job_id, job.type)
         if _should_log_job_event(event_type="succeeded", job_type=job.type):
@@ -286,6 +370,7 @@ def _run_job(job_id: str) -> None:
             job_id,
             attempts=next_attempt,
             last_error=error,
+            buffer=_JOB_OUTCOMES,
         )
         _log_job_event(
             event_type="dead",
@@ -309,6 +394,7 @@ def _run_job(job_id: str) -> None:
                 job_id,
                 attempts=next_attempt,
                 last_error=error,
+                buffer=_JOB_OUTCOMES,
             )
             _log_job_event(
                 event_type="dead",
@@ -246,21 +246,19 @@ class PeopleSyncProcessor:
         if not isinstance(email_data, list):
             return None
 
+        fallback: str | None = None
         for item in email_data:
             if not isinstance(item, dict):
                 continue
             candidate = _text_or_none(item.get("emailAddress"))
-            if candidate and bool(item.get("primary")):
-                return candidate
-
-        for item in email_data:
-            if not isinstance(item, dict):
+            if not candidate:
                 continue
-            candidate = _text_or_none(item.get("emailAddress"))
-            if candidate:
+            if item.get("primary"):
                 return candidate
+            if fallback is None:
+                fallback = candidate
 
-        return None
+        return fallback
 
     def _email_508(self, raw_contact: dict[str, Any]) -> str | None:
         return _text_or_none(raw_contact.get("c508Email"))
@@ -307,8 +305,7 @@ class PeopleSyncProcessor:
         if isinstance(raw_roles, list):
             return [_text for item in raw_roles if (_text := _text_or_none(item))]
         if isinstance(raw_roles, str):
-            values = [item.strip() for item in raw_roles.split(",")]
-            return [value for value in values if value]
+            return [role for item in raw_roles.split(",") if (role := item.strip())]
         if isinstance(raw_roles, dict):
             roles: list[str] = []
             for value in raw_roles.values():
@@ -112,7 +112,8 @@ class ContactSkillsProcessor:
                     error="Failed to extract skills from attachments",
                 )
 
-            extracted = ExtractedSkills(
+            # Skills and confidence come from already-validated extractor results.
+            extracted = ExtractedSkills.model_construct(
                 skills=extracted_skills,
                 confidence=average_confidence,
                 source="document_analysis",
@@ -30,7 +30,7 @@ logger = logging.getLogger(__name__)
 PRIVILEGED_ROLE_NAMES = {"admin", "steering committee", "owner"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResumeAttachment:
     """One resume-like email attachment payload."""
 
@@ -38,7 +38,7 @@ class ResumeAttachment:
     content: bytes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResumeMailboxResult:
     """Result metadata for one mailbox message."""
 
@@ -48,7 +48,7 @@ class ResumeMailboxResult:
     skipped_reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MailboxMessagePayload:
     """Raw mailbox message payload prepared for deferred processing."""
 
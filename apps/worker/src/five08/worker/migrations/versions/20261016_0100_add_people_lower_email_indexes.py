@@ -0,0 +1,43 @@
+"""Add lower(email) expression indexes to the people table."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0100"
+down_revision = "20260321_0100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index lower-cased emails used by admin SSO person resolution."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_people_lower_email_508",
+            "people",
+            [sa.text("lower(email_508)")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_people_lower_email",
+            "people",
+            [sa.text("lower(email)")],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop lower(email) expression indexes from the people table."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_people_lower_email",
+            table_name="people",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_people_lower_email_508",
+            table_name="people",
+            postgresql_concurrently=True,
+        )
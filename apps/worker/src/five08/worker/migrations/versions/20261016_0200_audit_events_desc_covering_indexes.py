@@ -0,0 +1,74 @@
+"""Replace audit_events time indexes with descending covering indexes."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0200"
+down_revision = "20261016_0100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Serve newest-first dashboard reads with index-only backward scans."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_audit_events_occurred_at_desc",
+            "audit_events",
+            [sa.text("occurred_at DESC")],
+            postgresql_include=[
+                "source",
+                "action",
+                "result",
+                "actor_provider",
+                "actor_subject",
+                "person_id",
+            ],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_audit_events_source_action_desc",
+            "audit_events",
+            ["source", "action", sa.text("occurred_at DESC")],
+            postgresql_include=["actor_subject", "result", "person_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_audit_events_occurred_at",
+            table_name="audit_events",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_audit_events_source_action",
+            table_name="audit_events",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the plain ascending audit_events time indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_audit_events_occurred_at",
+            "audit_events",
+            ["occurred_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_audit_events_source_action",
+            "audit_events",
+            ["source", "action", "occurred_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_audit_events_source_action_desc",
+            table_name="audit_events",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_audit_events_occurred_at_desc",
+            table_name="audit_events",
+            postgresql_concurrently=True,
+        )
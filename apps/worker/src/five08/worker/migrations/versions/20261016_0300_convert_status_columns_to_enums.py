@@ -0,0 +1,90 @@
+"""Convert low-cardinality audit/people text columns to native enums."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20261016_0300"
+down_revision = "20261016_0200"
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, allowed values, check constraint, server default)
+_ENUM_COLUMNS: tuple[tuple[str, str, str, tuple[str, ...], str, str | None], ...] = (
+    (
+        "audit_events",
+        "source",
+        "audit_source",
+        ("discord", "admin_dashboard"),
+        "ck_audit_events_source",
+        None,
+    ),
+    (
+        "audit_events",
+        "result",
+        "audit_result",
+        ("success", "denied", "error"),
+        "ck_audit_events_result",
+        None,
+    ),
+    (
+        "audit_events",
+        "actor_provider",
+        "actor_provider",
+        ("discord", "admin_sso"),
+        "ck_audit_events_actor_provider",
+        None,
+    ),
+    (
+        "people",
+        "sync_status",
+        "people_sync_status",
+        ("active", "missing_in_crm", "conflict"),
+        "ck_people_sync_status",
+        "active",
+    ),
+)
+
+
+def _quoted_values(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    """Replace TEXT + CHECK columns with enum-typed columns."""
+    for table, column, enum_name, values, check_name, default in _ENUM_COLUMNS:
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({_quoted_values(values)})")
+        op.drop_constraint(check_name, table, type_="check")
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::{enum_name}"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT '{default}'::{enum_name}"
+            )
+
+
+def downgrade() -> None:
+    """Restore TEXT + CHECK columns."""
+    for table, column, enum_name, values, check_name, default in reversed(
+        _ENUM_COLUMNS
+    ):
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TEXT USING {column}::text"
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+            )
+        op.create_check_constraint(
+            check_name,
+            table,
+            f"{column} IN ({_quoted_values(values)})",
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
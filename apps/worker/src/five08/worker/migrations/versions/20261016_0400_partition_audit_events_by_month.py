@@ -0,0 +1,227 @@
+"""Partition audit_events by month on occurred_at."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0400"
+down_revision = "20261016_0300"
+branch_labels = None
+depends_on = None
+
+_AUDIT_EVENT_COLUMNS = """
+    id,
+    occurred_at,
+    source,
+    action,
+    resource_type,
+    resource_id,
+    result,
+    actor_provider,
+    actor_subject,
+    actor_display_name,
+    person_id,
+    correlation_id,
+    metadata,
+    created_at,
+    updated_at
+"""
+
+
+def _create_audit_events_table(*, partitioned: bool) -> None:
+    primary_key = (
+        "CONSTRAINT pk_audit_events PRIMARY KEY (occurred_at, id)"
+        if partitioned
+        else "CONSTRAINT audit_events_pkey PRIMARY KEY (id)"
+    )
+    partition_clause = "PARTITION BY RANGE (occurred_at)" if partitioned else ""
+    op.execute(
+        f"""
+        CREATE TABLE audit_events (
+            id UUID NOT NULL,
+            occurred_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            source audit_source NOT NULL,
+            action TEXT NOT NULL,
+            resource_type TEXT,
+            resource_id TEXT,
+            result audit_result NOT NULL,
+            actor_provider actor_provider NOT NULL,
+            actor_subject TEXT NOT NULL,
+            actor_display_name TEXT,
+            person_id UUID REFERENCES people (id) ON DELETE SET NULL,
+            correlation_id TEXT,
+            metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            {primary_key}
+        ) {partition_clause}
+        """
+    )
+
+
+def _create_audit_events_indexes() -> None:
+    op.create_index(
+        "idx_audit_events_occurred_at_desc",
+        "audit_events",
+        [sa.text("occurred_at DESC")],
+        postgresql_include=[
+            "source",
+            "action",
+            "result",
+            "actor_provider",
+            "actor_subject",
+            "person_id",
+        ],
+    )
+    op.create_index(
+        "idx_audit_events_source_action_desc",
+        "audit_events",
+        ["source", "action", sa.text("occurred_at DESC")],
+        postgresql_include=["actor_subject", "result", "person_id"],
+    )
+    op.create_index(
+        "idx_audit_events_actor_lookup",
+        "audit_events",
+        ["actor_provider", "actor_subject", "occurred_at"],
+    )
+    op.create_index("idx_audit_events_person_id", "audit_events", ["person_id"])
+
+
+def _create_audit_events_updated_at_trigger() -> None:
+    op.execute(
+        """
+        CREATE TRIGGER audit_events_set_updated_at_tr
+        BEFORE UPDATE ON audit_events
+        FOR EACH ROW
+        EXECUTE FUNCTION audit_events_set_updated_at_fn();
+        """
+    )
+
+
+def upgrade() -> None:
+    """Rebuild audit_events as a monthly range-partitioned table."""
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_legacy")
+    _create_audit_events_table(partitioned=True)
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+    # Called for every partition audit_events_ensure_partition creates; later
+    # migrations replace the body to add per-partition setup.
+    op.execute(
+        """
+        CREATE FUNCTION audit_events_init_partition(partition_name TEXT)
+        RETURNS VOID AS $$
+        BEGIN
+            RETURN;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION audit_events_ensure_partition(month_start DATE)
+        RETURNS VOID AS $$
+        DECLARE
+            partition_name TEXT := 'audit_events_' || to_char(month_start, 'YYYY_MM');
+            range_start TIMESTAMPTZ :=
+                date_trunc('month', month_start::timestamp) AT TIME ZONE 'UTC';
+            range_end TIMESTAMPTZ :=
+                (date_trunc('month', month_start::timestamp) + INTERVAL '1 month')
+                AT TIME ZONE 'UTC';
+        BEGIN
+            -- Every API replica runs partition maintenance; serialize it so
+            -- concurrent callers never race on the same CREATE/DETACH.
+            PERFORM pg_advisory_xact_lock(hashtext('audit_events_ensure_partition'));
+
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            IF NOT EXISTS (
+                SELECT 1
+                FROM audit_events_default
+                WHERE occurred_at >= range_start AND occurred_at < range_end
+            ) THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_events '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    range_start,
+                    range_end
+                );
+                PERFORM audit_events_init_partition(partition_name);
+                RETURN;
+            END IF;
+
+            -- Rows for this month already landed in the default partition, so
+            -- creating the month directly would violate the default's implicit
+            -- constraint. Swap in an empty default, create the month, then
+            -- re-route the old default's rows through the parent. Rows are
+            -- never deleted, so this also works once partitions reject DELETE.
+            ALTER TABLE audit_events DETACH PARTITION audit_events_default;
+            ALTER TABLE audit_events_default RENAME TO audit_events_default_old;
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF audit_events '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                range_start,
+                range_end
+            );
+            PERFORM audit_events_init_partition(partition_name);
+            CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT;
+            PERFORM audit_events_init_partition('audit_events_default');
+            INSERT INTO audit_events SELECT * FROM audit_events_default_old;
+            DROP TABLE audit_events_default_old;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        SELECT audit_events_ensure_partition(month_start::date)
+        FROM (
+            SELECT DISTINCT date_trunc('month', occurred_at AT TIME ZONE 'UTC')
+            FROM audit_events_legacy
+            UNION
+            SELECT generate_series(
+                date_trunc('month', NOW() AT TIME ZONE 'UTC'),
+                date_trunc('month', NOW() AT TIME ZONE 'UTC') + INTERVAL '6 months',
+                INTERVAL '1 month'
+            )
+        ) AS months (month_start)
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO audit_events ({_AUDIT_EVENT_COLUMNS})
+        SELECT {_AUDIT_EVENT_COLUMNS}
+        FROM audit_events_legacy
+        """
+    )
+    op.execute("DROP TABLE audit_events_legacy")
+    _create_audit_events_indexes()
+    _create_audit_events_updated_at_trigger()
+
+
+def downgrade() -> None:
+    """Collapse monthly partitions back into a single audit_events table."""
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_partitioned")
+    for index_name in (
+        "idx_audit_events_person_id",
+        "idx_audit_events_actor_lookup",
+        "idx_audit_events_source_action_desc",
+        "idx_audit_events_occurred_at_desc",
+    ):
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    _create_audit_events_table(partitioned=False)
+    op.execute(
+        f"""
+        INSERT INTO audit_events ({_AUDIT_EVENT_COLUMNS})
+        SELECT {_AUDIT_EVENT_COLUMNS}
+        FROM audit_events_partitioned
+        """
+    )
+    op.execute("DROP TABLE audit_events_partitioned CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS audit_events_ensure_partition(DATE)")
+    op.execute("DROP FUNCTION IF EXISTS audit_events_init_partition(TEXT)")
+    _create_audit_events_indexes()
+    _create_audit_events_updated_at_trigger()
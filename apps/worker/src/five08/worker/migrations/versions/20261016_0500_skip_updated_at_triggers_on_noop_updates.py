@@ -0,0 +1,43 @@
+"""Skip updated_at triggers when an UPDATE leaves the row unchanged."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20261016_0500"
+down_revision = "20261016_0400"
+branch_labels = None
+depends_on = None
+
+_UPDATED_AT_TABLES = (
+    "people",
+    "audit_events",
+    "resume_processing_runs",
+    "discord_members",
+)
+
+
+def _recreate_trigger(table: str, *, when_changed: bool) -> None:
+    when_clause = "WHEN (OLD.* IS DISTINCT FROM NEW.*)" if when_changed else ""
+    op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at_tr ON {table}")
+    op.execute(
+        f"""
+        CREATE TRIGGER {table}_set_updated_at_tr
+        BEFORE UPDATE ON {table}
+        FOR EACH ROW
+        {when_clause}
+        EXECUTE FUNCTION {table}_set_updated_at_fn();
+        """
+    )
+
+
+def upgrade() -> None:
+    """Only bump updated_at when at least one column value changed."""
+    for table in _UPDATED_AT_TABLES:
+        _recreate_trigger(table, when_changed=True)
+
+
+def downgrade() -> None:
+    """Fire updated_at triggers on every UPDATE again."""
+    for table in _UPDATED_AT_TABLES:
+        _recreate_trigger(table, when_changed=False)
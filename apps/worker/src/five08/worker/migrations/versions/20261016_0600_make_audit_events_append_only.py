@@ -0,0 +1,149 @@
+"""Make audit_events append-only."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0600"
+down_revision = "20261016_0500"
+branch_labels = None
+depends_on = None
+
+_AUDIT_EVENT_PARTITIONS = """
+    FROM pg_inherits
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = 'audit_events'::regclass
+"""
+
+
+def upgrade() -> None:
+    """Drop updated_at bookkeeping and reject direct UPDATE/DELETE/TRUNCATE."""
+    op.execute("DROP TRIGGER IF EXISTS audit_events_set_updated_at_tr ON audit_events")
+    op.execute("DROP FUNCTION IF EXISTS audit_events_set_updated_at_fn()")
+    op.drop_column("audit_events", "updated_at")
+
+    # Nested statements (trigger depth > 1) are let through so the
+    # person_id ON DELETE SET NULL foreign key action keeps working.
+    op.execute(
+        """
+        CREATE FUNCTION audit_events_reject_mutation_fn()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF pg_trigger_depth() > 1 THEN
+                RETURN NULL;
+            END IF;
+            RAISE EXCEPTION 'audit_events is append-only (% rejected)', TG_OP;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER audit_events_reject_mutation_tr
+        BEFORE UPDATE OR DELETE OR TRUNCATE ON audit_events
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION audit_events_reject_mutation_fn();
+        """
+    )
+    # The app connects as the role that owns audit_events. UPDATE stays granted
+    # because the person_id ON DELETE SET NULL action runs as the owner and
+    # needs it; the trigger above still rejects direct UPDATEs.
+    op.execute("REVOKE DELETE, TRUNCATE ON audit_events FROM PUBLIC, CURRENT_USER")
+
+    # Statement triggers and grants are not inherited by partitions, so repeat
+    # both on every partition, including ones audit_events_ensure_partition
+    # creates later.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_events_init_partition(partition_name TEXT)
+        RETURNS VOID AS $$
+        BEGIN
+            EXECUTE format(
+                'CREATE TRIGGER audit_events_reject_mutation_tr '
+                'BEFORE UPDATE OR DELETE OR TRUNCATE ON %I '
+                'FOR EACH STATEMENT '
+                'EXECUTE FUNCTION audit_events_reject_mutation_fn()',
+                partition_name
+            );
+            EXECUTE format(
+                'REVOKE DELETE, TRUNCATE ON %I FROM PUBLIC, CURRENT_USER',
+                partition_name
+            );
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        SELECT audit_events_init_partition(child.relname)
+        {_AUDIT_EVENT_PARTITIONS}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Allow audit_events mutation again and restore updated_at."""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            partition_name TEXT;
+        BEGIN
+            FOR partition_name IN SELECT child.relname {_AUDIT_EVENT_PARTITIONS}
+            LOOP
+                EXECUTE format(
+                    'DROP TRIGGER IF EXISTS audit_events_reject_mutation_tr ON %I',
+                    partition_name
+                );
+                EXECUTE format(
+                    'GRANT DELETE, TRUNCATE ON %I TO CURRENT_USER',
+                    partition_name
+                );
+            END LOOP;
+        END;
+        $$;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit_events_init_partition(partition_name TEXT)
+        RETURNS VOID AS $$
+        BEGIN
+            RETURN;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute("GRANT DELETE, TRUNCATE ON audit_events TO CURRENT_USER")
+    op.execute("DROP TRIGGER IF EXISTS audit_events_reject_mutation_tr ON audit_events")
+    op.execute("DROP FUNCTION IF EXISTS audit_events_reject_mutation_fn()")
+    op.add_column(
+        "audit_events",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+    op.execute(
+        """
+        CREATE FUNCTION audit_events_set_updated_at_fn()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER audit_events_set_updated_at_tr
+        BEFORE UPDATE ON audit_events
+        FOR EACH ROW
+        WHEN (OLD.* IS DISTINCT FROM NEW.*)
+        EXECUTE FUNCTION audit_events_set_updated_at_fn();
+        """
+    )
@@ -0,0 +1,61 @@
+"""Tune resume_processing_runs indexes for latest-run lookups."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_0700"
+down_revision = "20261016_0600"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a covering latest-run index and move processed_at to BRIN."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_resume_runs_lookup",
+            "resume_processing_runs",
+            ["contact_id", "attachment_id", sa.text("processed_at DESC")],
+            postgresql_include=[
+                "status",
+                "content_hash",
+                "extractor_version",
+                "model_name",
+            ],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_resume_processing_runs_processed_at_brin",
+            "resume_processing_runs",
+            ["processed_at"],
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_resume_processing_runs_processed_at",
+            table_name="resume_processing_runs",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the btree processed_at index and drop the lookup index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_resume_processing_runs_processed_at",
+            "resume_processing_runs",
+            ["processed_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_resume_processing_runs_processed_at_brin",
+            table_name="resume_processing_runs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_resume_runs_lookup",
+            table_name="resume_processing_runs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,28 @@
+"""Add a BRIN index on audit_events.occurred_at."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20261016_0800"
+down_revision = "20261016_0700"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index append-ordered audit time ranges with a per-partition BRIN."""
+    # Partitioned parents cannot build indexes concurrently; each monthly
+    # partition gets its own small BRIN index.
+    op.create_index(
+        "idx_audit_events_occurred_at_brin",
+        "audit_events",
+        ["occurred_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Drop the audit_events occurred_at BRIN index."""
+    op.drop_index("idx_audit_events_occurred_at_brin", table_name="audit_events")
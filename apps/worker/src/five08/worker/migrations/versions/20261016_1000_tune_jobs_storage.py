@@ -0,0 +1,36 @@
+"""Tune jobs table storage for frequent in-place status updates."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20261016_1000"
+down_revision = "20261016_0800"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Leave page headroom for status updates and vacuum jobs more eagerly."""
+    op.execute(
+        """
+        ALTER TABLE jobs SET (
+            fillfactor = 80,
+            autovacuum_vacuum_scale_factor = 0.02,
+            autovacuum_analyze_scale_factor = 0.01
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore default jobs storage parameters."""
+    op.execute(
+        """
+        ALTER TABLE jobs RESET (
+            fillfactor,
+            autovacuum_vacuum_scale_factor,
+            autovacuum_analyze_scale_factor
+        )
+        """
+    )
@@ -15,7 +15,15 @@ from five08.resume_processing_models import (
     ResumeSkipReason as SharedResumeSkipReason,
     SkillAttributes as SharedSkillAttributes,
 )
-from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 ExtractedSkills = SharedExtractedSkills
 ResumeApplyResult = SharedResumeApplyResult
@@ -29,20 +37,26 @@ ResumeExtractedProfile = SharedResumeExtractedProfile
 class WebhookEvent(BaseModel):
     """Single webhook event from EspoCRM."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Record ID")
     name: str | None = Field(None, description="Record name")
 
 
+_WEBHOOK_EVENTS_ADAPTER = TypeAdapter(list[WebhookEvent])
+
+
 class EspoCRMWebhookPayload(BaseModel):
     """Webhook payload wrapper."""
 
+    model_config = ConfigDict(frozen=True)
+
     events: list[WebhookEvent] = Field(..., description="List of webhook events")
 
     @classmethod
     def from_list(cls, data: list[Any]) -> "EspoCRMWebhookPayload":
         """Build payload model from raw webhook list."""
-        events = [WebhookEvent.model_validate(event) for event in data]
-        return cls(events=events)
+        return cls(events=_WEBHOOK_EVENTS_ADAPTER.validate_python(data))
 
 
 class ContactData(BaseModel):
@@ -71,9 +85,13 @@ class SkillsExtractionResult(BaseModel):
 class DocusealSubmitter(BaseModel):
     """Single submitter entry from a Docuseal webhook payload."""
 
+    model_config = ConfigDict(frozen=True)
+
     class Template(BaseModel):
         """Template metadata attached to a Docuseal submitter."""
 
+        model_config = ConfigDict(frozen=True)
+
         id: int | None = None
 
     id: int
@@ -89,6 +107,8 @@ class DocusealSubmitter(BaseModel):
 class DocusealWebhookPayload(BaseModel):
     """Docuseal form.completed webhook payload."""
 
+    model_config = ConfigDict(frozen=True)
+
     event_type: str
     timestamp: str
     data: DocusealSubmitter
@@ -463,6 +483,8 @@ class GoogleFormsIntakePayload(BaseModel):
 class AuditEventPayload(BaseModel):
     """Inbound payload for creating a human audit event."""
 
+    model_config = ConfigDict(frozen=True)
+
     source: Literal["discord", "admin_dashboard"]
     action: str = Field(..., min_length=1)
     result: Literal["success", "denied", "error"] = "success"
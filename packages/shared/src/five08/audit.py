@@ -158,7 +158,7 @@ def upsert_person(settings: SharedSettings, person: PersonRecord) -> str:
             %s, %s, %s, %s, %s,
             %s, %s, %s, %s, %s,
             %s, %s, %s, %s, %s,
-            %s, %s
+            %s, %s::people_sync_status
         )
         ON CONFLICT (crm_contact_id) DO UPDATE
         SET
@@ -182,6 +182,49 @@ def upsert_person(settings: SharedSettings, person: PersonRecord) -> str:
             latest_resume_id = EXCLUDED.latest_resume_id,
             latest_resume_name = EXCLUDED.latest_resume_name,
             sync_status = EXCLUDED.sync_status
+        WHERE (
+            people.name,
+            people.email,
+            people.email_508,
+            people.discord_user_id,
+            people.discord_username,
+            people.discord_roles,
+            people.github_username,
+            people.contact_type,
+            people.is_member,
+            people.address_country,
+            people.address_city,
+            people.address_state,
+            people.timezone,
+            people.seniority,
+            people.linkedin,
+            people.skills,
+            people.skill_attrs,
+            people.latest_resume_id,
+            people.latest_resume_name,
+            people.sync_status
+        ) IS DISTINCT FROM (
+            EXCLUDED.name,
+            EXCLUDED.email,
+            EXCLUDED.email_508,
+            EXCLUDED.discord_user_id,
+            EXCLUDED.discord_username,
+            EXCLUDED.discord_roles,
+            EXCLUDED.github_username,
+            EXCLUDED.contact_type,
+            EXCLUDED.is_member,
+            EXCLUDED.address_country,
+            EXCLUDED.address_city,
+            EXCLUDED.address_state,
+            EXCLUDED.timezone,
+            EXCLUDED.seniority,
+            EXCLUDED.linkedin,
+            EXCLUDED.skills,
+            EXCLUDED.skill_attrs,
+            EXCLUDED.latest_resume_id,
+            EXCLUDED.latest_resume_name,
+            EXCLUDED.sync_status
+        )
         RETURNING id::text;
     """
     roles = person.discord_roles or []
@@ -216,8 +259,16 @@ def upsert_person(settings: SharedSettings, person: PersonRecord) -> str:
                     _normalize_text(person.latest_resume_name),
                     person.sync_status.value,
                 ),
+                prepare=True,
             )
             row = cursor.fetchone()
+            if row is None:
+                # Unchanged rows skip the UPDATE, so RETURNING yields nothing.
+                cursor.execute(
+                    "SELECT id::text FROM people WHERE crm_contact_id = %s;",
+                    (person.crm_contact_id,),
+                )
+                row = cursor.fetchone()
 
     if row is None:
         raise RuntimeError("Failed to upsert person record")
@@ -294,8 +345,20 @@ def resolve_person_id(
     actor_subject: str,
 ) -> str | None:
     """Resolve a person id from audit actor provider + subject."""
-    normalized_subject = normalize_actor_subject(actor_provider, actor_subject)
+    return _resolve_person_id_normalized(
+        settings,
+        actor_provider=actor_provider,
+        normalized_subject=normalize_actor_subject(actor_provider, actor_subject),
+    )
+
 
+def _resolve_person_id_normalized(
+    settings: SharedSettings,
+    *,
+    actor_provider: ActorProvider,
+    normalized_subject: str,
+) -> str | None:
+    """Resolve a person id from a subject already passed through normalization."""
     if actor_provider == ActorProvider.DISCORD:
         query = """
             SELECT id::text
@@ -305,17 +368,29 @@ def resolve_person_id(
         """
         params: tuple[str, ...] = (normalized_subject,)
     else:
+        # Two bounded index lookups instead of an OR across columns, which
+        # the planner would otherwise turn into a BitmapOr + recheck.
         query = """
-            SELECT id::text
-            FROM people
-            WHERE lower(email_508) = %s OR lower(email) = %s
+            (
+                SELECT id::text
+                FROM people
+                WHERE lower(email_508) = %s
+                LIMIT 1
+            )
+            UNION ALL
+            (
+                SELECT id::text
+                FROM people
+                WHERE lower(email) = %s
+                LIMIT 1
+            )
             LIMIT 1;
         """
         params = (normalized_subject, normalized_subject)
 
     with get_postgres_connection(settings) as conn:
         with conn.cursor(row_factory=dict_row) as cursor:
-            cursor.execute(query, params)
+            cursor.execute(query, params, prepare=True)
             row = cursor.fetchone()
 
     if row is None:
@@ -368,6 +443,26 @@ def get_discord_user_id_for_contact(
     return legacy_match.group(1).strip() or None
 
 
+def ensure_audit_event_partitions(
+    settings: SharedSettings,
+    *,
+    months_ahead: int = 6,
+) -> None:
+    """Create monthly audit_events partitions for now through months_ahead."""
+    query = """
+        SELECT audit_events_ensure_partition(month_start::date)
+        FROM generate_series(
+            date_trunc('month', NOW() AT TIME ZONE 'UTC'),
+            date_trunc('month', NOW() AT TIME ZONE 'UTC')
+                + make_interval(months => %s),
+            INTERVAL '1 month'
+        ) AS month_start;
+    """
+    with get_postgres_connection(settings) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query, (max(0, months_ahead),))
+
+
 def insert_audit_event(
     settings: SharedSettings,
     payload: AuditEventInput,
@@ -378,14 +473,14 @@ def insert_audit_event(
     if occurred_at is None:
         occurred_at = datetime.now(tz=timezone.utc)
 
-    person_id = resolve_person_id(
-        settings,
-        actor_provider=payload.actor_provider,
-        actor_subject=payload.actor_subject,
-    )
     normalized_subject = normalize_actor_subject(
         payload.actor_provider, payload.actor_subject
     )
+    person_id = _resolve_person_id_normalized(
+        settings,
+        actor_provider=payload.actor_provider,
+        normalized_subject=normalized_subject,
+    )
 
     query = """
         INSERT INTO audit_events (
@@ -402,7 +497,10 @@ def insert_audit_event(
             person_id,
             correlation_id,
             metadata
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+        ) VALUES (
+            %s, %s, %s::audit_source, %s, %s, %s, %s::audit_result,
+            %s::actor_provider, %s, %s, %s, %s, %s
+        );
     """
 
     with get_postgres_connection(settings) as conn:
@@ -424,6 +522,7 @@ def insert_audit_event(
                     payload.correlation_id,
                     Jsonb(payload.metadata or {}),
                 ),
+                prepare=True,
             )
 
     return CreatedAuditEvent(id=event_id, person_id=person_id)
@@ -5,15 +5,52 @@ from __future__ import annotations
 from typing import Any
 import logging
 
+import orjson
+
 from .settings import SharedSettings
 
 
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line orjson-encoded JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
 def configure_logging(level: str = "INFO") -> None:
     """Configure process-wide logging in a consistent way."""
-    logging.basicConfig(
-        level=level.upper(),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    # Our records never render thread/process/source location, so skip
+    # collecting them (findCaller's stack walk is the most expensive part of a
+    # record). These flags are process-global: every record from then on,
+    # including ones seen by handlers added later (e.g. Sentry), lacks
+    # thread, process and caller info. We only flip them when we own the root
+    # handler, so a process whose logging is already set up is left alone.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # _srcfile is private to the logging module: setting it to None is the
+    # documented-in-source switch that makes findCaller skip the stack walk.
+    # If a future Python drops it, the assignment is harmless.
+    logging._srcfile = None
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    root_logger.addHandler(handler)
+    root_logger.setLevel(level.upper())
 
 
 def configure_observability(
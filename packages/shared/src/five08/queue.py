@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
-from collections.abc import Callable
+import random
+import threading
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Protocol
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from psycopg import Connection, connect
+import orjson
+from psycopg import AsyncConnection, Connection, connect
 from psycopg.rows import dict_row
-from psycopg.types.json import Jsonb
+from psycopg.types.json import Jsonb, set_json_dumps, set_json_loads
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 from redis import Redis
 
 from five08.settings import SharedSettings
@@ -20,6 +26,16 @@ from five08.settings import SharedSettings
 logger = logging.getLogger(__name__)
 
 
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Process-wide JSON/JSONB adaptation for every psycopg connection, including
+# job payloads and audit metadata wrapped in `Jsonb(...)`.
+set_json_dumps(_orjson_dumps)
+set_json_loads(orjson.loads)
+
+
 class JobStatus(StrEnum):
     """Persistent job state values used across queue adapters."""
 
@@ -31,7 +47,7 @@ class JobStatus(StrEnum):
     CANCELED = "canceled"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     """Row-shape view of a persisted job."""
 
@@ -50,7 +66,7 @@ class JobRecord:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnqueuedJob:
     """Result for `enqueue_job` calls."""
 
@@ -58,6 +74,37 @@ class EnqueuedJob:
     created: bool
 
 
+@dataclass(frozen=True, slots=True)
+class JobSpec:
+    """Input row for bulk job creation."""
+
+    job_type: str
+    payload: dict[str, Any]
+    idempotency_key: str | None = None
+    max_attempts: int | None = None
+    run_after: datetime | None = None
+
+    @classmethod
+    def for_call(
+        cls,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        *,
+        kwargs: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        max_attempts: int | None = None,
+        run_after: datetime | None = None,
+    ) -> JobSpec:
+        """Build a spec with the same payload shape as `enqueue_job`."""
+        return cls(
+            job_type=fn.__name__,
+            payload={"args": list(args), "kwargs": kwargs or {}},
+            idempotency_key=idempotency_key,
+            max_attempts=max_attempts,
+            run_after=run_after,
+        )
+
+
 class QueueClient(Protocol):
     """Small framework-agnostic delivery interface."""
 
@@ -65,17 +112,177 @@ class QueueClient(Protocol):
         """Schedule job_id with optional delivery time."""
 
 
-def get_redis_connection(settings: SharedSettings) -> Redis:
-    """Create a Redis connection from shared settings."""
+@lru_cache(maxsize=8)
+def _cached_redis_client(
+    redis_url: str,
+    socket_connect_timeout: float | None,
+    socket_timeout: float | None,
+) -> Redis:
     return Redis.from_url(
+        redis_url,
+        socket_connect_timeout=socket_connect_timeout,
+        socket_timeout=socket_timeout,
+        health_check_interval=30,
+        retry_on_timeout=True,
+    )
+
+
+def get_redis_connection(settings: SharedSettings) -> Redis:
+    """Return the process-wide Redis client for these connection settings.
+
+    Clients are cached per URL/timeout combination so callers share one
+    connection pool; tests can reset it with `_cached_redis_client.cache_clear()`.
+    """
+    return _cached_redis_client(
         settings.redis_url,
-        socket_connect_timeout=settings.redis_socket_connect_timeout,
-        socket_timeout=settings.redis_socket_timeout,
+        settings.redis_socket_connect_timeout,
+        settings.redis_socket_timeout,
+    )
+
+
+_JOB_LOCK_KEY_PREFIX = "lock"
+
+# Compare-and-delete / compare-and-extend so a worker never touches a lock it
+# no longer owns (e.g. after its TTL lapsed and another worker took over).
+_RELEASE_JOB_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+_RENEW_JOB_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _job_lock_key(settings: SharedSettings, job_id: str) -> str:
+    return f"{settings.redis_key_prefix}:{_JOB_LOCK_KEY_PREFIX}:{job_id}"
+
+
+def try_acquire_job_lock(
+    redis: Redis, settings: SharedSettings, job_id: str, *, worker_name: str
+) -> str | None:
+    """Take the short-lived execution lock for `job_id`; return its token."""
+    token = f"{worker_name}:{uuid4().hex}"
+    acquired = redis.set(
+        _job_lock_key(settings, job_id),
+        token,
+        nx=True,
+        px=settings.effective_job_lock_ttl_ms,
     )
+    return token if acquired else None
 
 
-def get_postgres_connection(settings: SharedSettings) -> Connection:
-    """Create a PostgreSQL connection from shared settings."""
+def renew_job_lock(
+    redis: Redis, settings: SharedSettings, job_id: str, token: str
+) -> bool:
+    """Extend a held job lock by another TTL; false when it was lost."""
+    renewed = redis.eval(
+        _RENEW_JOB_LOCK_SCRIPT,
+        1,
+        _job_lock_key(settings, job_id),
+        token,
+        settings.effective_job_lock_ttl_ms,
+    )
+    return bool(renewed)
+
+
+def release_job_lock(
+    redis: Redis, settings: SharedSettings, job_id: str, token: str
+) -> None:
+    """Drop a held job lock if this token still owns it."""
+    redis.eval(_RELEASE_JOB_LOCK_SCRIPT, 1, _job_lock_key(settings, job_id), token)
+
+
+_POOLS: dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_postgres_pool(settings: SharedSettings) -> ConnectionPool:
+    """Return the process-wide connection pool for `settings.postgres_url`."""
+    pool = _POOLS.get(settings.postgres_url)
+    if pool is not None:
+        return pool
+    with _POOLS_LOCK:
+        pool = _POOLS.get(settings.postgres_url)
+        if pool is None:
+            pool = ConnectionPool(
+                settings.postgres_url,
+                min_size=min(2, settings.db_pool_size),
+                max_size=settings.db_pool_size,
+                timeout=settings.db_pool_timeout,
+                open=True,
+                name="five08",
+            )
+            _POOLS[settings.postgres_url] = pool
+    return pool
+
+
+def close_postgres_pools() -> None:
+    """Close every pool opened by `get_postgres_connection`."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def get_postgres_connection(
+    settings: SharedSettings,
+) -> contextlib.AbstractContextManager[Connection]:
+    """Borrow a pooled PostgreSQL connection for the duration of a `with` block.
+
+    The transaction is committed on a clean exit (rolled back on error) and
+    the connection is returned to the pool instead of being closed.
+    """
+    return _get_postgres_pool(settings).connection()
+
+
+_ASYNC_POOLS: dict[str, AsyncConnectionPool] = {}
+
+
+async def _get_async_postgres_pool(settings: SharedSettings) -> AsyncConnectionPool:
+    """Return the event-loop pool for `settings.postgres_url`, opening it once."""
+    pool = _ASYNC_POOLS.get(settings.postgres_url)
+    if pool is None:
+        pool = AsyncConnectionPool(
+            settings.postgres_url,
+            min_size=min(2, settings.db_pool_size),
+            max_size=settings.db_pool_size,
+            timeout=settings.db_pool_timeout,
+            open=False,
+            name="five08-async",
+        )
+        _ASYNC_POOLS[settings.postgres_url] = pool
+    if pool.closed:
+        # `open()` is idempotent, so concurrent first callers are safe here.
+        await pool.open()
+    return pool
+
+
+@contextlib.asynccontextmanager
+async def get_async_postgres_connection(
+    settings: SharedSettings,
+) -> AsyncIterator[AsyncConnection]:
+    """Async counterpart of `get_postgres_connection` for event-loop callers."""
+    pool = await _get_async_postgres_pool(settings)
+    async with pool.connection() as conn:
+        yield conn
+
+
+async def close_async_postgres_pools() -> None:
+    """Close every pool opened by `get_async_postgres_connection`."""
+    pools = list(_ASYNC_POOLS.values())
+    _ASYNC_POOLS.clear()
+    for pool in pools:
+        await pool.close()
+
+
+def open_postgres_connection(settings: SharedSettings) -> Connection:
+    """Open a dedicated, unpooled PostgreSQL connection owned by the caller."""
     return connect(settings.postgres_url)
 
 
@@ -96,13 +303,16 @@ def parse_queue_names(raw_queue_names: str) -> list[str]:
     return [name for name in names if name]
 
 
+_STATUS_BY_VALUE: dict[str, JobStatus] = {status.value: status for status in JobStatus}
+
+
 def _parse_status(value: str) -> JobStatus:
     """Cast DB status text into `JobStatus`."""
-    try:
-        return JobStatus(value)
-    except ValueError:
+    status = _STATUS_BY_VALUE.get(value)
+    if status is None:
         logger.warning("Unknown job status from DB: %s", value)
         return JobStatus.FAILED
+    return status
 
 
 _UNSET = object()
@@ -111,22 +321,33 @@ _UNSET = object()
 def _as_record(row: dict[str, Any]) -> JobRecord:
     """Build a typed job record from a DB row."""
     return JobRecord(
-        id=str(row["id"]),
-        type=row["type"],
-        status=_parse_status(row["status"]),
-        payload=row["payload"] or {},
-        idempotency_key=row["idempotency_key"],
-        attempts=row["attempts"],
-        max_attempts=row["max_attempts"],
-        run_after=row["run_after"],
-        locked_at=row["locked_at"],
-        locked_by=row["locked_by"],
-        last_error=row["last_error"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        str(row["id"]),
+        row["type"],
+        _parse_status(row["status"]),
+        row["payload"] or {},
+        row["idempotency_key"],
+        row["attempts"],
+        row["max_attempts"],
+        row["run_after"],
+        row["locked_at"],
+        row["locked_by"],
+        row["last_error"],
+        row["created_at"],
+        row["updated_at"],
     )
 
 
+_FETCH_BATCH_SIZE = 1000
+
+
+def _fetch_records(cursor: Any) -> list[JobRecord]:
+    """Materialize job records in fixed-size chunks instead of one fetchall."""
+    records: list[JobRecord] = []
+    while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+        records.extend(map(_as_record, rows))
+    return records
+
+
 def create_job_record(
     *,
     settings: SharedSettings,
@@ -137,25 +358,37 @@ def create_job_record(
     run_after: datetime | None = None,
 ) -> tuple[str, bool]:
     """Create or reuse an idempotent job row and return (job_id, was_created)."""
-    job_id = str(uuid4())
+    job_id = uuid4()
     max_attempts = max_attempts or settings.job_max_attempts
+    # Inserted rows come back with created = true; on an idempotency conflict
+    # the second branch returns the existing id in the same round trip without
+    # writing a new row version the way ON CONFLICT DO UPDATE would.
     query = """
-        INSERT INTO jobs (
-            id,
-            type,
-            status,
-            payload,
-            idempotency_key,
-            attempts,
-            max_attempts,
-            run_after
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (idempotency_key) DO NOTHING
-        RETURNING id;
+        WITH inserted AS (
+            INSERT INTO jobs (
+                id,
+                type,
+                status,
+                payload,
+                idempotency_key,
+                attempts,
+                max_attempts,
+                run_after
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (idempotency_key) DO NOTHING
+            RETURNING id
+        )
+        SELECT id, TRUE AS created FROM inserted
+        UNION ALL
+        SELECT id, FALSE AS created
+        FROM jobs
+        WHERE idempotency_key = %s
+          AND NOT EXISTS (SELECT 1 FROM inserted)
+        LIMIT 1;
     """
 
     with get_postgres_connection(settings) as conn:
-        with conn.cursor(row_factory=dict_row) as cursor:
+        with conn.cursor(binary=True, row_factory=dict_row) as cursor:
             cursor.execute(
                 query,
                 (
@@ -167,15 +400,19 @@ def create_job_record(
                     0,
                     max_attempts,
                     run_after,
+                    idempotency_key,
                 ),
+                prepare=True,
             )
             row = cursor.fetchone()
             if row is not None:
-                return str(row["id"]), True
+                return str(row["id"]), bool(row["created"])
 
             if idempotency_key is None:
                 raise RuntimeError("Unable to create job row without idempotency key.")
 
+            # The conflicting row was committed by a concurrent producer after
+            # this statement's snapshot was taken; read it with a fresh one.
             cursor.execute(
                 """
                 SELECT id
@@ -192,17 +429,156 @@ def create_job_record(
     return str(existing["id"]), False
 
 
-def get_job(settings: SharedSettings, job_id: str) -> JobRecord | None:
-    """Load a job by id."""
+def create_job_records_bulk(
+    settings: SharedSettings, jobs: Sequence[JobSpec]
+) -> list[tuple[str, bool]]:
+    """Create or reuse many idempotent job rows in one statement.
+
+    Returns `(job_id, was_created)` pairs in the same order as `jobs`.
+    """
+    if not jobs:
+        return []
+
+    ids = [str(uuid4()) for _ in jobs]
+    query = """
+        INSERT INTO jobs (
+            id,
+            type,
+            status,
+            payload,
+            idempotency_key,
+            attempts,
+            max_attempts,
+            run_after
+        )
+        SELECT id, type, %s, payload, idempotency_key, 0, max_attempts, run_after
+        FROM unnest(
+            %s::uuid[],
+            %s::text[],
+            %s::jsonb[],
+            %s::text[],
+            %s::int[],
+            %s::timestamptz[]
+        ) AS u(id, type, payload, idempotency_key, max_attempts, run_after)
+        ON CONFLICT (idempotency_key) DO NOTHING
+        RETURNING id;
+    """
+
     with get_postgres_connection(settings) as conn:
         with conn.cursor(row_factory=dict_row) as cursor:
-            cursor.execute("SELECT * FROM jobs WHERE id = %s", (job_id,))
+            cursor.execute(
+                query,
+                (
+                    JobStatus.QUEUED,
+                    ids,
+                    [job.job_type for job in jobs],
+                    [Jsonb(job.payload) for job in jobs],
+                    [job.idempotency_key for job in jobs],
+                    [job.max_attempts or settings.job_max_attempts for job in jobs],
+                    [job.run_after for job in jobs],
+                ),
+            )
+            created_ids = {str(row["id"]) for row in cursor.fetchall()}
+
+            missing_keys = [
+                job.idempotency_key
+                for job_id, job in zip(ids, jobs, strict=True)
+                if job_id not in created_ids
+            ]
+            existing_ids: dict[str, str] = {}
+            if missing_keys:
+                if any(key is None for key in missing_keys):
+                    raise RuntimeError(
+                        "Unable to create job row without idempotency key."
+                    )
+                cursor.execute(
+                    """
+                    SELECT id, idempotency_key
+                    FROM jobs
+                    WHERE idempotency_key = ANY(%s)
+                    """,
+                    (missing_keys,),
+                )
+                existing_ids = {
+                    row["idempotency_key"]: str(row["id"]) for row in cursor.fetchall()
+                }
+
+    results: list[tuple[str, bool]] = []
+    for job_id, job in zip(ids, jobs, strict=True):
+        if job_id in created_ids:
+            results.append((job_id, True))
+            continue
+        existing_id = existing_ids.get(job.idempotency_key or "")
+        if existing_id is None:
+            raise RuntimeError(
+                "Unable to load existing job for duplicate idempotency key."
+            )
+        results.append((existing_id, False))
+    return results
+
+
+def get_job(settings: SharedSettings, job_id: str) -> JobRecord | None:
+    """Load a job by id; ids that are not UUIDs cannot exist."""
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError:
+        return None
+    with get_postgres_connection(settings) as conn:
+        with conn.cursor(binary=True, row_factory=dict_row) as cursor:
+            cursor.execute(
+                "SELECT * FROM jobs WHERE id = %s", (job_uuid,), prepare=True
+            )
             row = cursor.fetchone()
             if row is None:
                 return None
             return _as_record(row)
 
 
+async def get_job_async(settings: SharedSettings, job_id: str) -> JobRecord | None:
+    """Load a job by id without blocking the event loop."""
+    try:
+        job_uuid = UUID(job_id)
+    except ValueError:
+        return None
+    async with get_async_postgres_connection(settings) as conn:
+        async with conn.cursor(binary=True, row_factory=dict_row) as cursor:
+            await cursor.execute(
+                "SELECT * FROM jobs WHERE id = %s", (job_uuid,), prepare=True
+            )
+            row = await cursor.fetchone()
+    if row is None:
+        return None
+    return _as_record(row)
+
+
+def _list_jobs_query(
+    *,
+    created_after: datetime,
+    limit: int,
+    status: JobStatus | None,
+    job_type: str | None,
+) -> tuple[str, tuple[Any, ...]]:
+    conditions: list[str] = ["created_at >= %s"]
+    params: list[Any] = [created_after]
+
+    if status is not None:
+        conditions.append("status = %s")
+        params.append(status.value)
+    if job_type is not None:
+        conditions.append("type = %s")
+        params.append(job_type)
+
+    where_clause = " AND ".join(conditions)
+    query = f"""
+        SELECT *
+        FROM jobs
+        WHERE {where_clause}
+        ORDER BY created_at DESC
+        LIMIT %s
+    """
+    return query, (*params, limit)
+
+
 def list_jobs(
     settings: SharedSettings,
     *,
@@ -212,32 +588,58 @@ def list_jobs(
     job_type: str | None = None,
 ) -> list[JobRecord]:
     """Load recent jobs created after the given UTC datetime."""
+    query, params = _list_jobs_query(
+        created_after=created_after, limit=limit, status=status, job_type=job_type
+    )
     with get_postgres_connection(settings) as conn:
         with conn.cursor(row_factory=dict_row) as cursor:
-            conditions: list[str] = ["created_at >= %s"]
-            params: list[Any] = [created_after]
-
-            if status is not None:
-                conditions.append("status = %s")
-                params.append(status.value)
-            if job_type is not None:
-                conditions.append("type = %s")
-                params.append(job_type)
-
-            where_clause = " AND ".join(conditions)
-            query = f"""
-                SELECT *
-                FROM jobs
-                WHERE {where_clause}
-                ORDER BY created_at DESC
-                LIMIT %s
-            """
-            cursor.execute(
-                query,
-                (*params, limit),
-            )
-            rows = cursor.fetchall()
-            return [_as_record(row) for row in rows]
+            cursor.execute(query, params)
+            return _fetch_records(cursor)
+
+
+async def list_jobs_async(
+    settings: SharedSettings,
+    *,
+    created_after: datetime,
+    limit: int,
+    status: JobStatus | None = None,
+    job_type: str | None = None,
+) -> list[JobRecord]:
+    """Async counterpart of `list_jobs` for event-loop callers."""
+    query, params = _list_jobs_query(
+        created_after=created_after, limit=limit, status=status, job_type=job_type
+    )
+    async with get_async_postgres_connection(settings) as conn:
+        async with conn.cursor(row_factory=dict_row) as cursor:
+            await cursor.execute(query, params)
+            rows = await cursor.fetchall()
+    return [_as_record(row) for row in rows]
+
+
+_MARK_JOB_COLUMNS = (
+    "status",
+    "attempts",
+    "payload",
+    "locked_at",
+    "locked_by",
+    "run_after",
+    "last_error",
+)
+_MARK_JOB_SQL_CACHE: dict[tuple[str, ...], str] = {}
+
+
+def _mark_job_sql(shape: tuple[str, ...]) -> str:
+    """Return (and memoize) the UPDATE statement for one set of columns."""
+    query = _MARK_JOB_SQL_CACHE.get(shape)
+    if query is None:
+        assignments = ", ".join(f"{column} = %s" for column in shape)
+        query = f"""
+        UPDATE jobs
+        SET {assignments}, updated_at = NOW()
+        WHERE id = %s;
+    """
+        _MARK_JOB_SQL_CACHE[shape] = query
+    return query
 
 
 def _mark_job(
@@ -252,59 +654,210 @@ def _mark_job(
     run_after: Any = _UNSET,
     last_error: Any = _UNSET,
 ) -> None:
-    updates: list[str] = []
-    params: list[Any] = []
-
-    if status is not None:
-        updates.append("status = %s")
-        params.append(status.value)
-    if attempts is not None:
-        updates.append("attempts = %s")
-        params.append(attempts)
-    if payload is not _UNSET:
-        updates.append("payload = %s")
-        params.append(Jsonb(payload))
-    if locked_at is not _UNSET:
-        updates.append("locked_at = %s")
-        params.append(locked_at)
-    if locked_by is not _UNSET:
-        updates.append("locked_by = %s")
-        params.append(locked_by)
-    if run_after is not _UNSET:
-        updates.append("run_after = %s")
-        params.append(run_after)
-    if last_error is not _UNSET:
-        updates.append("last_error = %s")
-        params.append(last_error)
-    if not updates:
+    values = (
+        _UNSET if status is None else status.value,
+        _UNSET if attempts is None else attempts,
+        payload if payload is _UNSET else Jsonb(payload),
+        locked_at,
+        locked_by,
+        run_after,
+        last_error,
+    )
+    shape = tuple(
+        column
+        for column, value in zip(_MARK_JOB_COLUMNS, values, strict=True)
+        if value is not _UNSET
+    )
+    if not shape:
         return
 
-    updates.append("updated_at = NOW()")
-    params.append(job_id)
+    params = [value for value in values if value is not _UNSET]
+    params.append(UUID(job_id))
+    with get_postgres_connection(settings) as conn:
+        with conn.cursor(binary=True) as cursor:
+            # Only a handful of shapes exist (succeeded/retry/dead), so
+            # each statement is prepared server-side once per pooled connection.
+            cursor.execute(_mark_job_sql(shape), params, prepare=True)
 
-    query = f"""
+
+# RUNNING is claimable because callers hold the job's Redis execution lock: a
+# row still marked running while that lock is free was left by a dead worker.
+_CLAIMABLE_STATUSES = [
+    JobStatus.QUEUED.value,
+    JobStatus.FAILED.value,
+    JobStatus.RUNNING.value,
+]
+
+
+def claim_job(settings: SharedSettings, job_id: str) -> JobRecord | None:
+    """Flip a delivered job to running and return it in one round trip.
+
+    Callers must hold the job's execution lock (`try_acquire_job_lock`); that
+    lock, not Postgres row state, keeps two workers off the same job. Returns
+    `None` when the job is missing or terminal; callers can fall back to
+    `get_job` to tell those cases apart.
+    """
+    query = """
         UPDATE jobs
-        SET {", ".join(updates)}
-        WHERE id = %s;
+        SET status = %s,
+            run_after = NULL,
+            last_error = NULL,
+            updated_at = NOW()
+        WHERE id = %s
+          AND status = ANY(%s)
+        RETURNING *;
     """
     with get_postgres_connection(settings) as conn:
-        with conn.cursor() as cursor:
-            cursor.execute(query, params)
+        with conn.cursor(row_factory=dict_row) as cursor:
+            cursor.execute(
+                query,
+                (JobStatus.RUNNING.value, job_id, _CLAIMABLE_STATUSES),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return _as_record(row)
+
+
+@dataclass(frozen=True, slots=True)
+class JobOutcome:
+    """Pending terminal (or retry) state for one job."""
+
+    job_id: str
+    status: JobStatus
+    attempts: int | None = None
+    payload: dict[str, Any] | None = None
+    run_after: datetime | None = None
+    last_error: str | None = None
 
 
-def mark_job_running(
-    settings: SharedSettings, job_id: str, *, worker_name: str
+def write_job_outcomes(
+    settings: SharedSettings, outcomes: Sequence[JobOutcome]
 ) -> None:
-    """Mark a job as actively executing."""
-    _mark_job(
-        settings,
-        job_id,
-        status=JobStatus.RUNNING,
-        locked_at=datetime.now(tz=timezone.utc),
-        locked_by=worker_name,
-        run_after=None,
-        last_error=None,
-    )
+    """Apply many job outcomes with one `UPDATE ... FROM unnest(...)`."""
+    if not outcomes:
+        return
+    query = """
+        UPDATE jobs
+        SET status = u.status,
+            attempts = COALESCE(u.attempts, jobs.attempts),
+            payload = COALESCE(u.payload, jobs.payload),
+            run_after = u.run_after,
+            last_error = u.last_error,
+            locked_at = NULL,
+            locked_by = NULL,
+            updated_at = NOW()
+        FROM unnest(
+            %s::uuid[],
+            %s::text[],
+            %s::int[],
+            %s::jsonb[],
+            %s::timestamptz[],
+            %s::text[]
+        ) AS u(id, status, attempts, payload, run_after, last_error)
+        WHERE jobs.id = u.id;
+    """
+    with get_postgres_connection(settings) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                query,
+                (
+                    [outcome.job_id for outcome in outcomes],
+                    [outcome.status.value for outcome in outcomes],
+                    [outcome.attempts for outcome in outcomes],
+                    [
+                        None if outcome.payload is None else Jsonb(outcome.payload)
+                        for outcome in outcomes
+                    ],
+                    [outcome.run_after for outcome in outcomes],
+                    [outcome.last_error for outcome in outcomes],
+                ),
+            )
+
+
+class JobOutcomeBuffer:
+    """Coalesce job outcomes in memory and write them in batches.
+
+    Outcomes are flushed when `max_items` are pending, when the oldest pending
+    outcome is `interval_ms` old, or immediately when `flush=True` is passed
+    (used for DEAD transitions). A later outcome for the same job replaces an
+    unflushed earlier one.
+
+    Callers that ack a delivery or release its job lock must `flush()` first;
+    the buffer only coalesces outcomes from jobs finishing concurrently.
+    """
+
+    def __init__(
+        self,
+        settings: SharedSettings,
+        *,
+        max_items: int | None = None,
+        interval_ms: int | None = None,
+    ) -> None:
+        self._settings = settings
+        self._max_items = max(
+            1, max_items if max_items is not None else settings.job_flush_max
+        )
+        interval = (
+            interval_ms if interval_ms is not None else settings.job_flush_interval_ms
+        )
+        self._interval_seconds = max(0, interval) / 1000
+        self._pending: dict[str, JobOutcome] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def add(self, outcome: JobOutcome, *, flush: bool = False) -> None:
+        """Buffer one outcome, flushing if the batch is full or `flush` is set."""
+        with self._lock:
+            self._pending[outcome.job_id] = outcome
+            should_flush = flush or len(self._pending) >= self._max_items
+            if not should_flush and self._timer is None:
+                self._timer = threading.Timer(self._interval_seconds, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every pending outcome now.
+
+        Flushes are serialized, so when this returns any outcome added before
+        the call is committed, even if a concurrent flush picked it up.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                outcomes = list(self._pending.values())
+                self._pending.clear()
+            if not outcomes:
+                return
+            try:
+                write_job_outcomes(self._settings, outcomes)
+            except Exception:
+                with self._lock:
+                    for outcome in outcomes:
+                        self._pending.setdefault(outcome.job_id, outcome)
+                raise
+
+    def close(self) -> None:
+        """Flush remaining outcomes; call on worker shutdown."""
+        self.flush()
+
+    def _on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered job outcomes")
+            with self._lock:
+                if self._pending and self._timer is None:
+                    self._timer = threading.Timer(
+                        self._interval_seconds, self._on_timer
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
 
 
 def mark_job_succeeded(
@@ -313,6 +866,7 @@ def mark_job_succeeded(
     *,
     result: Any | None = None,
     base_payload: dict[str, Any] | None = None,
+    buffer: JobOutcomeBuffer | None = None,
 ) -> None:
     """Mark successful completion."""
     payload: Any = _UNSET
@@ -321,6 +875,16 @@ def mark_job_succeeded(
         merged_payload["result"] = result
         payload = merged_payload
 
+    if buffer is not None:
+        buffer.add(
+            JobOutcome(
+                job_id=job_id,
+                status=JobStatus.SUCCEEDED,
+                payload=None if payload is _UNSET else payload,
+            )
+        )
+        return
+
     _mark_job(
         settings,
         job_id,
@@ -340,6 +904,7 @@ def mark_job_retry(
     attempts: int,
     run_after: datetime,
     last_error: str,
+    buffer: JobOutcomeBuffer | None = None,
 ) -> None:
     """Record a retryable failure using `_mark_job` with `JobStatus.FAILED`.
 
@@ -347,6 +912,18 @@ def mark_job_retry(
     max-attempts threshold. Callers should use this for retry scheduling paths;
     terminal failures should use `mark_job_dead`, which writes `JobStatus.DEAD`.
     """
+    if buffer is not None:
+        buffer.add(
+            JobOutcome(
+                job_id=job_id,
+                status=JobStatus.FAILED,
+                attempts=attempts,
+                run_after=run_after,
+                last_error=last_error,
+            )
+        )
+        return
+
     _mark_job(
         settings,
         job_id,
@@ -365,8 +942,25 @@ def mark_job_dead(
     *,
     attempts: int,
     last_error: str,
+    buffer: JobOutcomeBuffer | None = None,
 ) -> None:
-    """Mark a job as permanently dead."""
+    """Mark a job as permanently dead.
+
+    With a `buffer`, the outcome is written immediately together with any
+    other pending outcomes so DEAD transitions are never held in memory.
+    """
+    if buffer is not None:
+        buffer.add(
+            JobOutcome(
+                job_id=job_id,
+                status=JobStatus.DEAD,
+                attempts=attempts,
+                last_error=last_error,
+            ),
+            flush=True,
+        )
+        return
+
     _mark_job(
         settings,
         job_id,
@@ -379,6 +973,19 @@ def mark_job_dead(
     )
 
 
+def compute_retry_delay(attempts: int, settings: SharedSettings) -> timedelta:
+    """Return a jittered exponential backoff for a failed attempt count.
+
+    The exponential step is scaled by a random factor in [0.5, 1.5] so jobs
+    that failed together do not retry together, then capped at
+    `job_retry_max_seconds`.
+    """
+    base = max(1, settings.job_retry_base_seconds)
+    capped = min(base * (2 ** max(attempts - 1, 0)), settings.job_retry_max_seconds)
+    jittered = capped * random.uniform(0.5, 1.5)
+    return timedelta(seconds=min(jittered, settings.job_retry_max_seconds))
+
+
 def enqueue_job(
     queue: QueueClient,
     fn: Callable[..., Any],
@@ -406,6 +1013,22 @@ def enqueue_job(
     return EnqueuedJob(id=job_id, created=created)
 
 
+def enqueue_jobs(
+    queue: QueueClient,
+    jobs: Sequence[JobSpec],
+    settings: SharedSettings,
+) -> list[EnqueuedJob]:
+    """Bulk variant of `enqueue_job`: one insert, then dispatch new rows."""
+    results: list[EnqueuedJob] = []
+    for job, (job_id, created) in zip(
+        jobs, create_job_records_bulk(settings, jobs), strict=True
+    ):
+        if created:
+            queue.enqueue(job_id, run_at=job.run_after)
+        results.append(EnqueuedJob(id=job_id, created=created))
+    return results
+
+
 def job_is_terminal(status: JobStatus) -> bool:
     """Return true when the job should not be executed again."""
     return status in {JobStatus.SUCCEEDED, JobStatus.DEAD, JobStatus.CANCELED}
@@ -30,10 +30,15 @@ class SharedSettings(BaseSettings):
     redis_socket_connect_timeout: float | None = 5.0
     redis_socket_timeout: float | None = 5.0
     postgres_url: str = "postgresql://postgres@postgres:5432/workflows"
+    db_pool_size: int = 10
+    db_pool_timeout: float = 30.0
     job_max_attempts: int = 8
     job_retry_base_seconds: int = 5
     job_retry_max_seconds: int = 300
     job_timeout_seconds: int = 600
+    job_lock_ttl_ms: int | None = None
+    job_flush_max: int = 50
+    job_flush_interval_ms: int = 200
     job_result_ttl_seconds: int = 3600
     minio_endpoint: str = "http://minio:9000"
     minio_root_user: str = "internal"
@@ -137,6 +142,18 @@ class SharedSettings(BaseSettings):
         """Profiling is disabled until the project explicitly needs it."""
         return 0.0
 
+    @property
+    def sqlalchemy_postgres_url(self) -> str:
+        """`postgres_url` in SQLAlchemy's psycopg dialect form."""
+        return normalize_sqlalchemy_postgres_url(self.postgres_url)
+
+    @property
+    def effective_job_lock_ttl_ms(self) -> int:
+        """Redis job lock TTL; defaults to twice the job timeout."""
+        if self.job_lock_ttl_ms is not None:
+            return self.job_lock_ttl_ms
+        return self.job_timeout_seconds * 1000 * 2
+
     @property
     def minio_access_key(self) -> str:
         """Access key alias for MinIO clients using the old naming."""
@@ -51,6 +51,9 @@ DISALLOWED_RESUME_SKILLS: frozenset[str] = frozenset(
 )
 
 _INLINE_STRENGTH_PATTERN = re.compile(r"^(.*)\(\s*(\d*)\s*\)\s*$")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PUNCTUATION_TO_SPACE = str.maketrans(dict.fromkeys("./_-", " "))
+_EDGE_STRIP_CHARS = " .,_-:/"
 
 
 def normalize_skill(value: str) -> str:
@@ -59,32 +62,83 @@ def normalize_skill(value: str) -> str:
     if not normalized:
         return ""
 
-    normalized = re.sub(r"\s+", " ", normalized).strip(" .,_-:/")
-    if normalized in SKILL_ALIASES:
-        return SKILL_ALIASES[normalized]
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip(_EDGE_STRIP_CHARS)
+    alias = SKILL_ALIASES.get(normalized)
+    if alias is not None:
+        return alias
 
-    punctuation_light = re.sub(r"[./_-]+", " ", normalized)
-    punctuation_light = re.sub(r"\s+", " ", punctuation_light).strip()
-    if punctuation_light in SKILL_ALIASES:
-        return SKILL_ALIASES[punctuation_light]
+    punctuation_light = _WHITESPACE_PATTERN.sub(
+        " ", normalized.translate(_PUNCTUATION_TO_SPACE)
+    ).strip()
+    alias = SKILL_ALIASES.get(punctuation_light)
+    if alias is not None:
+        return alias
 
     return punctuation_light or normalized
 
 
+_TEXT_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+_TRIE_TERMINAL = ""
+
+
+def _tokenize_for_aliases(text: str) -> list[str]:
+    return _TEXT_TOKEN_PATTERN.findall(text.lower().translate(_PUNCTUATION_TO_SPACE))
+
+
+def _build_alias_trie() -> dict[str, Any]:
+    """Build a word-level trie mapping alias token sequences to canonical skills."""
+    root: dict[str, Any] = {}
+    for alias, canonical in SKILL_ALIASES.items():
+        node = root
+        for token in _tokenize_for_aliases(alias):
+            node = node.setdefault(token, {})
+        node[_TRIE_TERMINAL] = canonical
+    return root
+
+
+_ALIAS_TRIE = _build_alias_trie()
+
+
+def extract_skills(text: str) -> list[str]:
+    """Find aliased skills in free text with one left-to-right token scan.
+
+    Overlapping aliases resolve to the longest match (`google analytics 4`
+    wins over a shorter prefix), and results are de-duplicated in first-seen
+    order.
+    """
+    tokens = _tokenize_for_aliases(text)
+    found: dict[str, None] = {}
+    index = 0
+    while index < len(tokens):
+        node = _ALIAS_TRIE
+        match: str | None = None
+        match_end = index
+        cursor = index
+        while cursor < len(tokens):
+            next_node = node.get(tokens[cursor])
+            if next_node is None:
+                break
+            node = next_node
+            cursor += 1
+            if _TRIE_TERMINAL in node:
+                match = node[_TRIE_TERMINAL]
+                match_end = cursor
+        if match is None:
+            index += 1
+            continue
+        found[match] = None
+        index = match_end
+    return list(found)
+
+
 def normalize_skill_list(values: list[str]) -> list[str]:
     """Normalize and de-duplicate skills while preserving first-seen order."""
-    normalized: list[str] = []
-    seen: set[str] = set()
+    by_key: dict[str, str] = {}
     for raw in values:
         skill = normalize_skill(raw)
-        if not skill:
-            continue
-        key = skill.casefold()
-        if key in seen:
-            continue
-        seen.add(key)
-        normalized.append(skill)
-    return normalized
+        if skill:
+            by_key.setdefault(skill.casefold(), skill)
+    return list(by_key.values())
 
 
 def normalize_strength(value: Any) -> int | None:
@@ -2,13 +2,11 @@
 Pytest configuration and shared fixtures for the 508.dev Discord bot tests.
 """
 
-import asyncio
 import os
 import pytest
 from unittest.mock import Mock, AsyncMock
 from discord.ext import commands
 import discord
-from typing import Generator
 
 # Config tests removed - no need to import Settings
 os.environ.setdefault("DISCORD_BOT_TOKEN", "test")
@@ -18,14 +16,6 @@ os.environ.setdefault("KIMAI_BASE_URL", "https://kimai.example.invalid")
 os.environ.setdefault("KIMAI_API_TOKEN", "test")
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def mock_bot() -> Mock:
     """Create a mock Discord bot for testing."""
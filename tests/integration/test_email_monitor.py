@@ -2,15 +2,12 @@
 
 from unittest.mock import patch
 
-import pytest
-
 from five08.discord_bot.cogs.email_monitor import EmailMonitor
 
 
 class TestEmailMonitorIntegration:
     """Integration tests for EmailMonitor compatibility behavior."""
 
-    @pytest.mark.asyncio
     async def test_cog_load_logs_deprecation_notice(self, mock_bot) -> None:
         monitor = EmailMonitor(mock_bot)
 
@@ -19,7 +16,6 @@ class TestEmailMonitorIntegration:
 
         mock_info.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_setup_function_adds_cog(self, mock_bot) -> None:
         from five08.discord_bot.cogs.email_monitor import setup
 
@@ -29,7 +25,6 @@ class TestEmailMonitorIntegration:
         added_cog = mock_bot.add_cog.call_args[0][0]
         assert isinstance(added_cog, EmailMonitor)
 
-    @pytest.mark.asyncio
     async def test_setup_constructs_email_monitor(self, mock_bot) -> None:
         from five08.discord_bot.cogs.email_monitor import setup
 
@@ -28,7 +28,6 @@ def cog() -> AdminLoginCog:
     return AdminLoginCog(Mock())
 
 
-@pytest.mark.asyncio
 async def test_login_command_returns_link(
     cog: AdminLoginCog, mock_interaction: AsyncMock
 ) -> None:
@@ -51,7 +50,6 @@ async def test_login_command_returns_link(
     mock_audit.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_login_command_denied_when_user_not_admin(
     cog: AdminLoginCog, mock_interaction: AsyncMock
 ) -> None:
@@ -69,7 +67,6 @@ async def test_login_command_denied_when_user_not_admin(
     assert "not allowed" in sent_message
 
 
-@pytest.mark.asyncio
 async def test_login_command_handles_missing_secret(
     cog: AdminLoginCog, mock_interaction: AsyncMock
 ) -> None:
@@ -87,7 +84,6 @@ async def test_login_command_handles_missing_secret(
     assert "not configured" in sent_message
 
 
-@pytest.mark.asyncio
 async def test_login_command_uses_configured_admin_roles(
     monkeypatch: pytest.MonkeyPatch,
     cog: AdminLoginCog,
@@ -1,23 +1,52 @@
 """Unit tests for backend dashboard/ingest API."""
 
+import json
 import re
+from collections.abc import AsyncIterator, Iterator, Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, Mock, patch
 
 from five08.backend import api
 from five08.worker.masking import mask_email
 
 
-class _HealthyRedis:
+def _apply_settings(monkeypatch: pytest.MonkeyPatch, **overrides: object) -> None:
+    """Override several API settings for the current test."""
+    for name, value in overrides.items():
+        monkeypatch.setattr(api.settings, name, value)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+class _FakeRedis:
+    __slots__ = ("_ok",)
+
+    def __init__(self, ok: bool) -> None:
+        self._ok = ok
+
     def ping(self) -> bool:
+        if not self._ok:
+            raise RuntimeError("redis unavailable")
         return True
 
 
-class _FailingRedis:
-    def ping(self) -> bool:
-        raise RuntimeError("redis unavailable")
+_HEALTHY_REDIS = _FakeRedis(True)
+_FAILING_REDIS = _FakeRedis(False)
 
 
 class _FakeAuthStore:
@@ -54,157 +83,200 @@ class _FakeAuthStore:
         return None
 
 
+_AUTH_HEADERS = {"X-API-Secret": "test-secret"}
+_JSON_HEADERS = {**_AUTH_HEADERS, "content-type": "application/json"}
+# Request bodies are encoded once; handlers only ever see the serialized bytes.
+_GITHUB_EVENT_BYTES = json.dumps({"id": "evt-1"}).encode()
+_ESPO_BATCH_BYTES = json.dumps([{"id": "c-1"}, {"id": "c-2"}]).encode()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _shared_secret() -> Iterator[None]:
+    """Configure the API secret matching _AUTH_HEADERS for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api.settings, "api_shared_secret", "test-secret")
+        yield
+
+
 @pytest.fixture
-def auth_headers(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
-    """Configure API secret and return matching auth headers."""
-    monkeypatch.setattr(api.settings, "api_shared_secret", "test-secret")
-    return {"X-API-Secret": "test-secret"}
+def auth_patches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[_FakeAuthStore, Mock]:
+    """Route the auth store, admin verifier and HTTP client to shared fakes."""
+    store = _FakeAuthStore()
+    verifier = Mock()
+    http_client = Mock()
+    monkeypatch.setattr(api, "_auth_store_from_app", lambda *_: store)
+    monkeypatch.setattr(api, "_discord_admin_verifier_from_app", lambda *_: verifier)
+    monkeypatch.setattr(api, "_http_client_from_app", lambda *_: http_client)
+    return store, verifier
 
 
 @pytest.fixture
+def mock_enqueue(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the API module's enqueue_job binding for one test."""
+    enqueue = Mock(return_value=SimpleNamespace(id="job-123", created=True))
+    monkeypatch.setattr(api, "enqueue_job", enqueue)
+    return enqueue
+
+
+@pytest.fixture(scope="session")
 def app() -> api.FastAPI:
-    app_obj = api.create_app(run_lifespan=False)
-    app_obj.state.queue = Mock()
-    app_obj.state.redis_conn = _HealthyRedis()
-    return app_obj
+    return api.create_app(run_lifespan=False, openapi_url=None)
+
+
+def _async_client(app: api.FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        follow_redirects=False,
+    )
 
 
 @pytest.fixture
-def client(app: api.FastAPI) -> TestClient:
-    return TestClient(app)
+async def client(app: api.FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    async with _async_client(app) as async_client:
+        yield async_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_app_state(app: api.FastAPI) -> None:
+    """Restore per-test baseline state on the shared app."""
+    app.state.queue = Mock()
+    app.state.redis_conn = _HEALTHY_REDIS
+    app.state.oidc_client = api.OIDCProviderClient(api.settings)
+    app.state.discord_admin_verifier = api.DiscordAdminVerifier(api.settings)
 
 
-def test_health_handler_healthy(client: TestClient) -> None:
+@pytest.fixture(autouse=True)
+def _postgres_healthy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report Postgres as healthy unless a test overrides it."""
+    monkeypatch.setattr(api, "is_postgres_healthy", lambda *_: True)
+
+
+async def test_health_handler_healthy(client: httpx.AsyncClient) -> None:
     """Health endpoint should report healthy when Redis pings."""
-    with patch("five08.backend.api.is_postgres_healthy", return_value=True):
-        response = client.get("/health")
+    response = await client.get("/health")
 
+    assert response.status_code == 200, response.text
     payload = response.json()
-    assert response.status_code == 200
     assert payload["status"] == "healthy"
 
 
-def test_health_handler_degraded(app: api.FastAPI) -> None:
+async def test_health_handler_degraded(app: api.FastAPI) -> None:
     """Health endpoint should report degraded when Redis fails."""
-    app.state.redis_conn = _FailingRedis()
-    client = TestClient(app)
-    with patch("five08.backend.api.is_postgres_healthy", return_value=True):
-        response = client.get("/health")
+    app.state.redis_conn = _FAILING_REDIS
+    async with _async_client(app) as client:
+        response = await client.get("/health")
 
+    assert response.status_code == 503, response.text
     payload = response.json()
-    assert response.status_code == 503
     assert payload["status"] == "degraded"
 
 
-def test_ingest_handler_enqueues_job(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_ingest_handler_enqueues_job(
+    client: httpx.AsyncClient, mock_enqueue: Mock
 ) -> None:
     """Ingest endpoint should enqueue payload and return job metadata."""
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-123")
-        response = client.post(
-            "/webhooks/github",
-            json={"id": "evt-1"},
-            headers=auth_headers,
-        )
+    response = await client.post(
+        "/webhooks/github",
+        content=_GITHUB_EVENT_BYTES,
+        headers=_JSON_HEADERS,
+    )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["job_id"] == "job-123"
     assert payload["source"] == "github"
 
 
-def test_ingest_handler_rejects_non_object_payload(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_ingest_handler_rejects_non_object_payload(
+    client: httpx.AsyncClient,
 ) -> None:
     """Ingest endpoint should reject non-object JSON payloads."""
-    response = client.post(
+    response = await client.post(
         "/webhooks/default",
         json=["not-an-object"],
-        headers=auth_headers,
+        headers=_AUTH_HEADERS,
     )
 
+    assert response.status_code == 400, response.text
     payload = response.json()
-    assert response.status_code == 400
     assert payload["error"] == "payload_must_be_object"
 
 
-def test_espocrm_webhook_handler_enqueues_contact_jobs(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_espocrm_webhook_handler_enqueues_contact_jobs(
+    client: httpx.AsyncClient,
 ) -> None:
     """EspoCRM webhook should enqueue before responding."""
-    with patch("five08.backend.api._enqueue_espocrm_batch", new_callable=AsyncMock):
-        response = client.post(
+    with patch.object(api, "_enqueue_espocrm_batch", new_callable=AsyncMock):
+        response = await client.post(
             "/webhooks/espocrm",
-            json=[{"id": "c-1"}, {"id": "c-2"}],
-            headers=auth_headers,
+            content=_ESPO_BATCH_BYTES,
+            headers=_JSON_HEADERS,
         )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["events_received"] == 2
     assert payload["events_enqueued"] == 2
 
 
-def test_espocrm_webhook_handler_rejects_non_list_payload(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_espocrm_webhook_handler_rejects_non_list_payload(
+    client: httpx.AsyncClient,
 ) -> None:
     """EspoCRM webhook should enforce array payload shape."""
-    response = client.post(
+    response = await client.post(
         "/webhooks/espocrm",
         json={"id": "c-1"},
-        headers=auth_headers,
+        headers=_AUTH_HEADERS,
     )
 
+    assert response.status_code == 400, response.text
     payload = response.json()
-    assert response.status_code == 400
     assert payload["error"] == "payload_must_be_array_of_events"
 
 
-def test_process_contact_handler_enqueues_single_contact(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_process_contact_handler_enqueues_single_contact(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Manual contact endpoint should enqueue one contact job."""
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-123")
-        response = client.post("/process-contact/c-123", headers=auth_headers)
+    response = await client.post("/process-contact/c-123", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["contact_id"] == "c-123"
     assert payload["job_id"] == "job-123"
 
 
-def test_resume_extract_handler_enqueues_job(
+async def test_resume_extract_handler_enqueues_job(
     monkeypatch: pytest.MonkeyPatch,
-    client: TestClient,
-    auth_headers: dict[str, str],
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Resume extract endpoint should enqueue extraction job."""
-    monkeypatch.setattr(api.settings, "resume_extractor_version", "v7")
-    monkeypatch.setattr(api.settings, "openai_api_key", "key")
-    monkeypatch.setattr(api.settings, "openai_base_url", None)
-    monkeypatch.setattr(api.settings, "resume_ai_model", "gpt-test")
-
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-extract", created=True)
-        response = client.post(
-            "/jobs/resume-extract",
-            json={
-                "contact_id": "c-1",
-                "attachment_id": "a-1",
-                "filename": "resume.pdf",
-            },
-            headers=auth_headers,
-        )
+    _apply_settings(
+        monkeypatch,
+        resume_extractor_version="v7",
+        openai_api_key="key",
+        openai_base_url=None,
+        resume_ai_model="gpt-test",
+    )
 
+    mock_enqueue.return_value = SimpleNamespace(id="job-extract", created=True)
+    response = await client.post(
+        "/jobs/resume-extract",
+        json={
+            "contact_id": "c-1",
+            "attachment_id": "a-1",
+            "filename": "resume.pdf",
+        },
+        headers=_AUTH_HEADERS,
+    )
+
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["job_id"] == "job-extract"
     assert payload["contact_id"] == "c-1"
     assert payload["attachment_id"] == "a-1"
@@ -212,32 +284,34 @@ def test_resume_extract_handler_enqueues_job(
     assert call_kwargs["idempotency_key"] == "resume-extract:c-1:a-1:v7:gpt-test"
 
 
-def test_resume_extract_handler_appends_refresh_token_to_idempotency_key(
+async def test_resume_extract_handler_appends_refresh_token_to_idempotency_key(
     monkeypatch: pytest.MonkeyPatch,
-    client: TestClient,
-    auth_headers: dict[str, str],
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Explicit refresh tokens should force a new resume extract job key."""
-    monkeypatch.setattr(api.settings, "resume_extractor_version", "v7")
-    monkeypatch.setattr(api.settings, "openai_api_key", "key")
-    monkeypatch.setattr(api.settings, "openai_base_url", None)
-    monkeypatch.setattr(api.settings, "resume_ai_model", "gpt-test")
-
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-extract", created=True)
-        response = client.post(
-            "/jobs/resume-extract",
-            json={
-                "contact_id": "c-1",
-                "attachment_id": "a-1",
-                "filename": "resume.pdf",
-                "refresh_token": "refresh-123",
-            },
-            headers=auth_headers,
-        )
+    _apply_settings(
+        monkeypatch,
+        resume_extractor_version="v7",
+        openai_api_key="key",
+        openai_base_url=None,
+        resume_ai_model="gpt-test",
+    )
 
+    mock_enqueue.return_value = SimpleNamespace(id="job-extract", created=True)
+    response = await client.post(
+        "/jobs/resume-extract",
+        json={
+            "contact_id": "c-1",
+            "attachment_id": "a-1",
+            "filename": "resume.pdf",
+            "refresh_token": "refresh-123",
+        },
+        headers=_AUTH_HEADERS,
+    )
+
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["job_id"] == "job-extract"
     call_kwargs = mock_enqueue.call_args.kwargs
     assert (
@@ -246,75 +320,70 @@ def test_resume_extract_handler_appends_refresh_token_to_idempotency_key(
     )
 
 
-def test_resume_apply_handler_enqueues_job(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_resume_apply_handler_enqueues_job(
+    client: httpx.AsyncClient, mock_enqueue: Mock
 ) -> None:
     """Resume apply endpoint should enqueue apply job."""
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-apply", created=True)
-        response = client.post(
-            "/jobs/resume-apply",
-            json={
-                "contact_id": "c-1",
-                "updates": {"emailAddress": "dev@example.com"},
-                "link_discord": {"user_id": "123", "username": "dev#1111"},
-            },
-            headers=auth_headers,
-        )
+    mock_enqueue.return_value = SimpleNamespace(id="job-apply", created=True)
+    response = await client.post(
+        "/jobs/resume-apply",
+        json={
+            "contact_id": "c-1",
+            "updates": {"emailAddress": "dev@example.com"},
+            "link_discord": {"user_id": "123", "username": "dev#1111"},
+        },
+        headers=_AUTH_HEADERS,
+    )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["job_id"] == "job-apply"
     assert payload["contact_id"] == "c-1"
 
 
-def test_job_status_handler_returns_result(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
+async def test_job_status_handler_returns_result(client: httpx.AsyncClient) -> None:
     """Job status endpoint should expose persisted result payload."""
-    mock_status = Mock()
-    mock_status.value = "succeeded"
-    mock_job = Mock(
+    mock_job = SimpleNamespace(
         id="job-123",
         type="extract_resume_profile_job",
-        status=mock_status,
+        status=SimpleNamespace(value="succeeded"),
         attempts=1,
         max_attempts=8,
         last_error=None,
         payload={"result": {"success": True}},
     )
 
-    with patch("five08.backend.api.get_job", return_value=mock_job):
-        response = client.get("/jobs/job-123", headers=auth_headers)
+    with patch.object(
+        api,
+        "get_job_async",
+        new_callable=AsyncMock,
+        return_value=mock_job,
+    ):
+        response = await client.get("/jobs/job-123", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 200, response.text
     payload = response.json()
-    assert response.status_code == 200
     assert payload["job_id"] == "job-123"
     assert payload["status"] == "succeeded"
     assert payload["result"] == {"success": True}
 
 
-def test_jobs_handler_returns_recent_jobs(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
+async def test_jobs_handler_returns_recent_jobs(client: httpx.AsyncClient) -> None:
     """Jobs list endpoint should return created jobs sorted by API-reported query order."""
-    mock_job = Mock(
+    mock_job = SimpleNamespace(
         id="job-2",
         type="sync_people_from_crm_job",
-        status=Mock(value="queued"),
+        status=SimpleNamespace(value="queued"),
         attempts=1,
         max_attempts=8,
         last_error=None,
         created_at=datetime(2026, 2, 26, 12, 0, 0, tzinfo=timezone.utc),
         updated_at=datetime(2026, 2, 26, 12, 1, 0, tzinfo=timezone.utc),
     )
-    mock_job2 = Mock(
+    mock_job2 = SimpleNamespace(
         id="job-1",
         type="extract_resume_profile_job",
-        status=Mock(value="succeeded"),
+        status=SimpleNamespace(value="succeeded"),
         attempts=2,
         max_attempts=8,
         last_error="boom",
@@ -322,17 +391,19 @@ def test_jobs_handler_returns_recent_jobs(
         updated_at=datetime(2026, 2, 26, 13, 5, 0, tzinfo=timezone.utc),
     )
 
-    with patch(
-        "five08.backend.api.list_jobs",
+    with patch.object(
+        api,
+        "list_jobs_async",
+        new_callable=AsyncMock,
         return_value=[mock_job2, mock_job],
     ) as mock_list_jobs:
-        response = client.get(
+        response = await client.get(
             "/jobs?minutes=15&limit=2&status=queued&type=sync_people_from_crm_job",
-            headers=auth_headers,
+            headers=_AUTH_HEADERS,
         )
 
+    assert response.status_code == 200, response.text
     payload = response.json()
-    assert response.status_code == 200
     assert payload == [
         {
             "job_id": "job-1",
@@ -364,25 +435,23 @@ def test_jobs_handler_returns_recent_jobs(
     assert called_kwargs["created_after"].tzinfo == timezone.utc
 
 
-def test_jobs_handler_rejects_invalid_status(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
+async def test_jobs_handler_rejects_invalid_status(client: httpx.AsyncClient) -> None:
     """Jobs list endpoint should reject unknown status filters."""
-    response = client.get("/jobs?minutes=15&status=not-a-status", headers=auth_headers)
+    response = await client.get(
+        "/jobs?minutes=15&status=not-a-status", headers=_AUTH_HEADERS
+    )
 
+    assert response.status_code == 400, response.text
     payload = response.json()
-    assert response.status_code == 400
     assert payload["error"] == "invalid_status"
     assert payload["status"] == "not-a-status"
 
 
-def test_rerun_job_handler_enqueues_new_job(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_rerun_job_handler_enqueues_new_job(
+    client: httpx.AsyncClient, mock_enqueue: Mock
 ) -> None:
     """Rerun endpoint should enqueue a fresh job from existing call payload."""
-    source_job = Mock(
+    source_job = SimpleNamespace(
         id="job-old-1",
         type="process_docuseal_agreement_job",
         max_attempts=8,
@@ -394,14 +463,18 @@ def test_rerun_job_handler_enqueues_new_job(
     )
 
     with (
-        patch("five08.backend.api.get_job", return_value=source_job),
-        patch("five08.backend.api.enqueue_job") as mock_enqueue,
+        patch.object(
+            api,
+            "get_job_async",
+            new_callable=AsyncMock,
+            return_value=source_job,
+        ),
     ):
-        mock_enqueue.return_value = Mock(id="job-new-1", created=True)
-        response = client.post("/jobs/job-old-1/rerun", headers=auth_headers)
+        mock_enqueue.return_value = SimpleNamespace(id="job-new-1", created=True)
+        response = await client.post("/jobs/job-old-1/rerun", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["source_job_id"] == "job-old-1"
     assert payload["job_id"] == "job-new-1"
@@ -423,77 +496,92 @@ def test_rerun_job_handler_enqueues_new_job(
     assert re.fullmatch(r"[0-9A-HJKMNP-TV-Z]{26}", suffix)
 
 
-def test_rerun_job_handler_returns_not_found(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
+async def test_rerun_job_handler_returns_not_found(client: httpx.AsyncClient) -> None:
     """Rerun endpoint should 404 when source job does not exist."""
-    with patch("five08.backend.api.get_job", return_value=None):
-        response = client.post("/jobs/missing/rerun", headers=auth_headers)
+    with patch.object(
+        api,
+        "get_job_async",
+        new_callable=AsyncMock,
+        return_value=None,
+    ):
+        response = await client.post("/jobs/missing/rerun", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 404, response.text
     payload = response.json()
-    assert response.status_code == 404
     assert payload["error"] == "job_not_found"
 
 
-def test_rerun_job_handler_rejects_unknown_job_type(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_rerun_job_handler_rejects_unknown_job_type(
+    client: httpx.AsyncClient,
 ) -> None:
     """Rerun endpoint should reject unknown persisted job types."""
-    source_job = Mock(
+    source_job = SimpleNamespace(
         id="job-old-2",
         type="some_unknown_type",
         max_attempts=8,
         payload={"args": [], "kwargs": {}},
     )
-    with patch("five08.backend.api.get_job", return_value=source_job):
-        response = client.post("/jobs/job-old-2/rerun", headers=auth_headers)
+    with patch.object(
+        api,
+        "get_job_async",
+        new_callable=AsyncMock,
+        return_value=source_job,
+    ):
+        response = await client.post("/jobs/job-old-2/rerun", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 400, response.text
     payload = response.json()
-    assert response.status_code == 400
     assert payload["error"] == "unsupported_job_type"
     assert payload["job_type"] == "some_unknown_type"
 
 
-def test_rerun_job_handler_rejects_invalid_payload_shape(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_rerun_job_handler_rejects_invalid_payload_shape(
+    client: httpx.AsyncClient,
 ) -> None:
     """Rerun endpoint should reject source jobs with malformed call payload."""
-    source_job = Mock(
+    source_job = SimpleNamespace(
         id="job-old-3",
         type="sync_people_from_crm_job",
         max_attempts=8,
         payload={"args": "not-a-list", "kwargs": {}},
     )
-    with patch("five08.backend.api.get_job", return_value=source_job):
-        response = client.post("/jobs/job-old-3/rerun", headers=auth_headers)
+    with patch.object(
+        api,
+        "get_job_async",
+        new_callable=AsyncMock,
+        return_value=source_job,
+    ):
+        response = await client.post("/jobs/job-old-3/rerun", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 400, response.text
     payload = response.json()
-    assert response.status_code == 400
     assert payload["error"] == "invalid_job_payload"
 
 
-def test_rerun_job_handler_returns_503_on_enqueue_failure(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_rerun_job_handler_returns_503_on_enqueue_failure(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Rerun endpoint should fail with 503 when enqueueing fails."""
-    source_job = Mock(
+    source_job = SimpleNamespace(
         id="job-old-4",
         type="sync_people_from_crm_job",
         max_attempts=8,
         payload={"args": [], "kwargs": {}},
     )
+    mock_enqueue.side_effect = RuntimeError("boom")
     with (
-        patch("five08.backend.api.get_job", return_value=source_job),
-        patch("five08.backend.api.enqueue_job", side_effect=RuntimeError("boom")),
+        patch.object(
+            api,
+            "get_job_async",
+            new_callable=AsyncMock,
+            return_value=source_job,
+        ),
     ):
-        response = client.post("/jobs/job-old-4/rerun", headers=auth_headers)
+        response = await client.post("/jobs/job-old-4/rerun", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 503, response.text
     payload = response.json()
-    assert response.status_code == 503
     assert payload["error"] == "enqueue_failed"
 
 
@@ -501,8 +589,7 @@ def test_resume_extract_model_name_uses_heuristic_without_api_key(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Model identity should be heuristic when OpenAI key is absent."""
-    monkeypatch.setattr(api.settings, "openai_api_key", None)
-    monkeypatch.setattr(api.settings, "resume_ai_model", "gpt-test")
+    _apply_settings(monkeypatch, openai_api_key=None, resume_ai_model="gpt-test")
 
     assert api._resume_extract_model_name() == "heuristic"
 
@@ -511,99 +598,89 @@ def test_resume_extract_model_name_prefixes_openrouter_model(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """OpenRouter base URL should map plain resume model to openai/<model>."""
-    monkeypatch.setattr(api.settings, "openai_api_key", "key")
-    monkeypatch.setattr(api.settings, "openai_base_url", "https://openrouter.ai/api/v1")
-    monkeypatch.setattr(api.settings, "resume_ai_model", "gpt-4o-mini")
+    _apply_settings(
+        monkeypatch,
+        openai_api_key="key",
+        openai_base_url="https://openrouter.ai/api/v1",
+        resume_ai_model="gpt-4o-mini",
+    )
 
     assert api._resume_extract_model_name() == "openai/gpt-4o-mini"
 
 
-def test_sync_people_handler_enqueues_full_sync(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_sync_people_handler_enqueues_full_sync(
+    client: httpx.AsyncClient,
 ) -> None:
     """Manual people-sync endpoint should enqueue one full sync job."""
-    with patch(
-        "five08.backend.api._enqueue_full_crm_sync_job", new_callable=AsyncMock
+    with patch.object(
+        api, "_enqueue_full_crm_sync_job", new_callable=AsyncMock
     ) as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-sync", created=True)
-        response = client.post("/sync/people", headers=auth_headers)
+        mock_enqueue.return_value = SimpleNamespace(id="job-sync", created=True)
+        response = await client.post("/sync/people", headers=_AUTH_HEADERS)
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["job_id"] == "job-sync"
     assert payload["created"] is True
 
 
-def test_espocrm_people_sync_webhook_handler_enqueues_contact_jobs(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_espocrm_people_sync_webhook_handler_enqueues_contact_jobs(
+    client: httpx.AsyncClient,
 ) -> None:
     """People sync webhook should enqueue before responding."""
-    with patch(
-        "five08.backend.api._enqueue_espocrm_people_sync_batch",
+    with patch.object(
+        api,
+        "_enqueue_espocrm_people_sync_batch",
         new_callable=AsyncMock,
     ):
-        response = client.post(
+        response = await client.post(
             "/webhooks/espocrm/people-sync",
-            json=[{"id": "c-1"}, {"id": "c-2"}],
-            headers=auth_headers,
+            content=_ESPO_BATCH_BYTES,
+            headers=_JSON_HEADERS,
         )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["events_received"] == 2
     assert payload["events_enqueued"] == 2
 
 
-def test_espocrm_webhook_handler_returns_503_on_enqueue_failure(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
-    """EspoCRM webhook should fail when enqueue persistence fails."""
-    with patch(
-        "five08.backend.api._enqueue_espocrm_batch",
-        new=AsyncMock(side_effect=RuntimeError("boom")),
-    ):
-        response = client.post(
-            "/webhooks/espocrm",
-            json=[{"id": "c-1"}],
-            headers=auth_headers,
-        )
-
-    payload = response.json()
-    assert response.status_code == 503
-    assert payload["error"] == "enqueue_failed"
-
-
-def test_espocrm_people_sync_webhook_handler_returns_503_on_enqueue_failure(
-    client: TestClient,
-    auth_headers: dict[str, str],
+@pytest.mark.parametrize(
+    ("path", "batch_helper"),
+    [
+        ("/webhooks/espocrm", "_enqueue_espocrm_batch"),
+        ("/webhooks/espocrm/people-sync", "_enqueue_espocrm_people_sync_batch"),
+    ],
+)
+async def test_espocrm_webhook_handlers_return_503_on_enqueue_failure(
+    client: httpx.AsyncClient,
+    path: str,
+    batch_helper: str,
 ) -> None:
-    """People sync webhook should fail when enqueue persistence fails."""
-    with patch(
-        "five08.backend.api._enqueue_espocrm_people_sync_batch",
+    """EspoCRM webhooks should fail when enqueue persistence fails."""
+    with patch.object(
+        api,
+        batch_helper,
         new=AsyncMock(side_effect=RuntimeError("boom")),
     ):
-        response = client.post(
-            "/webhooks/espocrm/people-sync",
-            json=[{"id": "c-1"}],
-            headers=auth_headers,
+        response = await client.post(
+            path,
+            content=_ESPO_BATCH_BYTES,
+            headers=_JSON_HEADERS,
         )
 
+    assert response.status_code == 503, response.text
     payload = response.json()
-    assert response.status_code == 503
     assert payload["error"] == "enqueue_failed"
 
 
-def test_audit_event_handler_persists_human_event(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_audit_event_handler_persists_human_event(
+    client: httpx.AsyncClient,
 ) -> None:
     """Audit events endpoint should persist one validated event."""
-    with patch("five08.backend.api.insert_audit_event") as mock_insert:
-        mock_insert.return_value = Mock(id="evt-1", person_id="person-1")
-        response = client.post(
+    with patch.object(api, "insert_audit_event") as mock_insert:
+        mock_insert.return_value = SimpleNamespace(id="evt-1", person_id="person-1")
+        response = await client.post(
             "/audit/events",
             json={
                 "source": "discord",
@@ -614,122 +691,115 @@ def test_audit_event_handler_persists_human_event(
                 "actor_display_name": "johnny",
                 "metadata": {"query": "python"},
             },
-            headers=auth_headers,
+            headers=_AUTH_HEADERS,
         )
 
+    assert response.status_code == 201, response.text
     payload = response.json()
-    assert response.status_code == 201
     assert payload["event_id"] == "evt-1"
     assert payload["person_id"] == "person-1"
 
 
-def test_auth_login_returns_503_when_store_not_ready(client: TestClient) -> None:
-    response = client.get("/auth/login")
-    assert response.status_code == 503
+async def test_auth_login_returns_503_when_store_not_ready(
+    client: httpx.AsyncClient,
+) -> None:
+    response = await client.get("/auth/login")
+    assert response.status_code == 503, response.text
     assert response.json()["error"] == "auth_not_ready"
 
 
-def test_auth_me_requires_session(client: TestClient) -> None:
-    response = client.get("/auth/me")
-    assert response.status_code == 401
+async def test_auth_me_requires_session(client: httpx.AsyncClient) -> None:
+    response = await client.get("/auth/me")
+    assert response.status_code == 401, response.text
     assert response.json()["error"] == "unauthorized"
 
 
-def test_auth_discord_link_create_forbidden_for_non_admin(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_auth_discord_link_create_forbidden_for_non_admin(
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
 ) -> None:
-    fake_store = _FakeAuthStore()
-    fake_verifier = Mock()
-    fake_verifier.is_admin_discord_user = AsyncMock(return_value=False)
+    _, verifier = auth_patches
+    verifier.is_admin_discord_user = AsyncMock(return_value=False)
 
-    with (
-        patch("five08.backend.api._auth_store_from_app", return_value=fake_store),
-        patch(
-            "five08.backend.api._discord_admin_verifier_from_app",
-            return_value=fake_verifier,
-        ),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-    ):
-        response = client.post(
-            "/auth/discord/links",
-            json={"discord_user_id": "123456"},
-            headers=auth_headers,
-        )
+    response = await client.post(
+        "/auth/discord/links",
+        json={"discord_user_id": "123456"},
+        headers=_AUTH_HEADERS,
+    )
 
-    assert response.status_code == 403
+    assert response.status_code == 403, response.text
     assert response.json()["detail"] == "discord_user_not_admin"
 
 
-def test_auth_discord_link_create_returns_url_for_admin(
+async def test_auth_discord_link_create_returns_url_for_admin(
     monkeypatch: pytest.MonkeyPatch,
-    client: TestClient,
-    auth_headers: dict[str, str],
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
 ) -> None:
     monkeypatch.setattr(
         api.settings, "dashboard_public_base_url", "https://dash.508.dev"
     )
-    fake_store = _FakeAuthStore()
-    fake_verifier = Mock()
-    fake_verifier.is_admin_discord_user = AsyncMock(return_value=True)
+    _, verifier = auth_patches
+    verifier.is_admin_discord_user = AsyncMock(return_value=True)
 
-    with (
-        patch("five08.backend.api._auth_store_from_app", return_value=fake_store),
-        patch(
-            "five08.backend.api._discord_admin_verifier_from_app",
-            return_value=fake_verifier,
-        ),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-    ):
-        response = client.post(
-            "/auth/discord/links",
-            json={"discord_user_id": "123456", "next_path": "/jobs/abc"},
-            headers=auth_headers,
-        )
+    response = await client.post(
+        "/auth/discord/links",
+        json={"discord_user_id": "123456", "next_path": "/jobs/abc"},
+        headers=_AUTH_HEADERS,
+    )
 
+    assert response.status_code == 201, response.text
     payload = response.json()
-    assert response.status_code == 201
     assert payload["status"] == "created"
     assert payload["link_url"].startswith("https://dash.508.dev/auth/discord/link/")
 
 
-def test_auth_callback_success_writes_login_audit(client: TestClient) -> None:
-    store = Mock()
-    store.pop_oidc_state = AsyncMock(
-        return_value=api.PendingOIDCState(
-            nonce="nonce-1",
-            code_verifier="verifier-1",
-            next_path="/dashboard",
-            discord_link_token=None,
-        )
+def _pending_oidc_state(
+    *, discord_link_token: str | None = None
+) -> api.PendingOIDCState:
+    return api.PendingOIDCState(
+        nonce="nonce-1",
+        code_verifier="verifier-1",
+        next_path="/dashboard",
+        discord_link_token=discord_link_token,
     )
-    store.save_session = AsyncMock()
 
+
+def _discord_link_grant() -> api.DiscordLinkGrant:
+    return api.DiscordLinkGrant(discord_user_id="123456789", next_path="/dashboard")
+
+
+def _oidc_stub(**claims: object) -> Mock:
+    """Build a configured OIDC client whose ID token carries the given claims."""
     oidc = Mock()
     oidc.configured = True
     oidc.exchange_code = AsyncMock(return_value={"id_token": "id-token-1"})
-    oidc.validate_id_token = AsyncMock(
-        return_value={
-            "sub": "authentik-user-1",
-            "email": "Admin@508.dev",
-            "name": "Admin User",
-            "groups": ["Admin"],
-            "exp": 4_102_444_800,
-        }
+    oidc.validate_id_token = AsyncMock(return_value={**claims, "exp": 4_102_444_800})
+    return oidc
+
+
+async def test_auth_callback_success_writes_login_audit(
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
+) -> None:
+    store, _ = auth_patches
+    store.pop_oidc_state = AsyncMock(return_value=_pending_oidc_state())
+    store.save_session = AsyncMock()
+
+    oidc = _oidc_stub(
+        sub="authentik-user-1",
+        email="Admin@508.dev",
+        name="Admin User",
+        groups=["Admin"],
     )
 
     with (
-        patch("five08.backend.api._auth_store_from_app", return_value=store),
-        patch("five08.backend.api._oidc_client_from_app", return_value=oidc),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-        patch("five08.backend.api.insert_audit_event") as mock_insert,
+        patch.object(api, "_oidc_client_from_app", return_value=oidc),
+        patch.object(api, "insert_audit_event") as mock_insert,
     ):
-        response = client.get(
-            "/auth/callback?code=code-1&state=state-1",
-            follow_redirects=False,
-        )
+        response = await client.get("/auth/callback?code=code-1&state=state-1")
 
-    assert response.status_code == 302
+    assert response.status_code == 302, response.text
     audit_payload = mock_insert.call_args.args[1]
     assert audit_payload.action == "auth.login"
     assert audit_payload.result == api.AuditResult.SUCCESS
@@ -740,48 +810,30 @@ def test_auth_callback_success_writes_login_audit(client: TestClient) -> None:
     assert "discord_link_identity_checks_enforced" not in audit_payload.metadata
 
 
-def test_auth_callback_denied_writes_login_audit(client: TestClient) -> None:
-    store = Mock()
+async def test_auth_callback_denied_writes_login_audit(
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
+) -> None:
+    store, _ = auth_patches
     store.pop_oidc_state = AsyncMock(
-        return_value=api.PendingOIDCState(
-            nonce="nonce-1",
-            code_verifier="verifier-1",
-            next_path="/dashboard",
-            discord_link_token="link-1",
-        )
-    )
-    store.get_discord_link = AsyncMock(
-        return_value=api.DiscordLinkGrant(
-            discord_user_id="123456789",
-            next_path="/dashboard",
-        )
+        return_value=_pending_oidc_state(discord_link_token="link-1")
     )
+    store.get_discord_link = AsyncMock(return_value=_discord_link_grant())
 
-    oidc = Mock()
-    oidc.configured = True
-    oidc.exchange_code = AsyncMock(return_value={"id_token": "id-token-1"})
-    oidc.validate_id_token = AsyncMock(
-        return_value={
-            "sub": "authentik-user-2",
-            "email": "member@508.dev",
-            "name": "Member User",
-            "groups": ["Member"],
-            "exp": 4_102_444_800,
-        }
+    oidc = _oidc_stub(
+        sub="authentik-user-2",
+        email="member@508.dev",
+        name="Member User",
+        groups=["Member"],
     )
 
     with (
-        patch("five08.backend.api._auth_store_from_app", return_value=store),
-        patch("five08.backend.api._oidc_client_from_app", return_value=oidc),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-        patch("five08.backend.api.insert_audit_event") as mock_insert,
+        patch.object(api, "_oidc_client_from_app", return_value=oidc),
+        patch.object(api, "insert_audit_event") as mock_insert,
     ):
-        response = client.get(
-            "/auth/callback?code=code-1&state=state-1",
-            follow_redirects=False,
-        )
+        response = await client.get("/auth/callback?code=code-1&state=state-1")
 
-    assert response.status_code == 403
+    assert response.status_code == 403, response.text
     assert response.json()["detail"] == "admin_group_required"
     audit_payload = mock_insert.call_args.args[1]
     assert audit_payload.action == "auth.login"
@@ -789,55 +841,35 @@ def test_auth_callback_denied_writes_login_audit(client: TestClient) -> None:
     assert audit_payload.actor_subject == "member@508.dev"
 
 
-def test_auth_callback_discord_link_can_skip_oidc_identity_checks(
+async def test_auth_callback_discord_link_can_skip_oidc_identity_checks(
     monkeypatch: pytest.MonkeyPatch,
-    client: TestClient,
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
 ) -> None:
     monkeypatch.setattr(
         api.settings, "discord_link_require_oidc_identity_checks", False
     )
-    store = Mock()
+    store, _ = auth_patches
     store.pop_oidc_state = AsyncMock(
-        return_value=api.PendingOIDCState(
-            nonce="nonce-1",
-            code_verifier="verifier-1",
-            next_path="/dashboard",
-            discord_link_token="link-1",
-        )
-    )
-    store.get_discord_link = AsyncMock(
-        return_value=api.DiscordLinkGrant(
-            discord_user_id="123456789",
-            next_path="/dashboard",
-        )
+        return_value=_pending_oidc_state(discord_link_token="link-1")
     )
+    store.get_discord_link = AsyncMock(return_value=_discord_link_grant())
     store.delete_discord_link = AsyncMock()
     store.save_session = AsyncMock()
 
-    oidc = Mock()
-    oidc.configured = True
-    oidc.exchange_code = AsyncMock(return_value={"id_token": "id-token-1"})
-    oidc.validate_id_token = AsyncMock(
-        return_value={
-            "sub": "authentik-user-4",
-            "name": "Bootstrap User",
-            "groups": ["not-admin-yet"],
-            "exp": 4_102_444_800,
-        }
+    oidc = _oidc_stub(
+        sub="authentik-user-4",
+        name="Bootstrap User",
+        groups=["not-admin-yet"],
     )
 
     with (
-        patch("five08.backend.api._auth_store_from_app", return_value=store),
-        patch("five08.backend.api._oidc_client_from_app", return_value=oidc),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-        patch("five08.backend.api.insert_audit_event") as mock_insert,
+        patch.object(api, "_oidc_client_from_app", return_value=oidc),
+        patch.object(api, "insert_audit_event") as mock_insert,
     ):
-        response = client.get(
-            "/auth/callback?code=code-1&state=state-1",
-            follow_redirects=False,
-        )
+        response = await client.get("/auth/callback?code=code-1&state=state-1")
 
-    assert response.status_code == 302
+    assert response.status_code == 302, response.text
     saved_session = store.save_session.call_args.kwargs["payload"]
     assert saved_session.is_admin is True
     store.delete_discord_link.assert_awaited_once_with("link-1")
@@ -847,43 +879,30 @@ def test_auth_callback_discord_link_can_skip_oidc_identity_checks(
     assert audit_payload.metadata["discord_link_identity_checks_enforced"] is False
 
 
-def test_auth_discord_link_redirect_creates_discord_session_when_disabled(
+async def test_auth_discord_link_redirect_creates_discord_session_when_disabled(
     monkeypatch: pytest.MonkeyPatch,
-    client: TestClient,
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
 ) -> None:
     monkeypatch.setattr(
         api.settings, "discord_link_require_oidc_identity_checks", False
     )
-    store = Mock()
-    store.get_discord_link = AsyncMock(
-        return_value=api.DiscordLinkGrant(
-            discord_user_id="123456789",
-            next_path="/dashboard",
-        )
-    )
+    store, verifier = auth_patches
+    store.get_discord_link = AsyncMock(return_value=_discord_link_grant())
     store.save_session = AsyncMock()
     store.delete_discord_link = AsyncMock()
-    verifier = Mock()
     verifier.resolve_admin_identity = AsyncMock(
-        return_value=Mock(
+        return_value=SimpleNamespace(
             discord_user_id="123456789",
             email="admin@508.dev",
             display_name="Discord Admin",
         )
     )
 
-    with (
-        patch("five08.backend.api._auth_store_from_app", return_value=store),
-        patch(
-            "five08.backend.api._discord_admin_verifier_from_app",
-            return_value=verifier,
-        ),
-        patch("five08.backend.api._http_client_from_app", return_value=Mock()),
-        patch("five08.backend.api.insert_audit_event") as mock_insert,
-    ):
-        response = client.get("/auth/discord/link/link-1", follow_redirects=False)
+    with patch.object(api, "insert_audit_event") as mock_insert:
+        response = await client.get("/auth/discord/link/link-1")
 
-    assert response.status_code == 302
+    assert response.status_code == 302, response.text
     assert response.headers["location"] == "/dashboard"
     store.delete_discord_link.assert_awaited_once_with("link-1")
     saved_session = store.save_session.call_args.kwargs["payload"]
@@ -897,8 +916,11 @@ def test_auth_discord_link_redirect_creates_discord_session_when_disabled(
     assert audit_payload.metadata["discord_link_identity_checks_enforced"] is False
 
 
-def test_auth_logout_writes_logout_audit(client: TestClient) -> None:
-    store = Mock()
+async def test_auth_logout_writes_logout_audit(
+    client: httpx.AsyncClient,
+    auth_patches: tuple[_FakeAuthStore, Mock],
+) -> None:
+    store, _ = auth_patches
     store.delete_session = AsyncMock()
     session = api.AuthSession(
         subject="authentik-user-3",
@@ -911,15 +933,12 @@ def test_auth_logout_writes_logout_audit(client: TestClient) -> None:
     )
 
     with (
-        patch(
-            "five08.backend.api._current_session", return_value=("session-1", session)
-        ),
-        patch("five08.backend.api._auth_store_from_app", return_value=store),
-        patch("five08.backend.api.insert_audit_event") as mock_insert,
+        patch.object(api, "_current_session", return_value=("session-1", session)),
+        patch.object(api, "insert_audit_event") as mock_insert,
     ):
-        response = client.post("/auth/logout")
+        response = await client.post("/auth/logout")
 
-    assert response.status_code == 200
+    assert response.status_code == 200, response.text
     audit_payload = mock_insert.call_args.args[1]
     assert audit_payload.action == "auth.logout"
     assert audit_payload.result == api.AuditResult.SUCCESS
@@ -928,16 +947,55 @@ def test_auth_logout_writes_logout_audit(client: TestClient) -> None:
 
 # -- Docuseal webhook tests --------------------------------------------------
 
-_DOCUSEAL_PAYLOAD = {
-    "event_type": "form.completed",
-    "timestamp": "2026-02-25T12:00:00Z",
+_DOCUSEAL_PAYLOAD = _freeze(
+    {
+        "event_type": "form.completed",
+        "timestamp": "2026-02-25T12:00:00Z",
+        "data": {
+            "id": 42,
+            "submission_id": 4200,
+            "email": "member@508.dev",
+            "status": "completed",
+            "completed_at": "2026-02-25T12:00:00Z",
+            "name": "Jane Doe",
+            "template": {"id": 68},
+        },
+    }
+)
+
+
+def _mk_docuseal_payload(
+    *, timestamp: str | None = None, **data: object
+) -> dict[str, Any]:
+    """Return a mutable copy of the frozen Docuseal payload with overrides."""
+    payload: dict[str, Any] = _thaw(_DOCUSEAL_PAYLOAD)
+    payload["data"].update(data)
+    if timestamp is not None:
+        payload["timestamp"] = timestamp
+    return payload
+
+
+_DOCUSEAL_PAYLOAD_BYTES = json.dumps(_thaw(_DOCUSEAL_PAYLOAD)).encode()
+_DOCUSEAL_PAYLOAD_BLANK_EMAILS = {
+    email: _mk_docuseal_payload(email=email) for email in ("", "  ")
+}
+_DOCUSEAL_PAYLOAD_BLANK_TIMESTAMPS = {
+    timestamp: _mk_docuseal_payload(timestamp=timestamp, completed_at="")
+    for timestamp in ("", "   ")
+}
+_DOCUSEAL_PAYLOAD_OFFSET_TIMESTAMP = _mk_docuseal_payload(
+    timestamp="2026-03-02T10:02:30.572+02:00",
+    completed_at="2026-03-02T10:02:30.572+02:00",
+)
+_DOCUSEAL_PAYLOAD_OTHER_TEMPLATE = _mk_docuseal_payload(template={"id": 101})
+_DOCUSEAL_PAYLOAD_NO_TEMPLATE = _mk_docuseal_payload(template=None)
+_DOCUSEAL_PAYLOAD_NO_SUBMISSION_ID = {
+    **_mk_docuseal_payload(),
     "data": {
         "id": 42,
-        "submission_id": 4200,
         "email": "member@508.dev",
         "status": "completed",
         "completed_at": "2026-02-25T12:00:00Z",
-        "name": "Jane Doe",
         "template": {"id": 68},
     },
 }
@@ -956,34 +1014,29 @@ _GOOGLE_FORMS_INTAKE_PAYLOAD = {
 }
 
 
-def test_docuseal_webhook_rejects_unauthorized(client: TestClient) -> None:
-    """Docuseal webhook should reject requests without valid auth."""
-    response = client.post("/webhooks/docuseal", json=_DOCUSEAL_PAYLOAD)
-    assert response.status_code == 401
-    assert response.json()["error"] == "unauthorized"
+@pytest.fixture(scope="module")
+def _docuseal_template_filter() -> Iterator[None]:
+    """Configure the member agreement template filter used by most Docuseal tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api.settings, "docuseal_member_agreement_template_id", 68)
+        yield
 
 
-def test_docuseal_webhook_enqueues_agreement_job(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_enqueues_agreement_job(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Valid form.completed payload should enqueue agreement job."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    mock_enqueue.return_value = SimpleNamespace(id="job-ds-1", created=True)
+    response = await client.post(
+        "/webhooks/docuseal",
+        content=_DOCUSEAL_PAYLOAD_BYTES,
+        headers=_JSON_HEADERS,
     )
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-ds-1")
-        response = client.post(
-            "/webhooks/docuseal",
-            json=_DOCUSEAL_PAYLOAD,
-            headers=auth_headers,
-        )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["source"] == "docuseal"
     assert payload["job_id"] == "job-ds-1"
@@ -996,35 +1049,21 @@ def test_docuseal_webhook_enqueues_agreement_job(
     assert call_kwargs["idempotency_key"] == "docuseal-agreement:4200"
 
 
-def test_docuseal_webhook_converts_completed_at_to_utc_payload_contract(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_converts_completed_at_to_utc_payload_contract(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Docuseal timestamps should be serialized as UTC string contract payload args."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    mock_enqueue.return_value = SimpleNamespace(id="job-ds-utc", created=True)
+    response = await client.post(
+        "/webhooks/docuseal",
+        json=_DOCUSEAL_PAYLOAD_OFFSET_TIMESTAMP,
+        headers=_AUTH_HEADERS,
     )
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "data": {
-            **_DOCUSEAL_PAYLOAD["data"],
-            "completed_at": "2026-03-02T10:02:30.572+02:00",
-        },
-        "timestamp": "2026-03-02T10:02:30.572+02:00",
-    }
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-ds-utc")
-        response = client.post(
-            "/webhooks/docuseal",
-            json=payload,
-            headers=auth_headers,
-        )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["job_id"] == "job-ds-utc"
     assert payload["submission_id"] == 4200
@@ -1033,9 +1072,9 @@ def test_docuseal_webhook_converts_completed_at_to_utc_payload_contract(
     assert call_kwargs["args"][1] == "2026-03-02 08:02:30"
 
 
-def test_docuseal_webhook_ignored_when_template_filter_unset(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_docuseal_webhook_ignored_when_template_filter_unset(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Docuseal webhook should be ignored when template filter is unset."""
@@ -1045,17 +1084,16 @@ def test_docuseal_webhook_ignored_when_template_filter_unset(
         None,
     )
     with (
-        patch("five08.backend.api.enqueue_job") as mock_enqueue,
-        patch("five08.backend.api.logger.info") as mock_info,
+        patch.object(api.logger, "info") as mock_info,
     ):
-        response = client.post(
+        response = await client.post(
             "/webhooks/docuseal",
-            json=_DOCUSEAL_PAYLOAD,
-            headers=auth_headers,
+            content=_DOCUSEAL_PAYLOAD_BYTES,
+            headers=_JSON_HEADERS,
         )
 
+    assert response.status_code == 200, response.text
     payload = response.json()
-    assert response.status_code == 200
     assert payload["status"] == "ignored"
     assert payload["reason"] == "template_filter_not_configured"
     mock_enqueue.assert_not_called()
@@ -1064,78 +1102,50 @@ def test_docuseal_webhook_ignored_when_template_filter_unset(
     )
 
 
-def test_docuseal_webhook_rejects_invalid_payload(
-    client: TestClient,
-    auth_headers: dict[str, str],
-) -> None:
-    """Malformed payload should return 400."""
-    response = client.post(
-        "/webhooks/docuseal",
-        json={"bad": "data"},
-        headers=auth_headers,
-    )
-    assert response.status_code == 400
-    assert response.json()["error"] == "invalid_payload"
-
-
-@pytest.mark.parametrize("email", ["", "  "])
-def test_docuseal_webhook_rejects_blank_email(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
-    email: str,
-) -> None:
-    """Blank submitter email should be rejected."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
-    )
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "data": {**_DOCUSEAL_PAYLOAD["data"], "email": email},
-    }
-    response = client.post(
-        "/webhooks/docuseal",
-        json=payload,
-        headers=auth_headers,
-    )
-
-    assert response.status_code == 400
-    assert response.json()["error"] == "invalid_payload"
-
-
-@pytest.mark.parametrize("timestamp", ["", "   "])
-def test_docuseal_webhook_rejects_blank_timestamp(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
-    timestamp: str,
+@pytest.mark.parametrize(
+    ("payload", "authorized", "expected_status", "expected_error"),
+    [
+        pytest.param(_mk_docuseal_payload(), False, 401, "unauthorized", id="no-auth"),
+        pytest.param({"bad": "data"}, True, 400, "invalid_payload", id="malformed"),
+        *(
+            pytest.param(
+                payload, True, 400, "invalid_payload", id=f"blank-email-{len(email)}"
+            )
+            for email, payload in _DOCUSEAL_PAYLOAD_BLANK_EMAILS.items()
+        ),
+        *(
+            pytest.param(
+                payload,
+                True,
+                400,
+                "invalid_payload",
+                id=f"blank-timestamp-{len(timestamp)}",
+            )
+            for timestamp, payload in _DOCUSEAL_PAYLOAD_BLANK_TIMESTAMPS.items()
+        ),
+    ],
+)
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_rejects_request(
+    client: httpx.AsyncClient,
+    payload: dict[str, object],
+    authorized: bool,
+    expected_status: int,
+    expected_error: str,
 ) -> None:
-    """Blank submitter completion time should be rejected."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
-    )
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "timestamp": timestamp,
-        "data": {**_DOCUSEAL_PAYLOAD["data"], "completed_at": ""},
-    }
-    response = client.post(
+    """Unauthorized, malformed, or blank-field webhooks should be rejected."""
+    response = await client.post(
         "/webhooks/docuseal",
         json=payload,
-        headers=auth_headers,
+        headers=_AUTH_HEADERS if authorized else {},
     )
 
-    assert response.status_code == 400
-    assert response.json()["error"] == "invalid_payload"
+    assert response.status_code == expected_status, response.text
+    assert response.json()["error"] == expected_error
 
 
-def test_docuseal_webhook_ignores_unmatched_template(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_docuseal_webhook_ignores_unmatched_template(
+    client: httpx.AsyncClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Webhooks for non-target templates should be ignored when template filter is set."""
@@ -1144,45 +1154,33 @@ def test_docuseal_webhook_ignores_unmatched_template(
         "docuseal_member_agreement_template_id",
         100,
     )
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "data": {
-            **_DOCUSEAL_PAYLOAD["data"],
-            "template": {"id": 101},
-        },
-    }
-    response = client.post(
+    response = await client.post(
         "/webhooks/docuseal",
-        json=payload,
-        headers=auth_headers,
+        json=_DOCUSEAL_PAYLOAD_OTHER_TEMPLATE,
+        headers=_AUTH_HEADERS,
     )
 
-    assert response.status_code == 200
-    assert response.json()["status"] == "ignored"
-    assert response.json()["reason"] == "template_mismatch"
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["status"] == "ignored"
+    assert payload["reason"] == "template_mismatch"
 
 
-def test_docuseal_webhook_processes_matching_template(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_processes_matching_template(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Matching template webhooks should still enqueue agreement jobs."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    mock_enqueue.return_value = SimpleNamespace(id="job-ds-2", created=True)
+    response = await client.post(
+        "/webhooks/docuseal",
+        content=_DOCUSEAL_PAYLOAD_BYTES,
+        headers=_JSON_HEADERS,
     )
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-ds-2")
-        response = client.post(
-            "/webhooks/docuseal",
-            json=_DOCUSEAL_PAYLOAD,
-            headers=auth_headers,
-        )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["source"] == "docuseal"
     assert payload["job_id"] == "job-ds-2"
@@ -1191,69 +1189,40 @@ def test_docuseal_webhook_processes_matching_template(
     assert mock_enqueue.call_args.kwargs["idempotency_key"] == "docuseal-agreement:4200"
 
 
-def test_docuseal_webhook_ignores_when_template_id_missing(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_ignores_when_template_id_missing(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Template-less payloads should be ignored when filter is configured."""
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "data": {
-            **_DOCUSEAL_PAYLOAD["data"],
-            "template": None,
-        },
-    }
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    response = await client.post(
+        "/webhooks/docuseal",
+        json=_DOCUSEAL_PAYLOAD_NO_TEMPLATE,
+        headers=_AUTH_HEADERS,
     )
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        response = client.post(
-            "/webhooks/docuseal",
-            json=payload,
-            headers=auth_headers,
-        )
 
+    assert response.status_code == 200, response.text
     payload = response.json()
-    assert response.status_code == 200
     assert payload["status"] == "ignored"
     assert payload["reason"] == "template_mismatch"
     mock_enqueue.assert_not_called()
 
 
-def test_docuseal_webhook_uses_submitter_id_when_submission_id_missing(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_uses_submitter_id_when_submission_id_missing(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Webhooks without submission_id should fallback to submitter id for idempotency."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    mock_enqueue.return_value = SimpleNamespace(id="job-ds-4", created=True)
+    response = await client.post(
+        "/webhooks/docuseal",
+        json=_DOCUSEAL_PAYLOAD_NO_SUBMISSION_ID,
+        headers=_AUTH_HEADERS,
     )
-    payload = {
-        **_DOCUSEAL_PAYLOAD,
-        "data": {
-            "id": 42,
-            "email": "member@508.dev",
-            "status": "completed",
-            "completed_at": "2026-02-25T12:00:00Z",
-            "template": {"id": 68},
-        },
-    }
-    with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-        mock_enqueue.return_value = Mock(id="job-ds-4")
-        response = client.post(
-            "/webhooks/docuseal",
-            json=payload,
-            headers=auth_headers,
-        )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["source"] == "docuseal"
     assert payload["job_id"] == "job-ds-4"
@@ -1264,9 +1233,8 @@ def test_docuseal_webhook_uses_submitter_id_when_submission_id_missing(
     assert call_kwargs["idempotency_key"] == "docuseal-agreement:42"
 
 
-def test_docuseal_webhook_ignores_non_completed_event(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_docuseal_webhook_ignores_non_completed_event(
+    client: httpx.AsyncClient,
 ) -> None:
     """Non form.completed events should be acknowledged but ignored."""
     payload = {
@@ -1278,70 +1246,62 @@ def test_docuseal_webhook_ignores_non_completed_event(
             "status": "pending",
         },
     }
-    response = client.post(
+    response = await client.post(
         "/webhooks/docuseal",
         json=payload,
-        headers=auth_headers,
+        headers=_AUTH_HEADERS,
     )
-    assert response.status_code == 200
+    assert response.status_code == 200, response.text
     assert response.json()["status"] == "ignored"
 
 
-def test_docuseal_webhook_returns_503_on_enqueue_failure(
-    client: TestClient,
-    auth_headers: dict[str, str],
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.usefixtures("_docuseal_template_filter")
+async def test_docuseal_webhook_returns_503_on_enqueue_failure(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Enqueue failure should return 503."""
-    monkeypatch.setattr(
-        api.settings,
-        "docuseal_member_agreement_template_id",
-        68,
+    mock_enqueue.side_effect = RuntimeError("queue down")
+    response = await client.post(
+        "/webhooks/docuseal",
+        content=_DOCUSEAL_PAYLOAD_BYTES,
+        headers=_JSON_HEADERS,
     )
-    with patch(
-        "five08.backend.api.enqueue_job",
-        side_effect=RuntimeError("queue down"),
-    ):
-        response = client.post(
-            "/webhooks/docuseal",
-            json=_DOCUSEAL_PAYLOAD,
-            headers=auth_headers,
-        )
-    assert response.status_code == 503
+    assert response.status_code == 503, response.text
     assert response.json()["error"] == "enqueue_failed"
 
 
 # --- Google Forms intake webhook ---
 
 
-def test_google_forms_intake_rejects_unauthorized(client: TestClient) -> None:
+async def test_google_forms_intake_rejects_unauthorized(
+    client: httpx.AsyncClient,
+) -> None:
     """Google Forms webhook should reject requests without auth."""
-    response = client.post("/webhooks/google-forms", json={"email": "a@b.com"})
-    assert response.status_code == 401
+    response = await client.post("/webhooks/google-forms", json={"email": "a@b.com"})
+    assert response.status_code == 401, response.text
 
 
-def test_google_forms_intake_enqueues_job(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_enqueues_job(
+    client: httpx.AsyncClient, mock_enqueue: Mock
 ) -> None:
     """Google Forms webhook should enqueue intake job and return 202."""
     with patch.object(api.settings, "google_forms_allowed_form_ids", "form-1,form-2"):
-        with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-            mock_enqueue.return_value = Mock(id="job-intake-1")
-            response = client.post(
-                "/webhooks/google-forms",
-                json={
-                    **_GOOGLE_FORMS_INTAKE_PAYLOAD,
-                    "email": "  member@example.com  ",
-                    "first_name": "  Jane  ",
-                    "last_name": "  Doe  ",
-                    "form_id": "form-1",
-                },
-                headers=auth_headers,
-            )
+        mock_enqueue.return_value = SimpleNamespace(id="job-intake-1", created=True)
+        response = await client.post(
+            "/webhooks/google-forms",
+            json={
+                **_GOOGLE_FORMS_INTAKE_PAYLOAD,
+                "email": "  member@example.com  ",
+                "first_name": "  Jane  ",
+                "last_name": "  Doe  ",
+                "form_id": "form-1",
+            },
+            headers=_AUTH_HEADERS,
+        )
 
+    assert response.status_code == 202, response.text
     payload = response.json()
-    assert response.status_code == 202
     assert payload["status"] == "queued"
     assert payload["source"] == "google_forms"
     assert payload["job_id"] == "job-intake-1"
@@ -1354,20 +1314,19 @@ def test_google_forms_intake_enqueues_job(
     assert call_kwargs["args"][0]["last_name"] == "Doe"
 
 
-def test_google_forms_intake_rejects_unapproved_form_id(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_rejects_unapproved_form_id(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Unapproved Google Forms IDs should be rejected."""
     with patch.object(api.settings, "google_forms_allowed_form_ids", "form-1,form-2"):
-        with patch("five08.backend.api.enqueue_job"):
-            response = client.post(
-                "/webhooks/google-forms",
-                json={**_GOOGLE_FORMS_INTAKE_PAYLOAD, "form_id": "legacy-form"},
-                headers=auth_headers,
-            )
+        response = await client.post(
+            "/webhooks/google-forms",
+            json={**_GOOGLE_FORMS_INTAKE_PAYLOAD, "form_id": "legacy-form"},
+            headers=_AUTH_HEADERS,
+        )
 
-    assert response.status_code == 403
+    assert response.status_code == 403, response.text
     assert response.json()["error"] == "invalid_form_id"
 
 
@@ -1382,9 +1341,8 @@ def test_google_forms_intake_rejects_unapproved_form_id(
         ("last_name", "   "),
     ],
 )
-def test_google_forms_intake_rejects_blank_required_fields(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_rejects_blank_required_fields(
+    client: httpx.AsyncClient,
     field: str,
     value: str,
 ) -> None:
@@ -1392,18 +1350,18 @@ def test_google_forms_intake_rejects_blank_required_fields(
     payload = dict(_GOOGLE_FORMS_INTAKE_PAYLOAD)
     payload[field] = value
 
-    response = client.post(
+    response = await client.post(
         "/webhooks/google-forms",
         json=payload,
-        headers=auth_headers,
+        headers=_AUTH_HEADERS,
     )
-    assert response.status_code == 400
+    assert response.status_code == 400, response.text
     assert response.json()["error"] == "invalid_payload"
 
 
-def test_google_forms_intake_idempotency_uses_submission_payload_fingerprint_when_submission_id_missing(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_idempotency_uses_submission_payload_fingerprint_when_submission_id_missing(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Repeated payloads without submission_id should share a stable idempotency key."""
     payload = {
@@ -1426,22 +1384,21 @@ def test_google_forms_intake_idempotency_uses_submission_payload_fingerprint_whe
     )
 
     with patch.object(api.settings, "google_forms_allowed_form_ids", "form-1,form-2"):
-        with patch("five08.backend.api.enqueue_job") as mock_enqueue:
-            mock_enqueue.return_value = Mock(id="job-intake-1")
-            response_one = client.post(
-                "/webhooks/google-forms",
-                json=payload,
-                headers=auth_headers,
-            )
-            response_two = client.post(
-                "/webhooks/google-forms",
-                json=payload,
-                headers=auth_headers,
-            )
+        mock_enqueue.return_value = SimpleNamespace(id="job-intake-1", created=True)
+        response_one = await client.post(
+            "/webhooks/google-forms",
+            json=payload,
+            headers=_AUTH_HEADERS,
+        )
+        response_two = await client.post(
+            "/webhooks/google-forms",
+            json=payload,
+            headers=_AUTH_HEADERS,
+        )
 
-    assert response_one.status_code == 202
+    assert response_one.status_code == 202, response_one.text
     assert response_one.json()["job_id"] == "job-intake-1"
-    assert response_two.status_code == 202
+    assert response_two.status_code == 202, response_two.text
     assert response_two.json()["job_id"] == "job-intake-1"
 
     call_kwargs_one = mock_enqueue.call_args_list[0].kwargs
@@ -1453,34 +1410,33 @@ def test_google_forms_intake_idempotency_uses_submission_payload_fingerprint_whe
     assert call_kwargs_one["args"][0]["last_name"] == "Doe"
 
 
-def test_google_forms_intake_rejects_invalid_payload(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_rejects_invalid_payload(
+    client: httpx.AsyncClient,
 ) -> None:
     """Google Forms webhook should return 400 for invalid payloads."""
-    response = client.post(
+    response = await client.post(
         "/webhooks/google-forms",
         json={"not_a_valid": "payload"},
-        headers=auth_headers,
+        headers=_AUTH_HEADERS,
     )
-    assert response.status_code == 400
+    assert response.status_code == 400, response.text
     assert response.json()["error"] == "invalid_payload"
 
 
-def test_google_forms_intake_returns_503_on_enqueue_failure(
-    client: TestClient,
-    auth_headers: dict[str, str],
+async def test_google_forms_intake_returns_503_on_enqueue_failure(
+    client: httpx.AsyncClient,
+    mock_enqueue: Mock,
 ) -> None:
     """Google Forms webhook should return 503 when enqueue fails."""
-    with patch("five08.backend.api.enqueue_job", side_effect=RuntimeError("boom")):
-        response = client.post(
-            "/webhooks/google-forms",
-            json={
-                "email": "fail@example.com",
-                "first_name": "Test",
-                "last_name": "User",
-            },
-            headers=auth_headers,
-        )
-    assert response.status_code == 503
+    mock_enqueue.side_effect = RuntimeError("boom")
+    response = await client.post(
+        "/webhooks/google-forms",
+        json={
+            "email": "fail@example.com",
+            "first_name": "Test",
+            "last_name": "User",
+        },
+        headers=_AUTH_HEADERS,
+    )
+    assert response.status_code == 503, response.text
     assert response.json()["error"] == "enqueue_failed"
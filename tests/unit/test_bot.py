@@ -33,7 +33,6 @@ class TestBot508:
         assert bot.command_prefix == "$508$"
         assert bot.intents.value == discord.Intents.all().value
 
-    @pytest.mark.asyncio
     async def test_setup_hook_calls_load_extensions(self):
         """Test that setup_hook calls load_extensions."""
         bot = Bot508()
@@ -42,7 +41,6 @@ class TestBot508:
             await bot.setup_hook()
             mock_load.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_load_extensions_loads_py_files(self):
         """Test that load_extensions loads .py files from features directory."""
         bot = Bot508()
@@ -69,7 +67,6 @@ class TestBot508:
                     "five08.discord_bot.cogs.test_feature"
                 )
 
-    @pytest.mark.asyncio
     async def test_load_extensions_handles_errors(self, caplog):
         """Test that load_extensions handles loading errors gracefully."""
         bot = Bot508()
@@ -88,7 +85,6 @@ class TestBot508:
                 assert "Failed to load cog" in caplog.text
                 assert "broken_feature" in caplog.text
 
-    @pytest.mark.asyncio
     async def test_on_ready_sends_activation_message(self):
         """Test that on_ready sends activation message to webhook."""
         bot = Bot508()
@@ -114,7 +110,6 @@ class TestBot508:
                     sent_content = mock_logger_instance.send.call_args.kwargs["content"]
                     assert "508.dev Bot activated" in sent_content
 
-    @pytest.mark.asyncio
     async def test_on_ready_handles_missing_channel(self, caplog):
         """Test that on_ready handles missing channel gracefully."""
         import logging
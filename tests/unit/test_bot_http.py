@@ -29,7 +29,6 @@ class TestBotHTTPServer:
         assert http_server.runner is None
         assert http_server.site is None
 
-    @pytest.mark.asyncio
     async def test_server_stop_without_start(self, http_server):
         """Stop should handle unstarted server state."""
         await http_server.stop()
@@ -210,7 +210,6 @@ class TestCRMCog:
 
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_combines_skills_and_strengths(
         self, crm_cog
     ):
@@ -239,7 +238,6 @@ class TestCRMCog:
         assert lines[1] == "**GitHub**: `@wumichaelm`"
         assert len(lines) == 2
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_maps_skill_attrs_only_to_skills(
         self, crm_cog
     ):
@@ -256,7 +254,6 @@ class TestCRMCog:
 
         assert collapsed == ["skills", "phoneNumber"]
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_groups_location_fields(self, crm_cog):
         """Applied updates should render location fields as one combined line."""
         view = ResumeUpdateConfirmationView(
@@ -286,7 +283,6 @@ class TestCRMCog:
             "**Location**: `Nanzih, Kaohsiung City, Taiwan (Timezone: UTC+08:00)`"
         ]
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_maps_location_fields_to_location(
         self, crm_cog
     ):
@@ -305,7 +301,6 @@ class TestCRMCog:
 
         assert collapsed == ["location", "phoneNumber"]
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_caps_updated_fields_length(self, crm_cog):
         """Updated Fields text should stay within Discord field limits."""
         view = ResumeUpdateConfirmationView(
@@ -321,7 +316,6 @@ class TestCRMCog:
 
         assert len(summary) <= view._EMBED_FIELD_LIMIT
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_caps_applied_updates_length(self, crm_cog):
         """Applied updates text should stay within Discord field limits."""
         view = ResumeUpdateConfirmationView(
@@ -355,7 +349,6 @@ class TestCRMCog:
         """Seniority labels should normalize consistent display strings."""
         assert _format_seniority_label(raw) == expected
 
-    @pytest.mark.asyncio
     async def test_resume_apply_confirmation_shows_partial_warning(
         self, crm_cog, mock_interaction
     ):
@@ -442,7 +435,6 @@ class TestCRMCog:
         assert technical == []
         assert locality == ["Taiwan"]
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_seniority_select(self, crm_cog):
         """Resume update view should expose a seniority override dropdown."""
         view = ResumeUpdateConfirmationView(
@@ -458,7 +450,6 @@ class TestCRMCog:
             isinstance(child, ResumeSeniorityOverrideSelect) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_seniority_select_last_with_buttons_first(
         self, crm_cog
     ):
@@ -498,7 +489,6 @@ class TestCRMCog:
         assert override_index == len(interactive_children) - 1
         assert all(idx < override_index for idx in button_indices)
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_sets_seniority_override(self, crm_cog):
         """Seniority override should update the proposed CRM payload."""
         view = ResumeUpdateConfirmationView(
@@ -515,7 +505,6 @@ class TestCRMCog:
         assert label == "Staff"
         assert view.proposed_updates["cSeniority"] == "staff"
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_websites_button_when_websites_proposed(
         self, crm_cog
     ):
@@ -532,7 +521,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditWebsitesButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_websites_button_without_websites(
         self, crm_cog
     ):
@@ -549,7 +537,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditWebsitesButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_confirm_websites_button_when_needed(
         self, crm_cog
     ):
@@ -577,7 +564,6 @@ class TestCRMCog:
             for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_reparse_button_for_new_websites(
         self, crm_cog
     ):
@@ -600,7 +586,6 @@ class TestCRMCog:
         )
         assert view.has_reparse_candidates is True
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_reparse_button_for_inferred_github(
         self, crm_cog
     ):
@@ -629,7 +614,6 @@ class TestCRMCog:
             for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_website_edits_override_inferred_candidates(
         self, crm_cog
     ):
@@ -661,7 +645,6 @@ class TestCRMCog:
             for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_social_links_button_when_social_links_proposed(
         self, crm_cog
     ):
@@ -678,7 +661,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditSocialLinksButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_no_social_links_button_without_social_links(
         self, crm_cog
     ):
@@ -695,7 +677,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditSocialLinksButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_skills_button_when_skills_proposed(
         self, crm_cog
     ):
@@ -710,7 +691,6 @@ class TestCRMCog:
 
         assert any(isinstance(child, ResumeEditSkillsButton) for child in view.children)
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_no_skills_button_without_skills(self, crm_cog):
         """Edit Skills button should not appear when skills are absent."""
         view = ResumeUpdateConfirmationView(
@@ -725,7 +705,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditSkillsButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_location_button_when_location_proposed(
         self, crm_cog
     ):
@@ -746,7 +725,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditLocationButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_location_button_without_location(
         self, crm_cog
     ):
@@ -763,7 +741,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditLocationButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_roles_button_when_roles_proposed(
         self, crm_cog
     ):
@@ -778,7 +755,6 @@ class TestCRMCog:
 
         assert any(isinstance(child, ResumeEditRolesButton) for child in view.children)
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_no_roles_button_without_roles(self, crm_cog):
         """Edit Roles button should not appear when cRoles is absent."""
         view = ResumeUpdateConfirmationView(
@@ -793,7 +769,6 @@ class TestCRMCog:
             isinstance(child, ResumeEditRolesButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_adds_discord_roles_buttons_with_suggestions(
         self, crm_cog
     ):
@@ -814,7 +789,6 @@ class TestCRMCog:
             isinstance(child, ResumeApplyDiscordRolesButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_resume_update_view_without_discord_role_suggestions_no_role_buttons(
         self, crm_cog
     ):
@@ -834,7 +808,6 @@ class TestCRMCog:
             isinstance(child, ResumeApplyDiscordRolesButton) for child in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_prepopulates_list_values(self, crm_cog):
         """Edit Websites modal should pre-fill with proposed website list, one per line."""
         view = ResumeUpdateConfirmationView(
@@ -854,7 +827,6 @@ class TestCRMCog:
             == "https://example.com\nhttps://blog.example.com"
         )
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_falls_back_to_existing_websites(self, crm_cog):
         """Existing CRM websites should seed the editor when no website update is proposed."""
         view = ResumeUpdateConfirmationView(
@@ -876,7 +848,6 @@ class TestCRMCog:
             == "https://example.com\nhttps://blog.example.com"
         )
 
-    @pytest.mark.asyncio
     async def test_edit_social_links_modal_prepopulates_list_values(self, crm_cog):
         """Edit Social Links modal should pre-fill with proposed social link list."""
         view = ResumeUpdateConfirmationView(
@@ -896,7 +867,6 @@ class TestCRMCog:
             == "https://linkedin.com/in/user\nhttps://x.com/user"
         )
 
-    @pytest.mark.asyncio
     async def test_edit_location_modal_prepopulates_values(self, crm_cog):
         """Edit Location modal should pre-fill location fields from proposed updates."""
         view = ResumeUpdateConfirmationView(
@@ -919,7 +889,6 @@ class TestCRMCog:
         assert modal.country_input.default == "Taiwan"
         assert modal.timezone_input.default == "UTC+08:00"
 
-    @pytest.mark.asyncio
     async def test_edit_skills_modal_prepopulates_list_values(self, crm_cog):
         """Edit Skills modal should pre-fill with proposed skills + strengths."""
         view = ResumeUpdateConfirmationView(
@@ -937,7 +906,6 @@ class TestCRMCog:
 
         assert modal.skills_input.default == "python: 5\ngo\nrust: 4"
 
-    @pytest.mark.asyncio
     async def test_edit_roles_modal_prepopulates_list_values(self, crm_cog):
         """Edit Roles modal should pre-fill with proposed roles, one per line."""
         view = ResumeUpdateConfirmationView(
@@ -952,7 +920,6 @@ class TestCRMCog:
 
         assert modal.roles_input.default == "developer\nmarketing"
 
-    @pytest.mark.asyncio
     async def test_edit_discord_roles_modal_prepopulates_values(self, crm_cog):
         """Discord Roles modal should pre-fill with suggested role list."""
         view = ResumeUpdateConfirmationView(
@@ -968,7 +935,6 @@ class TestCRMCog:
 
         assert modal.discord_roles_input.default == "Backend\nOperations"
 
-    @pytest.mark.asyncio
     async def test_apply_discord_roles_button_disabled_without_linked_discord_user(
         self, crm_cog
     ):
@@ -989,7 +955,6 @@ class TestCRMCog:
         )
         assert apply_button.disabled is True
 
-    @pytest.mark.asyncio
     async def test_edit_discord_roles_modal_submit_updates_suggested_roles(
         self, crm_cog
     ):
@@ -1025,7 +990,6 @@ class TestCRMCog:
             ephemeral=True,
         )
 
-    @pytest.mark.asyncio
     async def test_edit_discord_roles_modal_submit_keeps_apply_disabled_without_link(
         self, crm_cog
     ):
@@ -1085,7 +1049,6 @@ class TestCRMCog:
         assert embed is not None
         assert all(field.name != "🔒 Link required" for field in embed.fields)
 
-    @pytest.mark.asyncio
     async def test_apply_discord_roles_button_applies_roles_and_reports_results(
         self, crm_cog
     ):
@@ -1173,7 +1136,6 @@ class TestCRMCog:
         assert "Blocked by hierarchy: Blocked" in summary
         assert "Protected roles blocked: Member, Admin, Steering Committee" in summary
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_submit_updates_proposed(
         self, crm_cog, mock_interaction
     ):
@@ -1203,7 +1165,6 @@ class TestCRMCog:
         mock_interaction.followup.send.assert_awaited_once()
         assert "updated to 2 links" in mock_interaction.followup.send.await_args.args[0]
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_submit_skips_noop_existing_websites(
         self, crm_cog, mock_interaction
     ):
@@ -1227,7 +1188,6 @@ class TestCRMCog:
         mock_interaction.followup.send.assert_awaited_once()
         assert "Websites unchanged" in mock_interaction.followup.send.await_args.args[0]
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_submit_skips_reordered_noop_existing_websites(
         self, crm_cog, mock_interaction
     ):
@@ -1250,7 +1210,6 @@ class TestCRMCog:
         mock_interaction.followup.send.assert_awaited_once()
         assert "Websites unchanged" in mock_interaction.followup.send.await_args.args[0]
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_noop_keeps_inferred_reparse_candidates(
         self, crm_cog, mock_interaction
     ):
@@ -1278,7 +1237,6 @@ class TestCRMCog:
 
         assert view.website_reparse_candidates == ["https://portfolio.example.com"]
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_submit_stores_normalized_links(
         self, crm_cog, mock_interaction
     ):
@@ -1300,7 +1258,6 @@ class TestCRMCog:
             "https://other.com",
         ]
 
-    @pytest.mark.asyncio
     async def test_edit_roles_modal_submit_updates_proposed(
         self, crm_cog, mock_interaction
     ):
@@ -1320,7 +1277,6 @@ class TestCRMCog:
         assert view.proposed_updates["cRoles"] == ["developer", "marketing"]
         mock_interaction.response.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_edit_social_links_modal_submit_updates_proposed(
         self, crm_cog, mock_interaction
     ):
@@ -1345,7 +1301,6 @@ class TestCRMCog:
         ]
         mock_interaction.response.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_edit_location_modal_submit_updates_proposed(
         self, crm_cog, mock_interaction
     ):
@@ -1371,7 +1326,6 @@ class TestCRMCog:
         assert view.proposed_updates["cTimezone"] == "UTC+08:00"
         mock_interaction.response.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_edit_location_modal_accepts_timezone_abbreviations(
         self, crm_cog, mock_interaction
     ):
@@ -1391,7 +1345,6 @@ class TestCRMCog:
         assert view.proposed_updates["cTimezone"] == "UTC-08:00"
         mock_interaction.response.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_edit_skills_modal_submit_updates_proposed(
         self, crm_cog, mock_interaction
     ):
@@ -1421,7 +1374,6 @@ class TestCRMCog:
         }
         mock_interaction.response.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_edit_websites_modal_submit_removes_field_when_blank(
         self, crm_cog, mock_interaction
     ):
@@ -1442,7 +1394,6 @@ class TestCRMCog:
         assert "cWebsiteLink" not in view.proposed_updates
         assert view.website_reparse_candidates == []
 
-    @pytest.mark.asyncio
     async def test_edit_social_links_modal_submit_removes_field_when_blank(
         self, crm_cog, mock_interaction
     ):
@@ -1461,7 +1412,6 @@ class TestCRMCog:
 
         assert "cSocialLinks" not in view.proposed_updates
 
-    @pytest.mark.asyncio
     async def test_edit_roles_modal_submit_removes_field_when_blank(
         self, crm_cog, mock_interaction
     ):
@@ -1480,7 +1430,6 @@ class TestCRMCog:
 
         assert "cRoles" not in view.proposed_updates
 
-    @pytest.mark.asyncio
     async def test_edit_location_modal_submit_removes_fields_when_blank(
         self, crm_cog, mock_interaction
     ):
@@ -1510,7 +1459,6 @@ class TestCRMCog:
         assert "addressCountry" not in view.proposed_updates
         assert "cTimezone" not in view.proposed_updates
 
-    @pytest.mark.asyncio
     async def test_edit_skills_modal_submit_removes_fields_when_blank(
         self, crm_cog, mock_interaction
     ):
@@ -1789,7 +1737,6 @@ class TestCRMCog:
             payload["source_enrichments"][0]["url"] == "https://portfolio.example.com"
         )
 
-    @pytest.mark.asyncio
     async def test_edit_websites_button_callback_opens_modal(
         self, crm_cog, mock_interaction
     ):
@@ -1813,7 +1760,6 @@ class TestCRMCog:
         modal_arg = mock_interaction.response.send_modal.call_args[0][0]
         assert isinstance(modal_arg, ResumeEditWebsitesModal)
 
-    @pytest.mark.asyncio
     async def test_edit_social_links_button_callback_opens_modal(
         self, crm_cog, mock_interaction
     ):
@@ -1837,7 +1783,6 @@ class TestCRMCog:
         modal_arg = mock_interaction.response.send_modal.call_args[0][0]
         assert isinstance(modal_arg, ResumeEditSocialLinksModal)
 
-    @pytest.mark.asyncio
     async def test_edit_roles_button_callback_opens_modal(
         self, crm_cog, mock_interaction
     ):
@@ -1859,7 +1804,6 @@ class TestCRMCog:
         modal_arg = mock_interaction.response.send_modal.call_args[0][0]
         assert isinstance(modal_arg, ResumeEditRolesModal)
 
-    @pytest.mark.asyncio
     async def test_edit_location_button_callback_opens_modal(
         self, crm_cog, mock_interaction
     ):
@@ -1883,7 +1827,6 @@ class TestCRMCog:
         modal_arg = mock_interaction.response.send_modal.call_args[0][0]
         assert isinstance(modal_arg, ResumeEditLocationModal)
 
-    @pytest.mark.asyncio
     async def test_download_and_send_resume_success(self, crm_cog, mock_interaction):
         """Test successful resume download and send."""
         # Mock API responses
@@ -1909,7 +1852,6 @@ class TestCRMCog:
         assert "📄 Resume for **John Doe**:" in call_args[0][0]
         assert "file" in call_args[1]
 
-    @pytest.mark.asyncio
     async def test_download_and_send_resume_api_error(self, crm_cog, mock_interaction):
         """Test resume download with API error."""
         crm_cog.espo_api.download_file.side_effect = EspoAPIError("API Error")
@@ -1958,7 +1900,6 @@ class TestCRMCog:
         cache = jobs_cog._get_role_id_cache()
         assert cache[42] == {"frontend": 111, "full stack": 222}
 
-    @pytest.mark.asyncio
     async def test_on_guild_role_update_refreshes_cache(self, jobs_cog):
         """Role update events should refresh the role ID cache."""
         guild = Mock()
@@ -1972,7 +1913,6 @@ class TestCRMCog:
 
         refresh.assert_called_once_with(guild)
 
-    @pytest.mark.asyncio
     async def test_match_candidates_sends_role_and_locality_mentions(
         self, jobs_cog, mock_interaction, mock_member_role
     ):
@@ -2106,7 +2046,6 @@ class TestCRMCog:
         assert_mentions_disabled(candidate_call)
         assert mock_interaction.response.defer.call_args.kwargs["ephemeral"] is False
 
-    @pytest.mark.asyncio
     async def test_match_candidates_private_arg_private_mode(
         self, jobs_cog, mock_interaction, mock_member_role
     ):
@@ -2208,7 +2147,6 @@ class TestCRMCog:
         for call in calls:
             assert call.kwargs["ephemeral"] is True
 
-    @pytest.mark.asyncio
     async def test_match_candidates_private_arg_rejects_falsey_value(
         self, jobs_cog, mock_interaction, mock_member_role
     ):
@@ -2224,7 +2162,6 @@ class TestCRMCog:
         mock_interaction.response.defer.assert_not_called()
         mock_interaction.followup.send.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_search_contacts_success(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -2305,7 +2242,6 @@ class TestCRMCog:
 
         assert target is channel
 
-    @pytest.mark.asyncio
     async def test_register_jobs_channel_updates_cache(
         self, jobs_cog, mock_interaction
     ):
@@ -2343,7 +2279,6 @@ class TestCRMCog:
         )
         assert jobs_cog._jobs_channels_by_guild[guild.id] == {456}
 
-    @pytest.mark.asyncio
     async def test_unregister_jobs_channel_updates_cache(
         self, jobs_cog, mock_interaction
     ):
@@ -2382,7 +2317,6 @@ class TestCRMCog:
         )
         assert jobs_cog._jobs_channels_by_guild[guild.id] == set()
 
-    @pytest.mark.asyncio
     async def test_register_jobs_channel_denies_non_admin(
         self, jobs_cog, mock_interaction
     ):
@@ -2410,7 +2344,6 @@ class TestCRMCog:
 
         to_thread.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_unregister_jobs_channel_denies_non_admin(
         self, jobs_cog, mock_interaction
     ):
@@ -2439,7 +2372,6 @@ class TestCRMCog:
 
         to_thread.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_on_thread_create_skips_non_forum_parent(self, jobs_cog):
         guild = Mock()
         guild.id = 123
@@ -2455,7 +2387,6 @@ class TestCRMCog:
 
         jobs_cog._run_auto_match_candidates_for_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_on_thread_create_skips_unregistered_channel(self, jobs_cog):
         class DummyForumChannel:
             def __init__(self, channel_id: int) -> None:
@@ -2485,7 +2416,6 @@ class TestCRMCog:
 
         jobs_cog._run_auto_match_candidates_for_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_on_thread_create_skips_bot_owner(self, jobs_cog):
         class DummyForumChannel:
             def __init__(self, channel_id: int) -> None:
@@ -2519,7 +2449,6 @@ class TestCRMCog:
 
         jobs_cog._run_auto_match_candidates_for_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_on_thread_create_skips_non_member(self, jobs_cog):
         class DummyForumChannel:
             def __init__(self, channel_id: int) -> None:
@@ -2558,7 +2487,6 @@ class TestCRMCog:
 
         jobs_cog._run_auto_match_candidates_for_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_on_thread_create_skips_public_forum(self, jobs_cog):
         class DummyForumChannel:
             def __init__(self, channel_id: int) -> None:
@@ -2595,7 +2523,6 @@ class TestCRMCog:
 
         jobs_cog._run_auto_match_candidates_for_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_on_ready_runs_startup_sync_once(self, jobs_cog, mock_bot):
         guild = Mock()
         guild.id = 123
@@ -2613,13 +2540,11 @@ class TestCRMCog:
         jobs_cog._refresh_jobs_channel_cache.assert_awaited_once_with(guild.id)
         jobs_cog._bulk_sync_guild_roles.assert_awaited_once_with(guild)
 
-    @pytest.mark.asyncio
     async def test_validate_match_candidates_url_rejects_non_https(self, jobs_cog):
         message = await jobs_cog._validate_match_candidates_url("http://example.com/jd")
 
         assert message == "Job description URL must use https."
 
-    @pytest.mark.asyncio
     async def test_validate_match_candidates_url_rejects_private_hosts(self, jobs_cog):
         message = await jobs_cog._validate_match_candidates_url(
             "https://127.0.0.1/internal"
@@ -2627,7 +2552,6 @@ class TestCRMCog:
 
         assert message == "Job description URL host resolves to a non-public address."
 
-    @pytest.mark.asyncio
     async def test_on_member_update_skips_bot_members(self, jobs_cog):
         before = Mock()
         before.roles = []
@@ -2646,7 +2570,6 @@ class TestCRMCog:
 
         to_thread.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_search_contacts_requires_query_or_skills(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -2660,7 +2583,6 @@ class TestCRMCog:
         )
         crm_cog.espo_api.request.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_search_contacts_skills_only(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -2685,7 +2607,6 @@ class TestCRMCog:
         assert "skills" in select_fields
         assert "cSkillAttrs" in select_fields
 
-    @pytest.mark.asyncio
     async def test_search_contacts_query_and_skills(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -2707,7 +2628,6 @@ class TestCRMCog:
         assert where_filters[1]["attribute"] == "skills"
         assert where_filters[1]["value"] == ["python", "sql"]
 
-    @pytest.mark.asyncio
     async def test_search_contacts_skills_query_normalizes_to_lowercase(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -2732,7 +2652,6 @@ class TestCRMCog:
         )
         assert parsed == {"python": 4, "go": 3}
 
-    @pytest.mark.asyncio
     async def test_format_contact_card_supports_additional_fields(self, crm_cog):
         """Contact cards should include optional extra lines when provided."""
         contact = {
@@ -2760,7 +2679,6 @@ class TestCRMCog:
         assert "🔗 [View in CRM]" in formatted
         assert "🏢 508 Email: john@508.dev" in formatted
 
-    @pytest.mark.asyncio
     async def test_resolve_onboarder_username_normalizes_direct_username(self, crm_cog):
         """Direct 508 username values should normalize to lowercase without domain."""
         resolved = await crm_cog._resolve_onboarder_username(
@@ -2769,7 +2687,6 @@ class TestCRMCog:
 
         assert resolved == "john"
 
-    @pytest.mark.asyncio
     async def test_resolve_onboarder_username_maps_discord_mention(self, crm_cog):
         """Discord mentions should resolve to linked contact 508 usernames."""
         interaction = Mock()
@@ -2785,7 +2702,6 @@ class TestCRMCog:
 
         assert resolved == "mentor"
 
-    @pytest.mark.asyncio
     async def test_resolve_onboarder_username_returns_none_for_unlinked_mention(
         self, crm_cog
     ):
@@ -2803,7 +2719,6 @@ class TestCRMCog:
 
         assert resolved is None
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_success_updates_pending_state(
         self, crm_cog, mock_interaction
     ):
@@ -2843,7 +2758,6 @@ class TestCRMCog:
         assert "onboarding state set to `selected`" in message
         assert "Assigned **jane** as onboarder" in message
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_success_keeps_state_when_not_pending(
         self, crm_cog, mock_interaction
     ):
@@ -2876,7 +2790,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "onboarding state left unchanged" in message
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_multiple_matches_returns_prompt(
         self, crm_cog, mock_interaction
     ):
@@ -2914,7 +2827,6 @@ class TestCRMCog:
             "contacts_found": 2,
         }
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_missing_contact(self, crm_cog, mock_interaction):
         """No matching contact should return a not-found message."""
         steering_role = Mock()
@@ -2943,7 +2855,6 @@ class TestCRMCog:
             "onboarder": "jane",
         }
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_invalid_onboarder_reference(
         self, crm_cog, mock_interaction
     ):
@@ -2975,7 +2886,6 @@ class TestCRMCog:
             "onboarder": "<@987654321>",
         }
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_missing_onboarder_field_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -3015,7 +2925,6 @@ class TestCRMCog:
         assert audit_kwargs["resource_type"] == "crm_contact"
         assert audit_kwargs["resource_id"] == "contact123"
 
-    @pytest.mark.asyncio
     async def test_assign_onboarder_handles_espo_api_error(
         self, crm_cog, mock_interaction
     ):
@@ -3037,7 +2946,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "❌ CRM API error: CRM unavailable" in message
 
-    @pytest.mark.asyncio
     async def test_view_onboarding_queue_lists_open_entries(
         self, crm_cog, mock_interaction
     ):
@@ -3103,7 +3011,6 @@ class TestCRMCog:
         for row in queue_rows:
             assert row.get("status") not in {"onboarded", "waitlist", "rejected"}
 
-    @pytest.mark.asyncio
     async def test_view_onboarding_queue_empty_when_only_excluded(
         self, crm_cog, mock_interaction
     ):
@@ -3136,7 +3043,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "✅ No contacts found in onboarding queue." in message
 
-    @pytest.mark.asyncio
     async def test_view_onboarding_queue_handles_api_error(
         self, crm_cog, mock_interaction
     ):
@@ -3151,7 +3057,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "❌ CRM API error: Queue service down" in message
 
-    @pytest.mark.asyncio
     async def test_view_onboarding_queue_uses_pagination_for_large_queues(
         self, crm_cog, mock_interaction
     ):
@@ -3196,7 +3101,6 @@ class TestCRMCog:
             "2026-03-03T12:00:00Z"
         )
 
-    @pytest.mark.asyncio
     async def test_resume_create_contact_view_cancel_path(
         self, crm_cog, mock_interaction
     ):
@@ -3246,7 +3150,6 @@ class TestCRMCog:
             for item in view.children
         )
 
-    @pytest.mark.asyncio
     async def test_view_skills_self_uses_structured_attrs(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3275,7 +3178,6 @@ class TestCRMCog:
         assert "go (5)" in embed.fields[0].value
         assert "python (4)" in embed.fields[0].value
 
-    @pytest.mark.asyncio
     async def test_view_skills_falls_back_to_skills_when_attrs_unrecoverable(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3302,7 +3204,6 @@ class TestCRMCog:
         assert "sql" in embed.fields[0].value
         assert "/5" not in embed.fields[0].value
 
-    @pytest.mark.asyncio
     async def test_search_contacts_for_view_skills_delegates_to_linking(self, crm_cog):
         """`_search_contacts_for_view_skills` should delegate to `_search_contacts_for_lookup`."""
         expected = [{"id": "contact123"}]
@@ -3316,7 +3217,6 @@ class TestCRMCog:
         assert result == expected
         mock_search.assert_awaited_once_with("john")
 
-    @pytest.mark.asyncio
     async def test_view_skills_multiple_contacts_requires_refine(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3338,7 +3238,6 @@ class TestCRMCog:
         assert "John Doe" in message
         assert "John Smith" in message
 
-    @pytest.mark.asyncio
     async def test_view_skills_self_not_linked(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3354,7 +3253,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Discord account is not linked to a CRM contact" in message
 
-    @pytest.mark.asyncio
     async def test_search_contacts_shows_skill_strengths(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3388,7 +3286,6 @@ class TestCRMCog:
         field_value = embed.fields[0].value
         assert "🧠 Skills: python (5), sql (4), amazon web services" in field_value
 
-    @pytest.mark.asyncio
     async def test_search_contacts_ignores_broken_skill_attrs(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3415,7 +3312,6 @@ class TestCRMCog:
         field_value = embed.fields[0].value
         assert "🧠 Skills: python, sql" in field_value
 
-    @pytest.mark.asyncio
     async def test_search_contacts_no_results(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3430,7 +3326,6 @@ class TestCRMCog:
             "🔍 No contacts found for: `nonexistent`"
         )
 
-    @pytest.mark.asyncio
     async def test_get_resume_success(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3467,7 +3362,6 @@ class TestCRMCog:
         crm_cog.espo_api.download_file.assert_called_once()
         mock_interaction.followup.send.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_resume_contact_not_found(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3484,7 +3378,6 @@ class TestCRMCog:
             "❌ No contact found for: `nonexistent@example.com`"
         )
 
-    @pytest.mark.asyncio
     async def test_get_resume_no_resume_found(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -3511,7 +3404,6 @@ class TestCRMCog:
             "❌ No resume found for John Doe"
         )
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_success(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3572,7 +3464,6 @@ class TestCRMCog:
         call_args = mock_interaction.followup.send.call_args
         assert "embed" in call_args[1]
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_no_change_when_same_discord_info(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3606,7 +3497,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Nothing changed" in message
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_no_change_when_legacy_username_embeds_id(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3639,7 +3529,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Nothing changed" in message
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_requires_confirmation_for_different_discord_id(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3675,7 +3564,6 @@ class TestCRMCog:
         assert "already linked to a different Discord user" in message
         assert isinstance(view, DiscordLinkOverwriteConfirmationView)
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_contact_not_found(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3697,7 +3585,6 @@ class TestCRMCog:
         call_args = mock_interaction.followup.send.call_args
         assert "❌ No contact found" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_name_search(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3742,7 +3629,6 @@ class TestCRMCog:
         assert first_where.get("attribute") == "name"
         assert first_where.get("value") == "john"
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_modern_username(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3781,7 +3667,6 @@ class TestCRMCog:
         assert "cDiscordUserID" in update_call[0][2]
         assert update_call[0][2]["cDiscordUserID"] == "123456789"
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_hex_id_search(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3818,7 +3703,6 @@ class TestCRMCog:
         # Verify success response
         mock_interaction.followup.send.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_email_search(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3862,7 +3746,6 @@ class TestCRMCog:
         assert any(param["attribute"] == "emailAddress" for param in email_searches)
         assert any(param["attribute"] == "c508Email" for param in email_searches)
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_multiple_results(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3904,7 +3787,6 @@ class TestCRMCog:
         embed = call_args[1]["embed"]
         assert "Multiple Contacts Found" in embed.title
 
-    @pytest.mark.asyncio
     async def test_link_discord_user_deduplication(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -3954,7 +3836,6 @@ class TestCRMCog:
         # Should only show 2 unique contacts, not 3
         assert len(embed.fields) == 3  # 2 contacts + tip field
 
-    @pytest.mark.asyncio
     async def test_unlinked_discord_users_with_unlinked_users(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -4019,7 +3900,6 @@ class TestCRMCog:
         assert "<@111111111>" in message_text  # Alice's mention
         assert "<@222222222>" in message_text  # Bob's mention
 
-    @pytest.mark.asyncio
     async def test_unlinked_discord_users_all_linked(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -4056,7 +3936,6 @@ class TestCRMCog:
         message_text = call_args[0][0]
         assert "All Members Linked" in message_text
 
-    @pytest.mark.asyncio
     async def test_unlinked_discord_users_no_guild(
         self, crm_cog, mock_interaction, mock_admin_role
     ):
@@ -4226,7 +4105,6 @@ class TestCRMCog:
         } in filters
         assert not any(filter_["attribute"] == "name" for filter_ in filters)
 
-    @pytest.mark.asyncio
     async def test_search_contacts_for_lookup_includes_discord_username_filter_when_requested(
         self, crm_cog
     ):
@@ -4245,7 +4123,6 @@ class TestCRMCog:
             "value": "john",
         } in where_filters
 
-    @pytest.mark.asyncio
     async def test_search_contacts_for_lookup_spaced_name_uses_wider_default_max_size(
         self, crm_cog
     ):
@@ -4257,7 +4134,6 @@ class TestCRMCog:
         call = crm_cog.espo_api.request.call_args.args
         assert call[2]["maxSize"] == 10
 
-    @pytest.mark.asyncio
     async def test_search_contacts_by_field_includes_requested_field_and_excludes_default(
         self, crm_cog
     ):
@@ -4279,7 +4155,6 @@ class TestCRMCog:
         assert "cLinkedIn" in select_fields
         assert "cLinkedInUrl" not in select_fields
 
-    @pytest.mark.asyncio
     async def test_crm_status_success(self, crm_cog, mock_interaction):
         """Test successful CRM status check."""
         crm_cog.espo_api.request.return_value = {"user": {"name": "Test User"}}
@@ -4289,7 +4164,6 @@ class TestCRMCog:
         crm_cog.espo_api.request.assert_called_once_with("GET", "App/user")
         mock_interaction.followup.send.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_crm_status_api_error(self, crm_cog, mock_interaction):
         """Test CRM status check with API error."""
         crm_cog.espo_api.request.side_effect = EspoAPIError("Connection failed")
@@ -4374,7 +4248,6 @@ class TestCRMCog:
         assert '"amazon web services":{"strength":3}' in merged_attrs
         assert '"go":{"strength":3}' in merged_attrs
 
-    @pytest.mark.asyncio
     async def test_update_contact_success_self_updates_multiple_fields(
         self, crm_cog, mock_interaction
     ):
@@ -4419,7 +4292,6 @@ class TestCRMCog:
             == "✅ Contact Updated"
         )
 
-    @pytest.mark.asyncio
     async def test_update_contact_success_updates_location_hours_website(
         self, crm_cog, mock_interaction
     ):
@@ -4456,7 +4328,6 @@ class TestCRMCog:
         assert any("example.com" in link for link in update_payload["cWebsiteLink"])
         assert any("github.com/test" in link for link in update_payload["cWebsiteLink"])
 
-    @pytest.mark.asyncio
     async def test_update_contact_parses_state_country_location(
         self, crm_cog, mock_interaction
     ):
@@ -4486,7 +4357,6 @@ class TestCRMCog:
         assert update_payload["addressCountry"] == "United States"
         assert "addressCity" not in update_payload
 
-    @pytest.mark.asyncio
     async def test_update_contact_parses_city_region_country_location(
         self, crm_cog, mock_interaction
     ):
@@ -4516,7 +4386,6 @@ class TestCRMCog:
         assert update_payload["addressState"] == "Kaohsiung City"
         assert update_payload["addressCountry"] == "Taiwan"
 
-    @pytest.mark.asyncio
     async def test_update_contact_rejects_invalid_desired_hours(
         self, crm_cog, mock_interaction
     ):
@@ -4538,7 +4407,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Invalid desired_hours" in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_permission_denied_for_other_without_steering(
         self, crm_cog, mock_interaction, mock_member_role
     ):
@@ -4555,7 +4423,6 @@ class TestCRMCog:
         assert "Steering Committee role or higher" in message
         assert "❌" in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_success_other_with_permission(
         self, crm_cog, mock_interaction
     ):
@@ -4587,7 +4454,6 @@ class TestCRMCog:
             == "✅ Contact Updated"
         )
 
-    @pytest.mark.asyncio
     async def test_update_contact_multiple_contacts_found(
         self, crm_cog, mock_interaction
     ):
@@ -4630,7 +4496,6 @@ class TestCRMCog:
             message = call_args[0][0]
             assert "❌ Multiple contacts found for `john`." in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_rejects_invalid_skill_format(
         self, crm_cog, mock_interaction
     ):
@@ -4650,7 +4515,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Invalid skill entries" in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_requires_updates(self, crm_cog, mock_interaction):
         """Reject command if no updatable arguments are supplied."""
         await crm_cog.update_contact.callback(crm_cog, mock_interaction)
@@ -4659,7 +4523,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Provide at least one of" in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_uses_clinkedin_field(self, crm_cog, mock_interaction):
         """LinkedIn updates should flow through the cLinkedIn field and embed."""
         mock_interaction.user.id = 123456789
@@ -4691,7 +4554,6 @@ class TestCRMCog:
         )
         assert linkedin_value == "https://www.linkedin.com/in/test-user/"
 
-    @pytest.mark.asyncio
     async def test_update_contact_self_not_linked(self, crm_cog, mock_interaction):
         """Self update without a linked CRM contact should return a helpful error."""
         mock_interaction.user.id = 123456789
@@ -4707,7 +4569,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "Discord account is not linked to a CRM contact" in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_upload_resume_only(self, crm_cog, mock_interaction):
         """Resume upload should trigger the attachment workflow."""
         mock_interaction.user.id = 123456789
@@ -4739,7 +4600,6 @@ class TestCRMCog:
         assert kwargs["contact"]["id"] == "contact123"
         assert kwargs["target_scope"] == "self"
 
-    @pytest.mark.asyncio
     async def test_update_contact_resume_rejects_txt_file(
         self, crm_cog, mock_interaction
     ):
@@ -4778,7 +4638,6 @@ class TestCRMCog:
             "reason": "invalid_file_type",
         }
 
-    @pytest.mark.asyncio
     async def test_update_contact_unexpected_exception(self, crm_cog, mock_interaction):
         """Unexpected exceptions should return a useful message."""
         mock_interaction.user.id = 123456789
@@ -4798,7 +4657,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args[0][0]
         assert "❌ An unexpected error occurred while updating the contact." in message
 
-    @pytest.mark.asyncio
     async def test_update_contact_api_error(self, crm_cog, mock_interaction):
         """CRM errors should surface and stop with an error response."""
         mock_interaction.user.id = 123456789
@@ -4889,7 +4747,6 @@ class TestCRMCog:
         put_call = crm_cog.espo_api.request.call_args_list[1]
         assert put_call[0][2]["resumeIds"] == ["new_attachment_id"]
 
-    @pytest.mark.asyncio
     async def test_update_contact_resume_overwrite_mode(
         self, crm_cog, mock_interaction
     ):
@@ -5308,7 +5165,6 @@ class TestCRMCog:
         )
         extract_profile.assert_called_once_with("Jane Doe\njane@example.com")
 
-    @pytest.mark.asyncio
     async def test_upload_resume_link_user_shows_confirm_then_creates_contact(
         self, crm_cog, mock_interaction
     ):
@@ -5416,7 +5272,6 @@ class TestCRMCog:
             assert audit_kwargs["metadata"]["reason"] == "discord_not_linked"
             assert audit_kwargs["metadata"]["target_scope"] == "other"
 
-    @pytest.mark.asyncio
     async def test_upload_resume_search_term_not_found_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5471,7 +5326,6 @@ class TestCRMCog:
         assert audit_kwargs["metadata"]["search_term"] == "missing-contact"
         assert audit_kwargs["metadata"]["contact_found"] is False
 
-    @pytest.mark.asyncio
     async def test_upload_resume_self_not_linked_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5515,7 +5369,6 @@ class TestCRMCog:
         assert audit_kwargs["result"] == "error"
         assert audit_kwargs["metadata"]["target_scope"] == "self"
 
-    @pytest.mark.asyncio
     async def test_upload_resume_invalid_file_type_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5552,7 +5405,6 @@ class TestCRMCog:
             "reason": "invalid_file_type",
         }
 
-    @pytest.mark.asyncio
     async def test_upload_resume_rejects_doc_file(self, crm_cog, mock_interaction):
         """DOC files should be rejected when they are not parser-supported."""
         mock_interaction.user.id = 101
@@ -5583,7 +5435,6 @@ class TestCRMCog:
             "reason": "invalid_file_type",
         }
 
-    @pytest.mark.asyncio
     async def test_upload_resume_file_too_large_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5621,7 +5472,6 @@ class TestCRMCog:
             "reason": "file_too_large",
         }
 
-    @pytest.mark.asyncio
     async def test_upload_resume_search_term_multiple_matches_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5685,7 +5535,6 @@ class TestCRMCog:
             "reason": "multiple_contacts",
         }
 
-    @pytest.mark.asyncio
     async def test_upload_resume_inferred_multiple_matches_records_error(
         self, crm_cog, mock_interaction
     ):
@@ -5747,7 +5596,6 @@ class TestCRMCog:
             "inferred_value": "jane@example.com",
         }
 
-    @pytest.mark.asyncio
     async def test_upload_resume_no_matching_inferred_contact_shows_name_and_email(
         self, crm_cog, mock_interaction
     ):
@@ -5807,7 +5655,6 @@ class TestCRMCog:
         )
         assert "view" in mock_interaction.followup.send.call_args.kwargs
 
-    @pytest.mark.asyncio
     async def test_upload_resume_reuses_inferred_hints_in_failure_summaries(
         self, crm_cog, mock_interaction
     ):
@@ -5880,7 +5727,6 @@ class TestCRMCog:
             == inferred_hints
         )
 
-    @pytest.mark.asyncio
     async def test_resume_create_contact_view_logs_create_failure(
         self, crm_cog, mock_interaction
     ):
@@ -5950,7 +5796,6 @@ class TestCRMCog:
         )
         assert "Please provide `search_term` or `link_user`." in failure_message
 
-    @pytest.mark.asyncio
     async def test_resume_create_contact_view_sanitizes_long_error_details(
         self, crm_cog, mock_interaction
     ):
@@ -6007,7 +5852,6 @@ class TestCRMCog:
         assert "\t" not in failure_message
         assert len(sanitized) <= 1900
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_shows_confirmation(
         self, crm_cog, mock_interaction
     ):
@@ -6064,7 +5908,6 @@ class TestCRMCog:
         assert view.filename == "candidate.pdf"
         assert view.has_resume is True
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_without_resume_uses_crm_sources(
         self, crm_cog, mock_interaction
     ):
@@ -6109,7 +5952,6 @@ class TestCRMCog:
         assert view.filename == "CRM website/GitHub sources"
         assert view.has_resume is False
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_shows_no_contact_message(
         self, crm_cog, mock_interaction
     ):
@@ -6138,7 +5980,6 @@ class TestCRMCog:
             "❌ No contact found for: `missing-user`"
         )
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_shows_multiple_contacts_selector(
         self, crm_cog, mock_interaction
     ):
@@ -6194,7 +6035,6 @@ class TestCRMCog:
         assert "📄 Resume: on file" in embed.fields[0].value
         assert "📄 Resume: missing" in embed.fields[1].value
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_selection_button_without_resume_hands_off_to_upload(
         self, crm_cog
     ):
@@ -6236,7 +6076,6 @@ class TestCRMCog:
         crm_cog._prompt_upload_resume_for_contact.assert_awaited_once()
         crm_cog._prompt_reprocess_resume_confirmation.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_prompt_upload_resume_for_contact_shows_upload_resume_instructions(
         self, crm_cog, mock_interaction
     ):
@@ -6255,7 +6094,6 @@ class TestCRMCog:
         assert "`contact123`" in message
         assert "Candidate User" in message
 
-    @pytest.mark.asyncio
     async def test_prompt_upload_resume_for_contact_rejects_missing_contact_id(
         self, crm_cog, mock_interaction
     ):
@@ -6272,7 +6110,6 @@ class TestCRMCog:
             "❌ Contact ID not found."
         )
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_exact_match_without_resume_hands_off_to_upload(
         self, crm_cog, mock_interaction
     ):
@@ -6311,7 +6148,6 @@ class TestCRMCog:
         crm_cog._prompt_upload_resume_for_contact.assert_awaited_once()
         crm_cog._prompt_reprocess_resume_confirmation.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_invalid_github_without_resume_hands_off_to_upload(
         self, crm_cog, mock_interaction
     ):
@@ -6352,7 +6188,6 @@ class TestCRMCog:
         crm_cog._prompt_upload_resume_for_contact.assert_awaited_once()
         crm_cog._prompt_reprocess_resume_confirmation.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_reprocess_profile_requires_steering(self, crm_cog, mock_interaction):
         """Non-steering users cannot reprocess profiles."""
         mock_interaction.user.id = 101
@@ -6373,7 +6208,6 @@ class TestCRMCog:
         message = mock_interaction.followup.send.call_args.args[0]
         assert "You must have Steering Committee role or higher" in message
 
-    @pytest.mark.asyncio
     async def test_reprocess_confirmation_view_calls_reprocess_preview(
         self, crm_cog, mock_interaction
     ):
@@ -6418,7 +6252,6 @@ class TestCRMCog:
             == "🔄 Reprocessing profile inputs and extracting profile fields now..."
         )
 
-    @pytest.mark.asyncio
     async def test_confirm_inferred_websites_button_reruns_preview(self, crm_cog):
         """Confirming inferred websites should rerun extraction with those URLs."""
         crm_cog._run_resume_extract_and_preview = AsyncMock(return_value=True)
@@ -6496,7 +6329,6 @@ class TestCRMCog:
         )
         confirm_interaction.message.edit.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_confirm_inferred_websites_button_keeps_view_on_reparse_failure(
         self, crm_cog
     ):
@@ -6547,7 +6379,6 @@ class TestCRMCog:
         )
         confirm_interaction.message.edit.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_sync_message_view_rebuilds_preview_embed_for_websites(self, crm_cog):
         """Website edits should refresh the preview embed, not only the controls."""
         role_embed = discord.Embed(title="Role Suggestions")
@@ -6608,7 +6439,6 @@ class TestCRMCog:
         assert "Reparse With New Sources" in reparse_field.value
         assert all(field.name != "External Sources" for field in embeds[0].fields)
 
-    @pytest.mark.asyncio
     async def test_run_resume_extract_and_preview_calls_direct_extract_for_reprocess(
         self, crm_cog, mock_interaction
     ):
@@ -6638,7 +6468,6 @@ class TestCRMCog:
             confirmed_github_usernames=None,
         )
 
-    @pytest.mark.asyncio
     async def test_build_match_candidates_posting_fetches_jd_links_from_text(
         self, jobs_cog
     ):
@@ -6662,7 +6491,6 @@ class TestCRMCog:
         assert metadata["links_discovered"] == 2
         assert metadata["links_fetched"] == 1
 
-    @pytest.mark.asyncio
     async def test_build_match_candidates_posting_does_not_fetch_non_jd_links(
         self, jobs_cog
     ):
@@ -6684,7 +6512,6 @@ class TestCRMCog:
         assert metadata["links_discovered"] == 1
         assert metadata["links_fetched"] == 0
 
-    @pytest.mark.asyncio
     async def test_build_match_candidates_posting_scans_attachments_for_jd_links(
         self, jobs_cog
     ):
@@ -6719,7 +6546,6 @@ class TestCRMCog:
         assert metadata["attachments_extracted"] == 1
         assert metadata["links_fetched"] == 1
 
-    @pytest.mark.asyncio
     async def test_send_member_agreement_sends_submission(
         self, crm_cog, mock_interaction
     ):
@@ -6756,7 +6582,6 @@ class TestCRMCog:
         assert audit_kwargs["result"] == "success"
         assert audit_kwargs["metadata"]["submission_id"] == 4200
 
-    @pytest.mark.asyncio
     async def test_send_member_agreement_warns_when_already_signed(
         self, crm_cog, mock_interaction
     ):
@@ -6790,7 +6615,6 @@ class TestCRMCog:
         assert audit_kwargs["result"] == "denied"
         assert audit_kwargs["metadata"]["reason"] == "already_signed"
 
-    @pytest.mark.asyncio
     async def test_send_member_agreement_requires_contact_email(
         self, crm_cog, mock_interaction
     ):
@@ -6822,7 +6646,6 @@ class TestCRMCog:
         assert audit_kwargs["result"] == "denied"
         assert audit_kwargs["metadata"]["reason"] == "missing_email"
 
-    @pytest.mark.asyncio
     async def test_send_member_agreement_search_includes_discord_username(
         self, crm_cog
     ):
@@ -6872,14 +6695,12 @@ class TestCRMCog:
 class TestResumeButtonView:
     """Tests for ResumeButtonView class."""
 
-    @pytest.mark.asyncio
     async def test_button_view_initialization(self):
         """Test ResumeButtonView initialization."""
         view = ResumeButtonView()
         assert view.timeout == 300
         assert len(view.children) == 0
 
-    @pytest.mark.asyncio
     async def test_add_resume_button(self):
         """Test adding resume button to view."""
         view = ResumeButtonView()
@@ -6891,7 +6712,6 @@ class TestResumeButtonView:
         assert button.contact_name == "John Doe"
         assert button.resume_id == "resume123"
 
-    @pytest.mark.asyncio
     async def test_add_resume_button_limit(self):
         """Test that view respects 5 button limit."""
         view = ResumeButtonView()
@@ -6925,7 +6745,6 @@ class TestResumeDownloadButton:
         assert len(button.label) <= 80
         assert button.label.endswith("...")
 
-    @pytest.mark.asyncio
     async def test_button_callback_success(self):
         """Test successful button callback."""
         button = ResumeDownloadButton("John Doe", "resume123")
@@ -6956,7 +6775,6 @@ class TestResumeDownloadButton:
             mock_interaction, "John Doe", "resume123"
         )
 
-    @pytest.mark.asyncio
     async def test_button_callback_no_member_role(self):
         """Test button callback without Member role."""
         button = ResumeDownloadButton("John Doe", "resume123")
@@ -6986,7 +6804,6 @@ class TestResumeDownloadButton:
             "❌ You must have the Member role to download resumes.", ephemeral=True
         )
 
-    @pytest.mark.asyncio
     async def test_button_callback_no_cog(self):
         """Test button callback when CRM cog not available."""
         button = ResumeDownloadButton("John Doe", "resume123")
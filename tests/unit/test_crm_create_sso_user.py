@@ -37,7 +37,6 @@ def cog(mock_espo_api: Mock) -> CRMCog:
     return CRMCog(Mock())
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_creates_links_and_sends_recovery_email(
     cog: CRMCog, mock_interaction: AsyncMock, mock_espo_api: Mock
 ) -> None:
@@ -99,7 +98,6 @@ async def test_create_sso_user_creates_links_and_sends_recovery_email(
     assert mock_audit.call_args.kwargs["metadata"]["freshly_created"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_links_existing_user_without_recovery_email(
     cog: CRMCog, mock_interaction: AsyncMock, mock_espo_api: Mock
 ) -> None:
@@ -144,7 +142,6 @@ async def test_create_sso_user_links_existing_user_without_recovery_email(
     assert mock_interaction.followup.send.call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_rejects_superuser_match(
     cog: CRMCog, mock_interaction: AsyncMock
 ) -> None:
@@ -179,7 +176,6 @@ async def test_create_sso_user_rejects_superuser_match(
     assert mock_interaction.followup.send.call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_respects_already_linked_non_superuser(
     cog: CRMCog, mock_interaction: AsyncMock, mock_espo_api: Mock
 ) -> None:
@@ -218,7 +214,6 @@ async def test_create_sso_user_respects_already_linked_non_superuser(
     assert mock_interaction.followup.send.call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_rejects_mismatched_email_style_username(
     cog: CRMCog, mock_interaction: AsyncMock
 ) -> None:
@@ -252,7 +247,6 @@ async def test_create_sso_user_rejects_mismatched_email_style_username(
     assert "Matched Authentik username does not match" in message
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_reports_partial_success_when_crm_update_fails(
     cog: CRMCog, mock_interaction: AsyncMock, mock_espo_api: Mock
 ) -> None:
@@ -295,7 +289,6 @@ async def test_create_sso_user_reports_partial_success_when_crm_update_fails(
     assert audit_metadata["partial_success"] == "sso_created_crm_update_failed"
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_reports_partial_success_when_local_validation_fails(
     cog: CRMCog, mock_interaction: AsyncMock
 ) -> None:
@@ -336,7 +329,6 @@ async def test_create_sso_user_reports_partial_success_when_local_validation_fai
     assert audit_metadata["partial_success"] == "sso_created_validation_failed"
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_reconciles_user_after_create_error(
     cog: CRMCog, mock_interaction: AsyncMock, mock_espo_api: Mock
 ) -> None:
@@ -390,7 +382,6 @@ async def test_create_sso_user_reconciles_user_after_create_error(
     mock_audit.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_create_sso_user_shows_selection_view_for_multiple_contacts(
     cog: CRMCog, mock_interaction: AsyncMock
 ) -> None:
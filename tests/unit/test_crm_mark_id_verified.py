@@ -1,10 +1,10 @@
 """Tests for the mark-id-verified command."""
 
-from datetime import date
-
+from collections.abc import Callable
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
+from freezegun import freeze_time
 
 from five08.discord_bot.cogs.crm import (
     CRMCog,
@@ -15,6 +15,44 @@ from five08.discord_bot.cogs.crm import (
 )
 
 
+_CONTACT = {"id": "contact-123", "name": "Caleb", "c508Email": "caleb@508.dev"}
+_CALEB_MATCHES = [
+    {"id": "c1", "name": "Caleb", "c508Email": "caleb@508.dev"},
+    {"id": "c2", "name": "Caleb B", "c508Email": "calebb@508.dev"},
+]
+
+
+def _expect_id_fields_updated(crm_cog: CRMCog, interaction: Mock) -> None:
+    crm_cog.espo_api.request.assert_has_calls(
+        [
+            call("GET", "Contact/contact-123"),
+            call(
+                "PUT",
+                "Contact/contact-123",
+                {
+                    ID_VERIFIED_AT_FIELD: "2026-02-26",
+                    ID_VERIFIED_BY_FIELD: "caleb",
+                },
+            ),
+        ]
+    )
+    kwargs = interaction.followup.send.call_args.kwargs
+    assert "embed" in kwargs
+    assert "ID Verified" in kwargs["embed"].title
+
+
+def _expect_contact_selector(crm_cog: CRMCog, interaction: Mock) -> None:
+    crm_cog.espo_api.request.assert_not_called()
+    kwargs = interaction.followup.send.call_args.kwargs
+    assert isinstance(kwargs["view"], MarkIdVerifiedSelectionView)
+    assert kwargs["embed"].title == "🔍 Multiple Contacts Found"
+
+
+def _expect_invalid_date_message(crm_cog: CRMCog, interaction: Mock) -> None:
+    assert interaction.followup.send.call_args.args[0].startswith("❌ Invalid")
+    crm_cog.espo_api.request.assert_not_called()
+
+
 class TestMarkIdVerifiedCommand:
     """Unit tests for mark-id-verified flow."""
 
@@ -61,18 +99,21 @@ class TestMarkIdVerifiedCommand:
         member.name = "Caleb Rogers"
         return member
 
-    @pytest.mark.asyncio
-    async def test_parse_verified_at_variants(self, crm_cog):
-        assert await crm_cog._parse_verified_at(None) == date.today().isoformat()
-        assert await crm_cog._parse_verified_at("March 5, 2026") == "2026-03-05"
-        assert await crm_cog._parse_verified_at("4/5/2026") == "2026-05-04"
+    @freeze_time("2026-01-15")
+    async def test_parse_verified_at_defaults_to_today(self, crm_cog):
+        assert await crm_cog._parse_verified_at(None) == "2026-01-15"
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("March 5, 2026", "2026-03-05"), ("4/5/2026", "2026-05-04")],
+    )
+    async def test_parse_verified_at_variants(self, crm_cog, raw, expected):
+        assert await crm_cog._parse_verified_at(raw) == expected
 
-    @pytest.mark.asyncio
     async def test_parse_verified_at_invalid_format(self, crm_cog):
         with pytest.raises(ValueError, match="Invalid verified_at format"):
             await crm_cog._parse_verified_at("not-a-date")
 
-    @pytest.mark.asyncio
     async def test_search_contacts_for_mark_id_verification_delegates_to_linking(
         self, crm_cog
     ):
@@ -88,7 +129,6 @@ class TestMarkIdVerifiedCommand:
         assert result == expected
         mock_search.assert_awaited_once_with("john")
 
-    @pytest.mark.asyncio
     async def test_resolve_verified_by_from_discord_mention(
         self,
         crm_cog,
@@ -105,7 +145,6 @@ class TestMarkIdVerifiedCommand:
 
         assert resolved == "caleb"
 
-    @pytest.mark.asyncio
     async def test_resolve_verified_by_from_invoker_via_discord_id(
         self,
         crm_cog,
@@ -122,7 +161,6 @@ class TestMarkIdVerifiedCommand:
             mock_interaction.user
         )
 
-    @pytest.mark.asyncio
     async def test_resolve_verified_by_from_invoker_via_discord_username_fallback(
         self,
         crm_cog,
@@ -140,51 +178,6 @@ class TestMarkIdVerifiedCommand:
             mock_interaction.user
         )
 
-    @pytest.mark.asyncio
-    async def test_mark_id_verified_single_contact_updates_id_fields(
-        self,
-        crm_cog,
-        mock_interaction,
-    ):
-        contact = {
-            "id": "contact-123",
-            "name": "Caleb",
-            "c508Email": "caleb@508.dev",
-        }
-        crm_cog._search_contacts_for_mark_id_verification = AsyncMock(
-            return_value=[contact]
-        )
-        crm_cog.espo_api.request.side_effect = [
-            {ID_VERIFIED_BY_FIELD: "", ID_VERIFIED_AT_FIELD: ""},
-            {"id": "contact-123"},
-        ]
-
-        await crm_cog.mark_id_verified.callback(
-            crm_cog,
-            mock_interaction,
-            "caleb",
-            "caleb",
-            "2026-02-26",
-        )
-
-        crm_cog.espo_api.request.assert_has_calls(
-            [
-                call("GET", "Contact/contact-123"),
-                call(
-                    "PUT",
-                    "Contact/contact-123",
-                    {
-                        ID_VERIFIED_AT_FIELD: "2026-02-26",
-                        ID_VERIFIED_BY_FIELD: "caleb",
-                    },
-                ),
-            ]
-        )
-        args, kwargs = mock_interaction.followup.send.call_args
-        assert "embed" in kwargs
-        assert "ID Verified" in kwargs["embed"].title
-
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "current_values",
         [
@@ -226,46 +219,37 @@ class TestMarkIdVerifiedCommand:
         assert "already ID verified" in args[0]
         assert kwargs["view"].__class__ is MarkIdVerifiedOverwriteConfirmationView
 
-    @pytest.mark.asyncio
-    async def test_mark_id_verified_multiple_contacts_shows_selector(
+    @pytest.mark.parametrize(
+        ("search_result", "verified_at", "expect"),
+        [
+            ([_CONTACT], "2026-02-26", _expect_id_fields_updated),
+            (_CALEB_MATCHES, "2026-02-26", _expect_contact_selector),
+            ([], "bogus-date", _expect_invalid_date_message),
+        ],
+        ids=["single", "multi", "bad-date"],
+    )
+    async def test_mark_id_verified_dispatches_on_search_result(
         self,
         crm_cog,
         mock_interaction,
+        search_result: list[dict[str, str]],
+        verified_at: str,
+        expect: Callable[[CRMCog, Mock], None],
     ):
         crm_cog._search_contacts_for_mark_id_verification = AsyncMock(
-            return_value=[
-                {"id": "c1", "name": "Caleb", "c508Email": "caleb@508.dev"},
-                {"id": "c2", "name": "Caleb B", "c508Email": "calebb@508.dev"},
-            ]
-        )
-
-        await crm_cog.mark_id_verified.callback(
-            crm_cog,
-            mock_interaction,
-            "caleb",
-            "Caleb",
-            "2026-02-26",
+            return_value=search_result
         )
+        crm_cog.espo_api.request.side_effect = [
+            {ID_VERIFIED_BY_FIELD: "", ID_VERIFIED_AT_FIELD: ""},
+            {"id": "contact-123"},
+        ]
 
-        crm_cog.espo_api.request.assert_not_called()
-        args, kwargs = mock_interaction.followup.send.call_args
-        assert "view" in kwargs
-        assert isinstance(kwargs["view"], MarkIdVerifiedSelectionView)
-        assert kwargs["embed"].title == "🔍 Multiple Contacts Found"
-
-    @pytest.mark.asyncio
-    async def test_mark_id_verified_invalid_date_sends_message(
-        self,
-        crm_cog,
-        mock_interaction,
-    ):
         await crm_cog.mark_id_verified.callback(
             crm_cog,
             mock_interaction,
             "caleb",
             verified_by="caleb",
-            verified_at="bogus-date",
+            verified_at=verified_at,
         )
 
-        assert mock_interaction.followup.send.call_args.args[0].startswith("❌ Invalid")
-        crm_cog.espo_api.request.assert_not_called()
+        expect(crm_cog, mock_interaction)
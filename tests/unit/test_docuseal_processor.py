@@ -3,7 +3,8 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from five08.clients.espo import EspoAPIError
+from five08.clients.espo import EspoAPIError, EspoClient
+from five08.worker.crm import docuseal_processor
 from five08.worker.crm.docuseal_processor import (
     DocusealAgreementNonRetryableError,
     DocusealAgreementProcessingError,
@@ -12,25 +13,40 @@ from five08.worker.crm.docuseal_processor import (
 from five08.clients.discord_bot import DiscordBotAPIError
 from five08.worker.masking import mask_email
 
+_MASKED = {
+    email: mask_email(email)
+    for email in ("member@508.dev", "missing@508.dev", "broken@508.dev")
+}
 
-def test_docuseal_processor_marks_member_agreement_signed_timestamp() -> None:
+
+@pytest.fixture(autouse=True)
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Route the processor's EspoClient construction to a per-test Mock."""
+    api = Mock(spec=EspoClient)
+    monkeypatch.setattr(docuseal_processor, "EspoClient", lambda *_args: api)
+    return api
+
+
+def test_docuseal_processor_marks_member_agreement_signed_timestamp(
+    mock_api: Mock,
+) -> None:
     """Processor should update the member agreement signed-at timestamp."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1", "name": "Jane Doe", "cDiscordUserID": "1234"}]},
         {"updated": True},
     ]
     expected_email = "member@508.dev"
-    expected_masked = mask_email(expected_email)
+    expected_masked = _MASKED[expected_email]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             "top-secret",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement",
+        patch.object(
+            docuseal_processor,
+            "grant_member_role_for_signed_agreement",
             return_value={"status": "applied", "role": "Member"},
         ) as mock_grant_role,
     ):
@@ -42,10 +58,11 @@ def test_docuseal_processor_marks_member_agreement_signed_timestamp() -> None:
         )
 
     assert mock_api.request.call_count == 2
-    assert mock_api.request.call_args_list[1].args[1] == "Contact/contact-1"
-    assert mock_api.request.call_args_list[1].args[2] == {
-        "cMemberAgreementSignedAt": "2026-02-25 12:00:00",
-    }
+    mock_api.request.assert_called_with(
+        "PUT",
+        "Contact/contact-1",
+        {"cMemberAgreementSignedAt": "2026-02-25 12:00:00"},
+    )
     assert result["success"] is True
     assert result["masked_email"] == expected_masked
     assert result["contact_id"] == "contact-1"
@@ -65,18 +82,18 @@ def test_docuseal_processor_marks_member_agreement_signed_timestamp() -> None:
     assert "email" not in result
 
 
-def test_docuseal_processor_normalizes_completed_at_to_utc_timestamp() -> None:
+def test_docuseal_processor_normalizes_completed_at_to_utc_timestamp(
+    mock_api: Mock,
+) -> None:
     """Processor should convert a UTC-offset timestamp before writing CRM."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1"}]},
         {"updated": True},
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement"
+        patch.object(
+            docuseal_processor, "grant_member_role_for_signed_agreement"
         ) as mock_grant_role,
     ):
         processor = DocusealAgreementProcessor()
@@ -86,35 +103,39 @@ def test_docuseal_processor_normalizes_completed_at_to_utc_timestamp() -> None:
             submission_id=416,
         )
 
-    assert mock_api.request.call_args_list[1].args[2] == {
-        "cMemberAgreementSignedAt": "2026-03-02 08:02:30",
-    }
+    mock_api.request.assert_called_with(
+        "PUT",
+        "Contact/contact-1",
+        {"cMemberAgreementSignedAt": "2026-03-02 08:02:30"},
+    )
     assert result["completed_at"] == "2026-03-02 08:02:30"
     assert result["member_role"]["status"] == "not_linked"
     mock_grant_role.assert_not_called()
 
 
-def test_docuseal_processor_skips_role_grant_without_bot_base_url() -> None:
+def test_docuseal_processor_skips_role_grant_without_bot_base_url(
+    mock_api: Mock,
+) -> None:
     """Missing bot base URL should be reported without calling the bot client."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1", "cDiscordUserID": "1234"}]},
         {"updated": True},
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch("five08.worker.crm.docuseal_processor.logger.warning") as mock_warning,
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.discord_bot_internal_base_url",
+        patch.object(docuseal_processor.logger, "warning") as mock_warning,
+        patch.object(
+            docuseal_processor.settings,
+            "discord_bot_internal_base_url",
             " ",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             "top-secret",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement"
+        patch.object(
+            docuseal_processor, "grant_member_role_for_signed_agreement"
         ) as mock_grant_role,
     ):
         processor = DocusealAgreementProcessor()
@@ -134,23 +155,22 @@ def test_docuseal_processor_skips_role_grant_without_bot_base_url() -> None:
     )
 
 
-def test_docuseal_processor_skips_role_grant_without_api_secret() -> None:
+def test_docuseal_processor_skips_role_grant_without_api_secret(mock_api: Mock) -> None:
     """Missing shared API secret should be reported without calling the bot client."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1", "cDiscordUserID": "1234"}]},
         {"updated": True},
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch("five08.worker.crm.docuseal_processor.logger.warning") as mock_warning,
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(docuseal_processor.logger, "warning") as mock_warning,
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             " ",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement"
+        patch.object(
+            docuseal_processor, "grant_member_role_for_signed_agreement"
         ) as mock_grant_role,
     ):
         processor = DocusealAgreementProcessor()
@@ -181,24 +201,25 @@ def test_docuseal_processor_skips_role_grant_without_api_secret() -> None:
     ],
 )
 def test_docuseal_processor_reads_supported_discord_id_aliases(
+    mock_api: Mock,
     field_name: str,
     field_value: str,
 ) -> None:
     """All supported Discord ID aliases should trigger the role-grant path."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1", field_name: field_value}]},
         {"updated": True},
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             "top-secret",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement",
+        patch.object(
+            docuseal_processor,
+            "grant_member_role_for_signed_agreement",
             return_value={"status": "applied"},
         ) as mock_grant_role,
     ):
@@ -215,9 +236,10 @@ def test_docuseal_processor_reads_supported_discord_id_aliases(
     assert mock_grant_role.call_args.kwargs["discord_user_id"] == field_value
 
 
-def test_docuseal_processor_reads_discord_id_from_username_fallback() -> None:
+def test_docuseal_processor_reads_discord_id_from_username_fallback(
+    mock_api: Mock,
+) -> None:
     """Mention-style cDiscordUsername values should still resolve to an ID."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {
             "list": [
@@ -231,13 +253,14 @@ def test_docuseal_processor_reads_discord_id_from_username_fallback() -> None:
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             "top-secret",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement",
+        patch.object(
+            docuseal_processor,
+            "grant_member_role_for_signed_agreement",
             return_value={"status": "applied"},
         ) as mock_grant_role,
     ):
@@ -254,91 +277,77 @@ def test_docuseal_processor_reads_discord_id_from_username_fallback() -> None:
     assert mock_grant_role.call_args.kwargs["discord_user_id"] == "987654321"
 
 
-def test_docuseal_processor_raises_on_invalid_completed_at() -> None:
+def test_docuseal_processor_raises_on_invalid_completed_at(mock_api: Mock) -> None:
     """Processor should raise so the job runner can mark the job non-retryable/dead."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1"}]},
     ]
 
-    with patch(
-        "five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api
-    ):
-        processor = DocusealAgreementProcessor()
-        with pytest.raises(DocusealAgreementNonRetryableError) as exc_info:
-            processor.process_agreement(
-                email="member@508.dev",
-                completed_at="not-a-date",
-                submission_id=416,
-            )
+    processor = DocusealAgreementProcessor()
+    with pytest.raises(DocusealAgreementNonRetryableError) as exc_info:
+        processor.process_agreement(
+            email="member@508.dev",
+            completed_at="not-a-date",
+            submission_id=416,
+        )
 
     assert "invalid_completed_at for contact_id=contact-1" in str(exc_info.value)
     assert mock_api.request.call_count == 1
 
 
-def test_docuseal_processor_returns_contact_not_found_when_missing_contact() -> None:
+def test_docuseal_processor_returns_contact_not_found_when_missing_contact(
+    mock_api: Mock,
+) -> None:
     """Processor should return a contact-not-found error without raw email."""
-    mock_api = Mock()
     mock_api.request.return_value = {"list": []}
 
-    with patch(
-        "five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api
-    ):
-        processor = DocusealAgreementProcessor()
-        result = processor.process_agreement(
-            email="missing@508.dev",
-            completed_at="2026-02-25T12:00:00Z",
-            submission_id=123,
-        )
+    processor = DocusealAgreementProcessor()
+    result = processor.process_agreement(
+        email="missing@508.dev",
+        completed_at="2026-02-25T12:00:00Z",
+        submission_id=123,
+    )
 
     assert result["success"] is False
     assert result["error"] == "contact_not_found"
-    assert result["masked_email"] == mask_email("missing@508.dev")
+    assert result["masked_email"] == _MASKED["missing@508.dev"]
     assert result["masked_email"] != "missing@508.dev"
     assert mock_api.request.call_count == 1
 
 
-def test_docuseal_processor_raises_on_search_failure() -> None:
+def test_docuseal_processor_raises_on_search_failure(mock_api: Mock) -> None:
     """Processor should raise when CRM search fails to trigger job retries."""
-    mock_api = Mock()
     mock_api.request.side_effect = EspoAPIError("CRM unavailable")
 
-    with patch(
-        "five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api
-    ):
-        processor = DocusealAgreementProcessor()
-        with pytest.raises(DocusealAgreementProcessingError) as exc_info:
-            processor.process_agreement(
-                email="broken@508.dev",
-                completed_at="2026-02-25T12:00:00Z",
-                submission_id=55,
-            )
+    processor = DocusealAgreementProcessor()
+    with pytest.raises(DocusealAgreementProcessingError) as exc_info:
+        processor.process_agreement(
+            email="broken@508.dev",
+            completed_at="2026-02-25T12:00:00Z",
+            submission_id=55,
+        )
 
     assert (
         str(exc_info.value)
-        == f"CRM search failed for masked_email={mask_email('broken@508.dev')}: "
+        == f"CRM search failed for masked_email={_MASKED['broken@508.dev']}: "
         "CRM unavailable"
     )
 
 
-def test_docuseal_processor_raises_on_update_failure() -> None:
+def test_docuseal_processor_raises_on_update_failure(mock_api: Mock) -> None:
     """Processor should raise when CRM update fails to trigger job retries."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1"}]},
         EspoAPIError("write failed"),
     ]
 
-    with patch(
-        "five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api
-    ):
-        processor = DocusealAgreementProcessor()
-        with pytest.raises(DocusealAgreementProcessingError) as exc_info:
-            processor.process_agreement(
-                email="member@508.dev",
-                completed_at="2026-02-25T12:00:00Z",
-                submission_id=9001,
-            )
+    processor = DocusealAgreementProcessor()
+    with pytest.raises(DocusealAgreementProcessingError) as exc_info:
+        processor.process_agreement(
+            email="member@508.dev",
+            completed_at="2026-02-25T12:00:00Z",
+            submission_id=9001,
+        )
 
     assert (
         str(exc_info.value)
@@ -346,23 +355,25 @@ def test_docuseal_processor_raises_on_update_failure() -> None:
     )
 
 
-def test_docuseal_processor_role_assignment_error_is_best_effort() -> None:
+def test_docuseal_processor_role_assignment_error_is_best_effort(
+    mock_api: Mock,
+) -> None:
     """CRM success should survive bot role assignment failures."""
-    mock_api = Mock()
     mock_api.request.side_effect = [
         {"list": [{"id": "contact-1", "cDiscordUserID": "1234"}]},
         {"updated": True},
     ]
 
     with (
-        patch("five08.worker.crm.docuseal_processor.EspoClient", return_value=mock_api),
-        patch("five08.worker.crm.docuseal_processor.logger.warning") as mock_warning,
-        patch(
-            "five08.worker.crm.docuseal_processor.settings.api_shared_secret",
+        patch.object(docuseal_processor.logger, "warning") as mock_warning,
+        patch.object(
+            docuseal_processor.settings,
+            "api_shared_secret",
             "top-secret",
         ),
-        patch(
-            "five08.worker.crm.docuseal_processor.grant_member_role_for_signed_agreement",
+        patch.object(
+            docuseal_processor,
+            "grant_member_role_for_signed_agreement",
             side_effect=DiscordBotAPIError("status code is 403"),
         ),
     ):
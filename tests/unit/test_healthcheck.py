@@ -4,7 +4,7 @@ Unit tests for healthcheck functionality.
 
 import pytest
 from unittest.mock import Mock
-import json
+import orjson
 
 from five08.discord_bot.utils.healthcheck import HealthcheckRoutes
 
@@ -42,7 +42,6 @@ class TestHealthcheckRoutes:
         assert healthcheck_routes.bot == mock_bot
         assert healthcheck_routes.start_time is not None
 
-    @pytest.mark.asyncio
     async def test_health_handler_healthy_bot(self, healthcheck_routes):
         """Test health handler with healthy bot."""
         # Mock request
@@ -54,8 +53,7 @@ class TestHealthcheckRoutes:
         assert response.content_type == "application/json"
 
         # Parse response body
-        response_text = response.body.decode("utf-8")
-        data = json.loads(response_text)
+        data = orjson.loads(response.body)
 
         assert data["status"] == "healthy"
         assert "timestamp" in data
@@ -70,7 +68,6 @@ class TestHealthcheckRoutes:
         assert data["cogs"]["emailmonitor"]["commands"] == 2
         assert data["cogs"]["emailmonitor"]["app_commands"] == 1
 
-    @pytest.mark.asyncio
     async def test_health_handler_unhealthy_bot(self, healthcheck_routes):
         """Test health handler with unhealthy bot."""
         # Make bot not ready
@@ -84,13 +81,11 @@ class TestHealthcheckRoutes:
         assert response.status == 503  # Service Unavailable
 
         # Parse response body
-        response_text = response.body.decode("utf-8")
-        data = json.loads(response_text)
+        data = orjson.loads(response.body)
 
         assert data["status"] == "unhealthy"
         assert data["bot"]["connected"] is False
 
-    @pytest.mark.asyncio
     async def test_health_handler_error(self, healthcheck_routes):
         """Test health handler with error condition."""
         # Make bot raise an error
@@ -104,14 +99,12 @@ class TestHealthcheckRoutes:
         assert response.status == 500
 
         # Parse response body
-        response_text = response.body.decode("utf-8")
-        data = json.loads(response_text)
+        data = orjson.loads(response.body)
 
         assert data["status"] == "error"
         assert "error" in data
         assert "Bot error" in data["error"]
 
-    @pytest.mark.asyncio
     async def test_health_handler_no_guilds(self, healthcheck_routes):
         """Test health handler when bot has no guilds."""
         healthcheck_routes.bot.guilds = []
@@ -124,13 +117,11 @@ class TestHealthcheckRoutes:
         assert response.status == 200
 
         # Parse response body
-        response_text = response.body.decode("utf-8")
-        data = json.loads(response_text)
+        data = orjson.loads(response.body)
 
         assert data["bot"]["guild_count"] == 0
         assert data["bot"]["user_count"] == 0
 
-    @pytest.mark.asyncio
     async def test_health_handler_none_latency(self, healthcheck_routes):
         """Test health handler when bot latency is None."""
         healthcheck_routes.bot.latency = None
@@ -142,7 +133,6 @@ class TestHealthcheckRoutes:
         assert response.status == 200
 
         # Parse response body
-        response_text = response.body.decode("utf-8")
-        data = json.loads(response_text)
+        data = orjson.loads(response.body)
 
         assert data["bot"]["latency_ms"] is None
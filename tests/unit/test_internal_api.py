@@ -1,10 +1,10 @@
 """Unit tests for bot internal automation routes."""
 
 from types import SimpleNamespace
-import json
 from unittest.mock import AsyncMock, Mock
 
 import discord
+import orjson
 import pytest
 
 from five08.discord_bot.utils.internal_api import (
@@ -26,7 +26,6 @@ class TestInternalAPIRoutes:
     def internal_api_routes(self, mock_bot):
         return InternalAPIRoutes(mock_bot)
 
-    @pytest.mark.asyncio
     async def test_grant_member_role_applies_member_role(
         self, internal_api_routes, monkeypatch: pytest.MonkeyPatch
     ):
@@ -73,7 +72,6 @@ class TestInternalAPIRoutes:
             reason="Member agreement signed via Docuseal (contact contact-1, submission 4200)",
         )
 
-    @pytest.mark.asyncio
     async def test_grant_member_role_returns_already_present(
         self, internal_api_routes, monkeypatch: pytest.MonkeyPatch
     ):
@@ -101,7 +99,6 @@ class TestInternalAPIRoutes:
         assert status_code == 200
         assert result["status"] == "already_present"
 
-    @pytest.mark.asyncio
     async def test_member_agreement_role_handler_rejects_unauthorized(
         self, internal_api_routes, monkeypatch: pytest.MonkeyPatch
     ):
@@ -116,9 +113,8 @@ class TestInternalAPIRoutes:
         response = await internal_api_routes.member_agreement_role_handler(request)
 
         assert response.status == 401
-        assert json.loads(response.body.decode("utf-8")) == {"error": "unauthorized"}
+        assert orjson.loads(response.body) == {"error": "unauthorized"}
 
-    @pytest.mark.asyncio
     async def test_grant_member_role_returns_forbidden_when_fetch_forbidden(
         self, internal_api_routes, monkeypatch: pytest.MonkeyPatch
     ):
@@ -152,7 +148,6 @@ class TestInternalAPIRoutes:
         assert status_code == 403
         assert result["error"] == "member_lookup_forbidden"
 
-    @pytest.mark.asyncio
     async def test_grant_member_role_returns_bad_gateway_when_fetch_http_error(
         self, internal_api_routes, monkeypatch: pytest.MonkeyPatch
     ):
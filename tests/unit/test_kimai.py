@@ -60,7 +60,6 @@ class TestKimaiCog:
         assert cog.bot == mock_bot
         assert cog.api is not None
 
-    @pytest.mark.asyncio
     async def test_project_hours_success(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -104,7 +103,6 @@ class TestKimaiCog:
         embed = call_args[1]["embed"]
         assert "Test Project" in embed.title
 
-    @pytest.mark.asyncio
     async def test_project_hours_project_not_found(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -121,7 +119,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "not found" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_project_hours_with_month_filter(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -141,7 +138,6 @@ class TestKimaiCog:
         assert call_args[1]["begin"] is not None
         assert call_args[1]["end"] is not None
 
-    @pytest.mark.asyncio
     async def test_project_hours_with_custom_dates(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -164,7 +160,6 @@ class TestKimaiCog:
         assert call_args[1]["begin"].strftime("%Y-%m-%d") == "2024-01-01"
         assert call_args[1]["end"].strftime("%Y-%m-%d") == "2024-01-31"
 
-    @pytest.mark.asyncio
     async def test_project_hours_api_error(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -183,7 +178,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "Failed to retrieve project hours" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_project_hours_invalid_date_format(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -198,7 +192,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "Invalid date format" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_project_hours_no_entries(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -219,7 +212,6 @@ class TestKimaiCog:
         # Should show 0 hours in hh:mm format
         assert "0:00" in embed.fields[0].value
 
-    @pytest.mark.asyncio
     async def test_list_projects_success(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -249,7 +241,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "embed" in call_args[1]
 
-    @pytest.mark.asyncio
     async def test_list_projects_no_projects(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -264,7 +255,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "No projects found" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_list_projects_api_error(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -279,7 +269,6 @@ class TestKimaiCog:
         call_args = mock_interaction.followup.send.call_args
         assert "Failed to retrieve projects" in call_args[0][0]
 
-    @pytest.mark.asyncio
     async def test_status_success(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -299,7 +288,6 @@ class TestKimaiCog:
         embed = call_args[1]["embed"]
         assert "Connection successful" in embed.description
 
-    @pytest.mark.asyncio
     async def test_status_api_error(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -419,7 +407,6 @@ class TestKimaiCog:
 
         assert len(chunks) == 0
 
-    @pytest.mark.asyncio
     async def test_project_hours_long_breakdown_chunking(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -452,7 +439,6 @@ class TestKimaiCog:
         # Should have multiple fields due to chunking
         assert len(embed.fields) > 1
 
-    @pytest.mark.asyncio
     async def test_list_projects_with_customer_info(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -480,7 +466,6 @@ class TestKimaiCog:
         field_value = embed.fields[0].value
         assert "Customer A" in field_value
 
-    @pytest.mark.asyncio
     async def test_list_projects_shows_hidden_status(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
@@ -502,7 +487,6 @@ class TestKimaiCog:
         # Hidden project should have [Hidden] marker
         assert "[Hidden]" in field_value
 
-    @pytest.mark.asyncio
     async def test_project_hours_sorts_by_hours_descending(
         self, kimai_cog, mock_interaction, mock_steering_role
     ):
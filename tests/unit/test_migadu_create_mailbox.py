@@ -70,7 +70,6 @@ def test_normalize_mailbox_request_rejects_non_508_domain(
         migadu_cog._normalize_mailbox_request("alice@gmail.com")
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_command_success_with_crm_defaults_and_sync(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -113,7 +112,6 @@ async def test_create_mailbox_command_success_with_crm_defaults_and_sync(
     assert kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_requires_backup_email_without_search_term(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -133,7 +131,6 @@ async def test_create_mailbox_requires_backup_email_without_search_term(
     assert mock_interaction.followup.send.call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_shows_contact_selector_for_multiple_matches(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -172,7 +169,6 @@ async def test_create_mailbox_shows_contact_selector_for_multiple_matches(
     assert kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_aborts_when_matched_contact_has_508_email(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -204,7 +200,6 @@ async def test_create_mailbox_aborts_when_matched_contact_has_508_email(
     assert mock_interaction.followup.send.call_args.kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_reports_partial_failure_when_crm_sync_fails(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -233,7 +228,6 @@ async def test_create_mailbox_reports_partial_failure_when_crm_sync_fails(
     assert kwargs["ephemeral"] is True
 
 
-@pytest.mark.asyncio
 async def test_create_mailbox_reports_migadu_api_errors_as_operational_failures(
     migadu_cog: MigaduCog,
     mock_interaction: AsyncMock,
@@ -1,5 +1,6 @@
 """Unit tests for resume profile worker processor."""
 
+import copy
 import ipaddress
 import json
 from datetime import datetime
@@ -10,7 +11,9 @@ from unittest.mock import MagicMock, Mock, patch
 
 from curl_cffi import CurlOpt
 
-from five08.clients.espo import EspoAPIError
+from five08.clients.espo import EspoAPIError, EspoClient
+from five08.resume_document_processor import DocumentProcessor
+from five08.resume_extractor import ResumeProfileExtractor
 from five08.resume_profile_processor import (
     PROFILE_SOURCE_BROWSER_RESOURCE_MAX_BYTES,
     PROFILE_SOURCE_MAX_BYTES,
@@ -18,10 +21,29 @@ from five08.resume_profile_processor import (
     ResumeProcessorConfig,
     _ExternalProfileSourceCandidate,
 )
+from five08.resume_skills_extractor import SkillsExtractor
 from five08.worker.crm.resume_profile_processor import ResumeProfileProcessor
 from five08.worker.models import ExtractedSkills, ResumeExtractedProfile
 
 
+@pytest.fixture(scope="module")
+def _base_processor() -> ResumeProfileProcessor:
+    """Build the real processor (and its API clients) once per module."""
+    return ResumeProfileProcessor()
+
+
+@pytest.fixture
+def processor(_base_processor: ResumeProfileProcessor) -> ResumeProfileProcessor:
+    """Return a per-test copy of the shared processor with mocked collaborators."""
+    processor = copy.copy(_base_processor)
+    processor.crm = Mock(spec=EspoClient)
+    processor.extractor = Mock(spec=ResumeProfileExtractor)
+    processor.skills_extractor = Mock(spec=SkillsExtractor)
+    processor.document_processor = Mock(spec=DocumentProcessor)
+    processor._record_processing_run = Mock()
+    return processor
+
+
 def test_resume_processor_config_filters_unsupported_extensions() -> None:
     """Shared config should clamp settings to the supported resume formats."""
     config = ResumeProcessorConfig.from_settings(
@@ -39,14 +61,10 @@ def test_resume_processor_config_filters_unsupported_extensions() -> None:
     assert config.max_file_size_bytes == 12 * 1024 * 1024
 
 
-def test_extract_profile_proposal_filters_508_email() -> None:
+def test_extract_profile_proposal_filters_508_email(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Extract proposal should skip @508.dev email updates by policy."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -105,14 +123,10 @@ def test_extract_profile_proposal_filters_508_email() -> None:
     assert record_kwargs["attachment_id"] == "att-1"
 
 
-def test_extract_profile_proposal_includes_additional_emails() -> None:
+def test_extract_profile_proposal_includes_additional_emails(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Additional extracted emails should be shown in updates and proposed changes."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -154,16 +168,10 @@ def test_extract_profile_proposal_includes_additional_emails() -> None:
     )
 
 
-def test_extract_profile_proposal_merges_and_serializes_website_and_skill_attrs() -> (
-    None
-):
+def test_extract_profile_proposal_merges_and_serializes_website_and_skill_attrs(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Proposal should merge website links and serialize cSkillAttrs as JSON."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -210,14 +218,10 @@ def test_extract_profile_proposal_merges_and_serializes_website_and_skill_attrs(
     }
 
 
-def test_extract_profile_proposal_merges_and_serializes_social_links() -> None:
+def test_extract_profile_proposal_merges_and_serializes_social_links(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Social links should be merged and persisted to cSocialLinks without duplication."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -261,14 +265,10 @@ def test_extract_profile_proposal_merges_and_serializes_social_links() -> None:
     ]
 
 
-def test_extract_profile_proposal_fetches_crm_website_and_github_sources() -> None:
+def test_extract_profile_proposal_fetches_crm_website_and_github_sources(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Existing CRM website and GitHub profile text should be passed into extraction."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(
         side_effect=lambda url, **_: {
             "https://portfolio.example.com": "Portfolio content",
@@ -330,14 +330,10 @@ def test_extract_profile_proposal_fetches_crm_website_and_github_sources() -> No
     assert [item.origin for item in result.source_enrichments] == ["crm", "crm"]
 
 
-def test_extract_profile_proposal_reruns_with_inferred_github_only() -> None:
+def test_extract_profile_proposal_reruns_with_inferred_github_only(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Inferred websites and GitHub should wait for confirmation in one set."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(
         side_effect=lambda url, **_: {
             "https://blog.example.com": "Blog content",
@@ -395,16 +391,10 @@ def test_extract_profile_proposal_reruns_with_inferred_github_only() -> None:
     ]
 
 
-def test_extract_profile_proposal_fails_open_when_initial_enrichment_extract_errors() -> (
-    None
-):
+def test_extract_profile_proposal_fails_open_when_initial_enrichment_extract_errors(
+    processor: ResumeProfileProcessor,
+) -> None:
     """CRM-source enrichment extraction should fall back to resume-only extraction."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(
         return_value="GitHub profile content"
     )
@@ -461,16 +451,10 @@ def test_extract_profile_proposal_fails_open_when_initial_enrichment_extract_err
     )
 
 
-def test_extract_profile_proposal_fetches_confirmed_website_and_github_together() -> (
-    None
-):
+def test_extract_profile_proposal_fetches_confirmed_website_and_github_together(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Confirmed website and GitHub sources should be fetched in one pass."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(
         side_effect=lambda url, **_: {
             "https://blog.example.com": "Blog content",
@@ -537,14 +521,10 @@ def test_extract_profile_proposal_fetches_confirmed_website_and_github_together(
     ]
 
 
-def test_extract_profile_proposal_reopens_confirmed_source_after_fail_open() -> None:
+def test_extract_profile_proposal_reopens_confirmed_source_after_fail_open(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Confirmed sources should become re-confirmable if parsing fell back without them."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(return_value="Blog content")
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
@@ -593,14 +573,10 @@ def test_extract_profile_proposal_reopens_confirmed_source_after_fail_open() ->
     assert "Confirm to fetch and reparse" in (result.source_enrichments[0].detail or "")
 
 
-def test_extract_profile_proposal_without_resume_uses_crm_external_sources() -> None:
+def test_extract_profile_proposal_without_resume_uses_crm_external_sources(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Profile reprocessing should work without a resume when CRM sources exist."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(
         side_effect=lambda url, **_: {
             "https://portfolio.example.com": "Portfolio content",
@@ -887,14 +863,10 @@ def test_extract_rendered_profile_source_text_enforces_size_limit() -> None:
         processor._extract_rendered_profile_source_text(oversized_html)
 
 
-def test_extract_profile_proposal_reruns_with_confirmed_personal_website() -> None:
+def test_extract_profile_proposal_reruns_with_confirmed_personal_website(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Confirmed inferred personal websites should be fetched on a rerun."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(return_value="Blog content")
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
@@ -960,16 +932,10 @@ def test_extract_profile_proposal_rejects_github_repo_urls() -> None:
     assert processor._normalize_github_username("https://github.com/acme") == "acme"
 
 
-def test_extract_profile_proposal_keeps_confirmation_needed_for_new_site_with_existing_crm_site() -> (
-    None
-):
+def test_extract_profile_proposal_keeps_confirmation_needed_for_new_site_with_existing_crm_site(
+    processor: ResumeProfileProcessor,
+) -> None:
     """A new distinct personal website should still surface for confirmation."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(return_value="Existing site")
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
@@ -1012,16 +978,10 @@ def test_extract_profile_proposal_keeps_confirmation_needed_for_new_site_with_ex
     assert result.source_enrichments[1].url == "https://newsite.example.com"
 
 
-def test_extract_profile_proposal_keeps_confirmation_needed_for_new_site_after_existing_links() -> (
-    None
-):
+def test_extract_profile_proposal_keeps_confirmation_needed_for_new_site_after_existing_links(
+    processor: ResumeProfileProcessor,
+) -> None:
     """The website cap should apply after skipping CRM sites, not before."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor._fetch_external_profile_source_text = Mock(return_value="Existing site")
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
@@ -1189,16 +1149,10 @@ def test_resolve_public_profile_request_target_rejects_ipv6_literal() -> None:
     )
 
 
-def test_extract_profile_proposal_deduplicates_existing_and_extracted_websites_by_scheme() -> (
-    None
-):
+def test_extract_profile_proposal_deduplicates_existing_and_extracted_websites_by_scheme(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Existing and extracted links should merge by website identity, not scheme."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1236,14 +1190,10 @@ def test_extract_profile_proposal_deduplicates_existing_and_extracted_websites_b
     assert "cWebsiteLink" not in result.proposed_updates
 
 
-def test_extract_profile_proposal_deduplicates_skills_in_confirmation() -> None:
+def test_extract_profile_proposal_deduplicates_skills_in_confirmation(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Duplicate extracted or existing skills should not appear in confirmation updates."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1282,14 +1232,10 @@ def test_extract_profile_proposal_deduplicates_skills_in_confirmation() -> None:
     assert result.new_skills == ["node"]
 
 
-def test_extract_profile_proposal_includes_seniority_update() -> None:
+def test_extract_profile_proposal_includes_seniority_update(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Extracted seniority should map to the CRM cSeniority field."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1324,14 +1270,10 @@ def test_extract_profile_proposal_includes_seniority_update() -> None:
     assert result.proposed_updates["cSeniority"] == "senior"
 
 
-def test_extract_profile_proposal_preserves_existing_seniority() -> None:
+def test_extract_profile_proposal_preserves_existing_seniority(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Existing non-unknown seniority should not be overwritten."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1372,14 +1314,10 @@ def test_extract_profile_proposal_preserves_existing_seniority() -> None:
     )
 
 
-def test_extract_profile_proposal_maps_principal_to_staff() -> None:
+def test_extract_profile_proposal_maps_principal_to_staff(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Principal titles should normalize to staff seniority."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1414,14 +1352,10 @@ def test_extract_profile_proposal_maps_principal_to_staff() -> None:
     assert result.proposed_updates["cSeniority"] == "staff"
 
 
-def test_extract_profile_proposal_normalizes_unknown_seniority_to_unknown() -> None:
+def test_extract_profile_proposal_normalizes_unknown_seniority_to_unknown(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Unknown extracted seniority values should normalize to unknown."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1463,7 +1397,7 @@ def test_apply_profile_updates_appends_resume_email_as_primary_emailAddressData(
 ):
     """Resume email updates should append to emailAddressData instead of overwriting."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
     processor.crm.get_contact.return_value = {
         "emailAddressData": [
             {
@@ -1500,7 +1434,7 @@ def test_apply_profile_updates_appends_additional_emails_without_replacing_prima
 ):
     """Additional emails should be merged into emailAddressData and stay non-primary."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
     processor.crm.get_contact.return_value = {
         "emailAddressData": [
             {
@@ -1538,7 +1472,7 @@ def test_apply_profile_updates_appends_additional_emails_without_replacing_prima
 def test_apply_profile_updates_preserves_primary_when_only_additional_emails() -> None:
     """Existing primary email should remain when only additional emails are merged."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
     processor.crm.get_contact.return_value = {
         "emailAddressData": [
             {
@@ -1577,14 +1511,10 @@ def test_apply_profile_updates_preserves_primary_when_only_additional_emails() -
     assert by_lower["extra@example.com"]["primary"] is False
 
 
-def test_extract_profile_proposal_normalizes_existing_skill_punctuation() -> None:
+def test_extract_profile_proposal_normalizes_existing_skill_punctuation(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Existing punctuation-heavy skills should normalize to search-friendly canonical forms."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1636,14 +1566,10 @@ def test_extract_profile_proposal_normalizes_existing_skill_punctuation() -> Non
     ]
 
 
-def test_extract_profile_proposal_with_strength_change_only_no_skill_proposal() -> None:
+def test_extract_profile_proposal_with_strength_change_only_no_skill_proposal(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Strength-only changes to existing skills should not be shown as editable updates."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
     processor.skills_extractor.canonicalize_skill.side_effect = lambda v: (
         str(v).strip().lower()
     )
@@ -1685,14 +1611,10 @@ def test_extract_profile_proposal_with_strength_change_only_no_skill_proposal()
     assert not any(item.field == "skills" for item in result.proposed_changes)
 
 
-def test_extract_profile_proposal_fills_missing_strengths_for_merged_skills() -> None:
+def test_extract_profile_proposal_fills_missing_strengths_for_merged_skills(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Merged cSkillAttrs should include defaults for skills missing explicit strengths."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
 
     processor.crm.get_contact.return_value = {
         "emailAddress": "member@example.com",
@@ -1737,7 +1659,7 @@ def test_extract_profile_proposal_fills_missing_strengths_for_merged_skills() ->
 def test_apply_profile_updates_adds_discord_and_filters_email() -> None:
     """Apply should include Discord link values and prevent @508.dev email writes."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-1",
@@ -1773,7 +1695,7 @@ def test_apply_profile_updates_adds_discord_and_filters_email() -> None:
 def test_apply_profile_updates_normalizes_csv_skills_to_array() -> None:
     """Apply should convert comma-separated skills into a deduplicated array."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-2",
@@ -1789,7 +1711,7 @@ def test_apply_profile_updates_normalizes_csv_skills_to_array() -> None:
 def test_apply_profile_updates_serializes_skill_attrs() -> None:
     """Apply should serialize cSkillAttrs payload as compact JSON."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-4",
@@ -1811,7 +1733,7 @@ def test_apply_profile_updates_serializes_skill_attrs() -> None:
 def test_apply_profile_updates_accepts_double_encoded_skill_attrs() -> None:
     """Apply should parse double-encoded cSkillAttrs payloads instead of dropping them."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     raw_attrs = {"python": {"strength": 5}, "react": {"strength": 4}}
     result = processor.apply_profile_updates(
@@ -1830,7 +1752,7 @@ def test_apply_profile_updates_accepts_double_encoded_skill_attrs() -> None:
 def test_apply_profile_updates_allows_cSeniority_field() -> None:
     """Allowed updates should include cSeniority normalization."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-5",
@@ -1845,7 +1767,7 @@ def test_apply_profile_updates_allows_cSeniority_field() -> None:
 def test_apply_profile_updates_normalizes_unknown_seniority_to_unknown() -> None:
     """Unknown seniority values should be normalized to the canonical unknown bucket."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-7",
@@ -1860,7 +1782,7 @@ def test_apply_profile_updates_normalizes_unknown_seniority_to_unknown() -> None
 def test_apply_profile_updates_normalizes_skill_aliases_for_api_payload() -> None:
     """Alias-heavy skills should be normalized into shared canonical forms."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-6",
@@ -1879,7 +1801,7 @@ def test_apply_profile_updates_normalizes_skill_aliases_for_api_payload() -> Non
 def test_apply_profile_updates_accepts_link_only_updates() -> None:
     """Link-only submissions should still persist Discord linkage."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
 
     result = processor.apply_profile_updates(
         contact_id="contact-link-only",
@@ -1898,7 +1820,7 @@ def test_apply_profile_updates_accepts_link_only_updates() -> None:
 def test_apply_profile_updates_returns_warning_for_partial_success() -> None:
     """Fallback field updates should surface partial failures without dropping successes."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
     processor._verify_updated_fields = Mock(return_value=["cGitHubUsername"])
     processor.crm.update_contact.side_effect = [
         EspoAPIError("batch failed"),
@@ -1934,7 +1856,7 @@ def test_apply_profile_updates_returns_warning_for_partial_success() -> None:
 def test_apply_profile_updates_does_not_report_failed_fields_as_updated() -> None:
     """Failed writes should not be echoed back as updated fields or values."""
     processor = ResumeProfileProcessor()
-    processor.crm = Mock()
+    processor.crm = Mock(spec=EspoClient)
     processor.crm.update_contact.side_effect = [
         EspoAPIError("batch failed"),
         EspoAPIError("github rejected"),
@@ -1957,14 +1879,10 @@ def test_apply_profile_updates_does_not_report_failed_fields_as_updated() -> Non
     )
 
 
-def test_extract_profile_proposal_records_failed_run() -> None:
+def test_extract_profile_proposal_records_failed_run(
+    processor: ResumeProfileProcessor,
+) -> None:
     """Failed extraction should still be written to the processing ledger."""
-    processor = ResumeProfileProcessor()
-    processor.crm = Mock()
-    processor.extractor = Mock()
-    processor.skills_extractor = Mock()
-    processor.document_processor = Mock()
-    processor._record_processing_run = Mock()
 
     processor.crm.get_contact.return_value = {"emailAddress": "member@example.com"}
     processor.crm.download_attachment.return_value = b"resume-bytes"
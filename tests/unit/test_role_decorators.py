@@ -48,7 +48,6 @@ class TestRoleDecorators:
         role.name = "User"
         return role
 
-    @pytest.mark.asyncio
     async def test_require_role_with_correct_role(
         self, mock_interaction, mock_member_role
     ):
@@ -67,7 +66,6 @@ class TestRoleDecorators:
         assert result == "success"
         mock_interaction.response.send_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_require_role_without_correct_role(
         self, mock_interaction, mock_user_role
     ):
@@ -88,7 +86,6 @@ class TestRoleDecorators:
             ephemeral=True,
         )
 
-    @pytest.mark.asyncio
     async def test_require_roles_with_one_correct_role(
         self, mock_interaction, mock_member_role, mock_user_role
     ):
@@ -106,7 +103,6 @@ class TestRoleDecorators:
         assert result == "success"
         mock_interaction.response.send_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_require_roles_without_any_correct_role(
         self, mock_interaction, mock_user_role
     ):
@@ -127,7 +123,6 @@ class TestRoleDecorators:
             ephemeral=True,
         )
 
-    @pytest.mark.asyncio
     async def test_require_role_with_admin_role(
         self, mock_interaction, mock_admin_role
     ):
@@ -145,7 +140,6 @@ class TestRoleDecorators:
         assert result == "admin_success"
         mock_interaction.response.send_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_decorator_preserves_function_metadata(self):
         """Test that decorator preserves original function metadata."""
 
@@ -157,7 +151,6 @@ class TestRoleDecorators:
         assert test_command.__name__ == "test_command"
         assert test_command.__doc__ == "Test command docstring."
 
-    @pytest.mark.asyncio
     async def test_decorator_with_args_and_kwargs(
         self, mock_interaction, mock_member_role
     ):
@@ -458,7 +451,6 @@ class TestHierarchicalRoles:
         level = get_user_hierarchy_level(roles)
         assert level == 2  # Highest is Admin (level 2)
 
-    @pytest.mark.asyncio
     async def test_require_role_with_admin_grants_member_access(
         self, mock_roles_with_hierarchy
     ):
@@ -480,7 +472,6 @@ class TestHierarchicalRoles:
         assert result == "success"
         mock_interaction.response.send_message.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_require_role_with_owner_grants_member_access(
         self, mock_roles_with_hierarchy
     ):
@@ -2,7 +2,14 @@
 
 from unittest.mock import MagicMock, patch
 
-from five08.audit import get_discord_user_id_for_contact
+from five08.audit import (
+    ActorProvider,
+    PersonRecord,
+    ensure_audit_event_partitions,
+    get_discord_user_id_for_contact,
+    resolve_person_id,
+    upsert_person,
+)
 
 
 def _mock_connection(row: dict[str, object] | None) -> MagicMock:
@@ -97,3 +104,62 @@ def test_get_discord_user_id_for_contact_parses_legacy_crm_username() -> None:
         result = get_discord_user_id_for_contact(settings, "contact-1")
 
     assert result == "555666777"
+
+
+def test_resolve_person_id_admin_sso_uses_union_all_lookup() -> None:
+    """Admin SSO lookups should probe email_508 then email as separate arms."""
+    settings = MagicMock()
+    connection = _mock_connection({"id": "person-1"})
+    cursor = connection.cursor.return_value.__enter__.return_value
+
+    with patch("five08.audit.get_postgres_connection") as mock_get_connection:
+        mock_get_connection.return_value.__enter__.return_value = connection
+        mock_get_connection.return_value.__exit__.return_value = None
+
+        result = resolve_person_id(
+            settings,
+            actor_provider=ActorProvider.ADMIN_SSO,
+            actor_subject=" Admin@508.dev ",
+        )
+
+    assert result == "person-1"
+    query, params = cursor.execute.call_args.args
+    assert "UNION ALL" in query
+    assert " OR " not in query
+    assert params == ("admin@508.dev", "admin@508.dev")
+
+
+def test_ensure_audit_event_partitions_requests_months_ahead() -> None:
+    """Partition maintenance should cover the current month plus lookahead."""
+    settings = MagicMock()
+    connection = _mock_connection(None)
+    cursor = connection.cursor.return_value.__enter__.return_value
+
+    with patch("five08.audit.get_postgres_connection") as mock_get_connection:
+        mock_get_connection.return_value.__enter__.return_value = connection
+        mock_get_connection.return_value.__exit__.return_value = None
+
+        ensure_audit_event_partitions(settings, months_ahead=3)
+
+    query, params = cursor.execute.call_args.args
+    assert "audit_events_ensure_partition" in query
+    assert params == (3,)
+
+
+def test_upsert_person_falls_back_to_select_for_unchanged_rows() -> None:
+    """No-op upserts return no row, so the existing id is looked up instead."""
+    settings = MagicMock()
+    connection = _mock_connection(None)
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.side_effect = [None, {"id": "person-1"}]
+
+    with patch("five08.audit.get_postgres_connection") as mock_get_connection:
+        mock_get_connection.return_value.__enter__.return_value = connection
+        mock_get_connection.return_value.__exit__.return_value = None
+
+        result = upsert_person(settings, PersonRecord(crm_contact_id="contact-1"))
+
+    assert result == "person-1"
+    upsert_query = cursor.execute.call_args_list[0].args[0]
+    assert "IS DISTINCT FROM" in upsert_query
+    assert cursor.execute.call_args_list[1].args[1] == ("contact-1",)
@@ -0,0 +1,69 @@
+"""Unit tests for shared logging helpers."""
+
+import json
+import logging
+import sys
+
+import pytest
+
+from five08.logging import JsonFormatter, configure_logging
+
+
+def test_json_formatter_renders_single_line_json() -> None:
+    """Formatted records should be one JSON object with the rendered message."""
+    record = logging.LogRecord(
+        name="five08.test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="processed job_id=%s",
+        args=("job-123",),
+        exc_info=None,
+    )
+
+    rendered = JsonFormatter().format(record)
+
+    assert "\n" not in rendered
+    payload = json.loads(rendered)
+    assert payload["lvl"] == "INFO"
+    assert payload["name"] == "five08.test"
+    assert payload["msg"] == "processed job_id=job-123"
+    assert "exc" not in payload
+
+
+def test_json_formatter_includes_exception_text() -> None:
+    """Exception tracebacks should be preserved under the exc key."""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            name="five08.test",
+            level=logging.ERROR,
+            pathname=__file__,
+            lineno=1,
+            msg="failed",
+            args=(),
+            exc_info=sys.exc_info(),
+        )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert "ValueError: boom" in payload["exc"]
+
+
+def test_configure_logging_leaves_existing_setup_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Record-collection flags should only change when we install the handler."""
+    monkeypatch.setattr(logging, "logThreads", True)
+    monkeypatch.setattr(logging, "_srcfile", logging._srcfile)
+    root_logger = logging.getLogger()
+    handler = logging.NullHandler()
+    root_logger.addHandler(handler)
+    try:
+        configure_logging("DEBUG")
+    finally:
+        root_logger.removeHandler(handler)
+
+    assert logging.logThreads is True
+    assert logging._srcfile is not None
@@ -1,19 +1,62 @@
 """Unit tests for shared queue helpers."""
 
-from unittest.mock import Mock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
 
-from five08.queue import JobStatus, _parse_status, enqueue_job
+import pytest
+
+from five08.queue import (
+    JobOutcome,
+    JobOutcomeBuffer,
+    JobSpec,
+    JobStatus,
+    _MARK_JOB_SQL_CACHE,
+    _cached_redis_client,
+    _parse_status,
+    claim_job,
+    close_postgres_pools,
+    compute_retry_delay,
+    create_job_record,
+    create_job_records_bulk,
+    enqueue_job,
+    enqueue_jobs,
+    get_job,
+    get_job_async,
+    get_postgres_connection,
+    get_redis_connection,
+    mark_job_dead,
+    release_job_lock,
+    renew_job_lock,
+    try_acquire_job_lock,
+)
 from five08.settings import SharedSettings
 
 
-def test_enqueue_job_persists_and_dispatches_to_queue_client() -> None:
+@pytest.fixture(scope="module")
+def default_settings() -> SharedSettings:
+    """Default shared settings, validated once for the whole module."""
+    return SharedSettings()
+
+
+@pytest.fixture(scope="module")
+def five_attempt_settings() -> SharedSettings:
+    """Shared settings with a non-default per-job attempt budget."""
+    return SharedSettings(job_max_attempts=5)
+
+
+def test_enqueue_job_persists_and_dispatches_to_queue_client(
+    five_attempt_settings: SharedSettings,
+) -> None:
     """Queue helpers should create a persisted job and schedule delivery."""
     queue = Mock()
-    settings = SharedSettings(job_max_attempts=5)
 
     with patch("five08.queue.create_job_record", return_value=("job-1", True)):
         result = enqueue_job(
-            queue=queue, fn=lambda value: value, args=("payload",), settings=settings
+            queue=queue,
+            fn=lambda value: value,
+            args=("payload",),
+            settings=five_attempt_settings,
         )
 
     queue.enqueue.assert_called_once_with("job-1", run_at=None)
@@ -32,3 +75,302 @@ def test_parse_status_handles_unknown_values() -> None:
     mock_warning.assert_called_once_with(
         "Unknown job status from DB: %s", "unexpected-status"
     )
+
+
+def test_get_postgres_connection_reuses_one_pool_per_url() -> None:
+    """Connection helpers should borrow from a single lazily built pool."""
+    settings = SharedSettings(
+        postgres_url="postgresql://pool-test", db_pool_size=4, db_pool_timeout=2.5
+    )
+
+    with patch("five08.queue.ConnectionPool") as mock_pool_cls:
+        try:
+            first = get_postgres_connection(settings)
+            second = get_postgres_connection(settings)
+        finally:
+            close_postgres_pools()
+
+    mock_pool_cls.assert_called_once_with(
+        "postgresql://pool-test",
+        min_size=2,
+        max_size=4,
+        timeout=2.5,
+        open=True,
+        name="five08",
+    )
+    pool = mock_pool_cls.return_value
+    assert pool.connection.call_count == 2
+    assert first is second is pool.connection.return_value
+    pool.close.assert_called_once_with()
+
+
+def test_create_job_records_bulk_inserts_once_and_resolves_duplicates(
+    five_attempt_settings: SharedSettings,
+) -> None:
+    """Bulk creation should use one insert and look up skipped idempotency keys."""
+    jobs = [
+        JobSpec(job_type="a", payload={}, idempotency_key="key-new"),
+        JobSpec(job_type="b", payload={}, idempotency_key="key-dup", max_attempts=2),
+    ]
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.cursor.return_value = cursor
+
+    def _fetchall() -> list[dict[str, str]]:
+        if cursor.fetchall.call_count == 1:
+            insert_params = cursor.execute.call_args_list[0].args[1]
+            assert insert_params[5] == [5, 2]
+            return [{"id": insert_params[1][0]}]
+        return [{"id": "existing-1", "idempotency_key": "key-dup"}]
+
+    cursor.fetchall.side_effect = _fetchall
+
+    with (
+        patch("five08.queue.get_postgres_connection", return_value=conn),
+        patch("five08.queue.uuid4", side_effect=["new-1", "new-2"]),
+    ):
+        results = create_job_records_bulk(five_attempt_settings, jobs)
+
+    assert results == [("new-1", True), ("existing-1", False)]
+    assert cursor.execute.call_count == 2
+    assert "unnest(" in cursor.execute.call_args_list[0].args[0]
+    assert cursor.execute.call_args_list[1].args[1] == (["key-dup"],)
+
+
+def test_enqueue_jobs_dispatches_only_created_rows(
+    default_settings: SharedSettings,
+) -> None:
+    """Bulk enqueue should only hand newly created rows to the queue client."""
+    queue = Mock()
+    jobs = [
+        JobSpec.for_call(lambda value: value, ("one",), idempotency_key="k1"),
+        JobSpec.for_call(lambda value: value, ("two",), idempotency_key="k2"),
+    ]
+
+    with patch(
+        "five08.queue.create_job_records_bulk",
+        return_value=[("job-1", True), ("job-2", False)],
+    ):
+        results = enqueue_jobs(queue, jobs, default_settings)
+
+    queue.enqueue.assert_called_once_with("job-1", run_at=None)
+    assert [(result.id, result.created) for result in results] == [
+        ("job-1", True),
+        ("job-2", False),
+    ]
+    assert jobs[0].payload == {"args": ["one"], "kwargs": {}}
+
+
+def test_claim_job_reclaims_running_rows_without_postgres_lock_columns(
+    default_settings: SharedSettings,
+) -> None:
+    """The Redis lock guards execution, so the claim only flips status."""
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchone.return_value = None
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.cursor.return_value = cursor
+
+    with patch("five08.queue.get_postgres_connection", return_value=conn):
+        assert claim_job(default_settings, "job-1") is None
+
+    query, params = cursor.execute.call_args.args
+    assert "locked_by" not in query
+    assert "locked_at" not in query
+    assert params == ("running", "job-1", ["queued", "failed", "running"])
+
+
+def test_job_lock_renewal_is_owner_checked() -> None:
+    """Renewal should only extend a lock this token still owns."""
+    settings = SharedSettings(job_timeout_seconds=30)
+    redis = Mock()
+    redis.eval.return_value = 0
+
+    assert renew_job_lock(redis, settings, "job-1", "worker-a:t") is False
+
+    script, num_keys, key, token, ttl_ms = redis.eval.call_args.args
+    assert "PEXPIRE" in script
+    assert (num_keys, key, token, ttl_ms) == (
+        1,
+        "jobs:lock:job-1",
+        "worker-a:t",
+        60_000,
+    )
+
+
+def test_job_lock_uses_set_nx_px_and_owner_checked_release() -> None:
+    """Job locks should be owner-tokened Redis keys with a TTL."""
+    settings = SharedSettings(job_timeout_seconds=30)
+    redis = Mock()
+    redis.set.return_value = True
+
+    token = try_acquire_job_lock(redis, settings, "job-1", worker_name="worker-a")
+
+    assert token is not None and token.startswith("worker-a:")
+    redis.set.assert_called_once_with("jobs:lock:job-1", token, nx=True, px=60_000)
+
+    release_job_lock(redis, settings, "job-1", token)
+    script, num_keys, key, released_token = redis.eval.call_args.args
+    assert "DEL" in script
+    assert (num_keys, key, released_token) == (1, "jobs:lock:job-1", token)
+
+    redis.set.return_value = None
+    assert try_acquire_job_lock(redis, settings, "job-1", worker_name="b") is None
+
+
+def test_job_outcome_buffer_batches_and_forces_flush_for_dead_jobs(
+    default_settings: SharedSettings,
+) -> None:
+    """Outcomes should be written together once the batch fills or on demand."""
+    buffer = JobOutcomeBuffer(default_settings, max_items=3, interval_ms=60_000)
+
+    with patch("five08.queue.write_job_outcomes") as mock_write:
+        buffer.add(JobOutcome(job_id="job-1", status=JobStatus.RUNNING))
+        buffer.add(JobOutcome(job_id="job-1", status=JobStatus.SUCCEEDED))
+        buffer.add(JobOutcome(job_id="job-2", status=JobStatus.SUCCEEDED))
+        mock_write.assert_not_called()
+
+        buffer.add(
+            JobOutcome(job_id="job-3", status=JobStatus.DEAD, attempts=8),
+            flush=True,
+        )
+        buffer.close()
+
+    mock_write.assert_called_once()
+    outcomes = mock_write.call_args.args[1]
+    assert [(outcome.job_id, outcome.status) for outcome in outcomes] == [
+        ("job-1", JobStatus.SUCCEEDED),
+        ("job-2", JobStatus.SUCCEEDED),
+        ("job-3", JobStatus.DEAD),
+    ]
+
+
+def test_mark_job_reuses_cached_prepared_statement_per_shape(
+    default_settings: SharedSettings,
+) -> None:
+    """Repeated marks with the same shape should reuse one prepared statement."""
+    job_ids = [uuid4(), uuid4()]
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.cursor.return_value = cursor
+
+    with patch("five08.queue.get_postgres_connection", return_value=conn):
+        mark_job_dead(default_settings, str(job_ids[0]), attempts=3, last_error="boom")
+        mark_job_dead(default_settings, str(job_ids[1]), attempts=4, last_error="bang")
+
+    first, second = cursor.execute.call_args_list
+    assert first.args[0] is second.args[0]
+    assert first.args[0] in _MARK_JOB_SQL_CACHE.values()
+    assert first.kwargs == {"prepare": True}
+    assert first.args[1] == ["dead", 3, None, None, None, "boom", job_ids[0]]
+
+
+def test_compute_retry_delay_applies_jitter_and_cap() -> None:
+    """Retry delays should scale the exponential step by 0.5-1.5 and cap it."""
+    settings = SharedSettings(job_retry_base_seconds=5, job_retry_max_seconds=300)
+
+    with patch("five08.queue.random.uniform", return_value=0.5) as mock_uniform:
+        assert compute_retry_delay(3, settings) == timedelta(seconds=10)
+    mock_uniform.assert_called_once_with(0.5, 1.5)
+
+    with patch("five08.queue.random.uniform", return_value=1.5):
+        assert compute_retry_delay(3, settings) == timedelta(seconds=30)
+        assert compute_retry_delay(20, settings) == timedelta(seconds=300)
+
+
+def test_get_job_treats_non_uuid_ids_as_missing(
+    default_settings: SharedSettings,
+) -> None:
+    """Malformed ids should short-circuit without a database round trip."""
+    with patch("five08.queue.get_postgres_connection") as mock_connection:
+        assert get_job(default_settings, "not-a-uuid") is None
+
+    mock_connection.assert_not_called()
+
+
+def test_create_job_record_resolves_duplicates_in_one_statement(
+    default_settings: SharedSettings,
+) -> None:
+    """Idempotency conflicts should return the existing id without a re-query."""
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchone.return_value = {"id": "existing-1", "created": False}
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.cursor.return_value = cursor
+
+    with patch("five08.queue.get_postgres_connection", return_value=conn):
+        result = create_job_record(
+            settings=default_settings,
+            job_type="noop",
+            payload={},
+            idempotency_key="key-1",
+        )
+
+    assert result == ("existing-1", False)
+    cursor.execute.assert_called_once()
+    query, params = cursor.execute.call_args.args
+    assert "NOT EXISTS (SELECT 1 FROM inserted)" in query
+    assert params[4] == params[-1] == "key-1"
+
+
+async def test_get_job_async_reads_from_async_pool(
+    default_settings: SharedSettings,
+) -> None:
+    """Async job lookups should use the async pool and map rows to records."""
+    now = datetime.now(timezone.utc)
+    job_id = uuid4()
+    cursor = AsyncMock()
+    cursor.__aenter__.return_value = cursor
+    cursor.fetchone.return_value = {
+        "id": job_id,
+        "type": "noop",
+        "status": "queued",
+        "payload": None,
+        "idempotency_key": None,
+        "attempts": 0,
+        "max_attempts": 8,
+        "run_after": None,
+        "locked_at": None,
+        "locked_by": None,
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    connection_cm = AsyncMock()
+    connection_cm.__aenter__.return_value = conn
+
+    with patch(
+        "five08.queue.get_async_postgres_connection", return_value=connection_cm
+    ):
+        record = await get_job_async(default_settings, str(job_id))
+
+    assert record is not None
+    assert (record.id, record.status, record.payload) == (
+        str(job_id),
+        JobStatus.QUEUED,
+        {},
+    )
+    assert cursor.execute.await_args.args[1] == (job_id,)
+
+
+def test_get_redis_connection_reuses_client_per_connection_settings() -> None:
+    """Redis clients should be shared for identical URL/timeout settings."""
+    _cached_redis_client.cache_clear()
+    try:
+        first = get_redis_connection(SharedSettings(redis_url="redis://cache:6379/0"))
+        second = get_redis_connection(SharedSettings(redis_url="redis://cache:6379/0"))
+        other = get_redis_connection(SharedSettings(redis_url="redis://cache:6379/1"))
+    finally:
+        _cached_redis_client.cache_clear()
+
+    assert first is second
+    assert other is not first
+    assert first.connection_pool.connection_kwargs["health_check_interval"] == 30
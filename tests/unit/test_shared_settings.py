@@ -64,3 +64,27 @@ def test_shared_settings_docuseal_template_id_rejects_non_numeric_string() -> No
         match="DOCUSEAL_MEMBER_AGREEMENT_TEMPLATE_ID must be an integer",
     ):
         SharedSettings(docuseal_member_agreement_template_id="abc")
+
+
+def test_sqlalchemy_postgres_url_uses_psycopg_dialect() -> None:
+    """The derived SQLAlchemy URL should select the psycopg driver."""
+    settings = SharedSettings(postgres_url="postgresql://user@db:5432/workflows")
+
+    assert (
+        settings.sqlalchemy_postgres_url
+        == "postgresql+psycopg://user@db:5432/workflows"
+    )
+
+
+def test_sqlalchemy_postgres_url_follows_postgres_url_changes() -> None:
+    """The derived URL should not go stale when postgres_url is replaced."""
+    settings = SharedSettings(postgres_url="postgresql://user@db:5432/workflows")
+    assert settings.sqlalchemy_postgres_url.endswith("@db:5432/workflows")
+
+    copied = settings.model_copy(
+        update={"postgres_url": "postgresql://user@other:5432/workflows"}
+    )
+    settings.postgres_url = "postgresql://user@db:5432/changed"
+
+    assert settings.sqlalchemy_postgres_url.endswith("@db:5432/changed")
+    assert copied.sqlalchemy_postgres_url.endswith("@other:5432/workflows")
@@ -1,20 +1,31 @@
 """Unit tests for shared skill normalization helpers."""
 
+import pytest
+
 from five08.skills import (
     DISALLOWED_RESUME_SKILLS,
+    extract_skills,
     normalize_skill,
     normalize_skill_list,
     normalize_skill_payload,
 )
 
 
-def test_normalize_skill_prefers_discord_friendly_canonical_forms() -> None:
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Node.js", "node"),
+        ("A/B Testing", "ab testing"),
+        ("GTM", "go to market"),
+        ("CRM", "customer relationship management"),
+        ("SEO", "search engine optimization"),
+    ],
+)
+def test_normalize_skill_prefers_discord_friendly_canonical_forms(
+    raw: str, expected: str
+) -> None:
     """Canonical outputs should avoid punctuation-heavy variants and initials."""
-    assert normalize_skill("Node.js") == "node"
-    assert normalize_skill("A/B Testing") == "ab testing"
-    assert normalize_skill("GTM") == "go to market"
-    assert normalize_skill("CRM") == "customer relationship management"
-    assert normalize_skill("SEO") == "search engine optimization"
+    assert normalize_skill(raw) == expected
 
 
 def test_normalize_skill_list_dedupes_after_aliasing() -> None:
@@ -46,3 +57,19 @@ def test_normalize_skill_payload_drops_disallowed_terms() -> None:
 
     assert skills == ["python"]
     assert attrs == {"python": 4}
+
+
+def test_extract_skills_scans_free_text_for_longest_alias_matches() -> None:
+    """Free-text extraction should canonicalize aliases and dedupe in order."""
+    text = (
+        "Built Node.js + TS services on K8s; "
+        "tracked funnels in Google Analytics 4 and GA4."
+    )
+
+    assert extract_skills(text) == [
+        "node",
+        "typescript",
+        "kubernetes",
+        "google analytics",
+    ]
+    assert extract_skills("") == []
@@ -1,29 +1,41 @@
 """Unit tests for heuristic skills extraction."""
 
+import pytest
+
 from five08.resume_skills_extractor import SkillsExtractor as SharedSkillsExtractor
 from five08.worker.crm.skills_extractor import SkillsExtractor
 
 
-def test_heuristic_extract_includes_two_letter_skill_go() -> None:
-    """Heuristic fallback should detect 2-letter skills in COMMON_SKILLS."""
-    extractor = SkillsExtractor()
-    extractor.client = None
+@pytest.fixture(scope="module")
+def _shared_extractor() -> SkillsExtractor:
+    """Build the worker skills extractor (and its client) once per module."""
+    return SkillsExtractor()
 
-    result = extractor.extract_skills("Built distributed services in Go and Docker")
 
-    assert "go" in result.skills
-    assert "docker" in result.skills
-    assert result.skill_attrs["go"].strength == 3
-    assert result.skill_attrs["docker"].strength == 3
+@pytest.fixture
+def extractor(
+    _shared_extractor: SkillsExtractor, monkeypatch: pytest.MonkeyPatch
+) -> SkillsExtractor:
+    """Return the shared extractor forced onto the heuristic path."""
+    monkeypatch.setattr(_shared_extractor, "client", None)
+    return _shared_extractor
 
 
-def test_heuristic_extractor_includes_two_letter_go_skill() -> None:
-    """Heuristic extraction should include two-letter skill tokens like go."""
-    extractor = SkillsExtractor()
-    result = extractor._extract_skills_heuristic("Built services in Go and Python")
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Built distributed services in Go and Docker", {"go", "docker"}),
+        ("Built services in Go and Python", {"go", "python"}),
+    ],
+)
+def test_heuristic_extract_includes_two_letter_skill_go(
+    extractor: SkillsExtractor, text: str, expected: set[str]
+) -> None:
+    """Heuristic fallback should detect 2-letter skills in COMMON_SKILLS."""
+    result = extractor.extract_skills(text)
 
-    assert "go" in result.skills
-    assert "python" in result.skills
+    assert expected <= set(result.skills)
+    assert {result.skill_attrs[skill].strength for skill in expected} == {3}
 
 
 def test_shared_heuristic_extractor_detects_multiword_phrases() -> None:
@@ -42,9 +54,10 @@ def test_shared_heuristic_extractor_detects_multiword_phrases() -> None:
     assert "customer relationship management" in result.skills
 
 
-def test_normalize_extracted_payload_canonicalizes_and_validates_strength() -> None:
+def test_normalize_extracted_payload_canonicalizes_and_validates_strength(
+    extractor: SkillsExtractor,
+) -> None:
     """LLM payload normalization should map aliases and ignore out-of-range strengths."""
-    extractor = SkillsExtractor()
 
     result = extractor._normalize_extracted_payload(
         skills_value=["JS", " PM ", "A/B Testing", "Node.js", "Go-To-Market"],
@@ -73,9 +86,10 @@ def test_normalize_extracted_payload_canonicalizes_and_validates_strength() -> N
     assert result.skill_attrs["go to market"].strength == 4
 
 
-def test_normalize_extracted_payload_parses_inline_strength_suffixes() -> None:
+def test_normalize_extracted_payload_parses_inline_strength_suffixes(
+    extractor: SkillsExtractor,
+) -> None:
     """Inline strengths like `skill (4)` should be parsed when included in the skills list."""
-    extractor = SkillsExtractor()
 
     result = extractor._normalize_extracted_payload(
         skills_value=[
@@ -98,9 +112,10 @@ def test_normalize_extracted_payload_parses_inline_strength_suffixes() -> None:
     assert "code quality" not in result.skills
 
 
-def test_normalize_extracted_payload_keeps_ab_testing_and_ui_ux() -> None:
+def test_normalize_extracted_payload_keeps_ab_testing_and_ui_ux(
+    extractor: SkillsExtractor,
+) -> None:
     """Keep technology-like and product-specific terms while dropping broad generic terms."""
-    extractor = SkillsExtractor()
 
     result = extractor._normalize_extracted_payload(
         skills_value=["AB Testing", "UI/UX", "database optimization", "testing"],
@@ -126,9 +141,10 @@ def test_normalize_extracted_payload_keeps_ab_testing_and_ui_ux() -> None:
     assert "testing" not in result.skill_attrs
 
 
-def test_normalize_extracted_payload_disallows_bug_tracking() -> None:
+def test_normalize_extracted_payload_disallows_bug_tracking(
+    extractor: SkillsExtractor,
+) -> None:
     """Generic operational terms like bug tracking should be removed from skill extraction."""
-    extractor = SkillsExtractor()
 
     result = extractor._normalize_extracted_payload(
         skills_value=["Bug Tracking", "Python", "bugtracking", "Code Review"],
@@ -1,7 +1,11 @@
 """Unit tests for worker actor job state transitions."""
 
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
 
 from five08.queue import JobRecord, JobStatus
 from five08.worker import actors
@@ -11,13 +15,22 @@ from five08.worker.crm.docuseal_processor import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _job_lock() -> Iterator[None]:
+    with (
+        patch("five08.worker.actors.try_acquire_job_lock", return_value="token"),
+        patch("five08.worker.actors.release_job_lock"),
+    ):
+        yield
+
+
 def test_run_job_schedules_retry_for_docuseal_processing_error() -> None:
     """Retryable Docuseal failures should be recorded as failed + retried."""
     now = datetime.now(timezone.utc)
     job = JobRecord(
         id="job-123",
         type="process_docuseal_agreement_job",
-        status=JobStatus.QUEUED,
+        status=JobStatus.RUNNING,
         payload={
             "args": ["member@508.dev", "2026-02-25 12:00:00", 42],
             "kwargs": {},
@@ -37,8 +50,7 @@ def test_run_job_schedules_retry_for_docuseal_processing_error() -> None:
         raise DocusealAgreementProcessingError("CRM unavailable")
 
     with (
-        patch("five08.worker.actors.get_job", return_value=job),
-        patch("five08.worker.actors.mark_job_running") as mock_mark_running,
+        patch("five08.worker.actors.claim_job", return_value=job) as mock_claim,
         patch("five08.worker.actors.mark_job_succeeded") as mock_mark_succeeded,
         patch("five08.worker.actors.mark_job_dead") as mock_mark_dead,
         patch("five08.worker.actors._schedule_retry") as mock_schedule_retry,
@@ -50,7 +62,7 @@ def test_run_job_schedules_retry_for_docuseal_processing_error() -> None:
     ):
         actors._run_job("job-123")
 
-    mock_mark_running.assert_called_once()
+    mock_claim.assert_called_once()
     mock_mark_succeeded.assert_not_called()
     mock_mark_dead.assert_not_called()
     mock_schedule_retry.assert_called_once()
@@ -69,7 +81,7 @@ def test_run_job_marks_dead_for_non_retryable_docuseal_error() -> None:
     job = JobRecord(
         id="job-124",
         type="process_docuseal_agreement_job",
-        status=JobStatus.QUEUED,
+        status=JobStatus.RUNNING,
         payload={
             "args": ["member@508.dev", "not-a-date", 42],
             "kwargs": {},
@@ -91,8 +103,7 @@ def test_run_job_marks_dead_for_non_retryable_docuseal_error() -> None:
         )
 
     with (
-        patch("five08.worker.actors.get_job", return_value=job),
-        patch("five08.worker.actors.mark_job_running") as mock_mark_running,
+        patch("five08.worker.actors.claim_job", return_value=job) as mock_claim,
         patch("five08.worker.actors.mark_job_succeeded") as mock_mark_succeeded,
         patch("five08.worker.actors.mark_job_dead") as mock_mark_dead,
         patch("five08.worker.actors._schedule_retry") as mock_schedule_retry,
@@ -104,7 +115,7 @@ def test_run_job_marks_dead_for_non_retryable_docuseal_error() -> None:
     ):
         actors._run_job("job-124")
 
-    mock_mark_running.assert_called_once()
+    mock_claim.assert_called_once()
     mock_mark_succeeded.assert_not_called()
     mock_schedule_retry.assert_not_called()
     mock_mark_dead.assert_called_once()
@@ -115,3 +126,99 @@ def test_run_job_marks_dead_for_non_retryable_docuseal_error() -> None:
         call_args.kwargs["last_error"]
         == "DocusealAgreementNonRetryableError: invalid_completed_at for contact_id=c-1"
     )
+
+
+def test_run_job_skips_delivery_when_claim_is_declined() -> None:
+    """Unclaimable jobs should not invoke handlers or write any state."""
+    with (
+        patch("five08.worker.actors.claim_job", return_value=None),
+        patch("five08.worker.actors.get_job", return_value=None) as mock_get_job,
+        patch("five08.worker.actors.mark_job_succeeded") as mock_mark_succeeded,
+        patch("five08.worker.actors.mark_job_dead") as mock_mark_dead,
+    ):
+        actors._run_job("job-missing")
+
+    mock_get_job.assert_called_once()
+    mock_mark_succeeded.assert_not_called()
+    mock_mark_dead.assert_not_called()
+
+
+def test_run_job_defers_delivery_when_redis_lock_is_held() -> None:
+    """A held Redis lock should redeliver shortly instead of dropping the job."""
+    with (
+        patch.object(actors.settings, "job_retry_base_seconds", 3),
+        patch("five08.worker.actors.try_acquire_job_lock", return_value=None),
+        patch("five08.worker.actors.release_job_lock") as mock_release,
+        patch("five08.worker.actors.claim_job") as mock_claim,
+        patch.object(actors.execute_job, "send_with_options") as mock_send,
+    ):
+        actors._run_job("job-locked")
+
+    mock_claim.assert_not_called()
+    mock_release.assert_not_called()
+    mock_send.assert_called_once_with(args=("job-locked",), delay=3000)
+
+
+def test_job_lock_heartbeat_renews_until_job_finishes() -> None:
+    """The heartbeat should renew the held lock and stop with the job."""
+    renewed = threading.Event()
+
+    def _renew(*_args: object) -> bool:
+        renewed.set()
+        return True
+
+    with (
+        patch.object(
+            type(actors.settings),
+            "effective_job_lock_ttl_ms",
+            new_callable=PropertyMock,
+            return_value=30,
+        ),
+        patch("five08.worker.actors.renew_job_lock", side_effect=_renew) as mock_renew,
+    ):
+        with actors._job_lock_heartbeat("job-1", "token"):
+            assert renewed.wait(timeout=2)
+        calls_after_exit = mock_renew.call_count
+
+    assert mock_renew.call_args.args[2:] == ("job-1", "token")
+    assert mock_renew.call_count == calls_after_exit
+
+
+def test_run_job_flushes_outcome_before_releasing_lock() -> None:
+    """A succeeded outcome must be written before the lock is released."""
+    now = datetime.now(timezone.utc)
+    job = JobRecord(
+        id="job-125",
+        type="noop_job",
+        status=JobStatus.RUNNING,
+        payload={"args": [], "kwargs": {}},
+        idempotency_key=None,
+        attempts=0,
+        max_attempts=8,
+        run_after=None,
+        locked_at=None,
+        locked_by=None,
+        last_error=None,
+        created_at=now,
+        updated_at=now,
+    )
+    calls = Mock()
+
+    with (
+        patch("five08.worker.actors.claim_job", return_value=job),
+        patch(
+            "five08.worker.actors.release_job_lock", side_effect=calls.release_job_lock
+        ),
+        patch("five08.queue.write_job_outcomes", side_effect=calls.write_job_outcomes),
+        patch.dict(actors._HANDLERS, {"noop_job": lambda: "ok"}, clear=False),
+    ):
+        actors._run_job("job-125")
+
+    assert [name for name, _args, _kwargs in calls.mock_calls] == [
+        "write_job_outcomes",
+        "release_job_lock",
+    ]
+    outcomes = calls.write_job_outcomes.call_args.args[1]
+    assert [(outcome.job_id, outcome.status) for outcome in outcomes] == [
+        ("job-125", JobStatus.SUCCEEDED)
+    ]
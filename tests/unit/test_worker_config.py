@@ -6,6 +6,19 @@ from pydantic import ValidationError
 from five08.worker.config import WorkerSettings
 
 
+@pytest.fixture(scope="module")
+def default_settings() -> WorkerSettings:
+    """Worker settings with only the required CRM fields, validated once.
+
+    Tests of derived properties start from ``model_copy(update=...)``; tests of
+    validators build a fresh ``WorkerSettings`` so validation actually runs.
+    """
+    return WorkerSettings(
+        espo_base_url="https://crm.test.com",
+        espo_api_key="test-key",
+    )
+
+
 def test_email_intake_requires_mailbox_credentials() -> None:
     with pytest.raises(ValidationError, match="EMAIL_PASSWORD must be set"):
         WorkerSettings(
@@ -68,15 +81,20 @@ def test_email_intake_validation_passes_with_required_fields() -> None:
     assert settings.email_resume_intake_enabled is True
 
 
-def test_docuseal_template_id_normalizes_blank_string_to_none() -> None:
-    """Docuseal template filter should treat empty string as unset."""
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-        docuseal_member_agreement_template_id="",
-    )
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("", None), ("  ", None), (None, None), ("68", 68), (" 68 ", 68), (68, 68)],
+)
+def test_docuseal_template_id_normalizer(raw: object, expected: int | None) -> None:
+    """Docuseal template filter should treat blanks as unset and coerce ints."""
+    normalize = WorkerSettings._normalize_docuseal_member_agreement_template_id
+
+    assert normalize(raw) == expected
 
-    assert settings.docuseal_member_agreement_template_id is None
+
+def test_docuseal_template_id_normalizer_rejects_non_numeric_string() -> None:
+    with pytest.raises(ValueError, match="must be an integer"):
+        WorkerSettings._normalize_docuseal_member_agreement_template_id("abc")
 
 
 def test_docuseal_template_id_accepts_numeric_string() -> None:
@@ -90,42 +108,33 @@ def test_docuseal_template_id_accepts_numeric_string() -> None:
     assert settings.docuseal_member_agreement_template_id == 68
 
 
-def test_discord_bot_internal_base_url_defaults_to_compose_service() -> None:
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-    )
-
-    assert settings.discord_bot_internal_base_url == "http://discord_bot:3000"
+def test_discord_bot_internal_base_url_defaults_to_compose_service(
+    default_settings: WorkerSettings,
+) -> None:
+    assert default_settings.discord_bot_internal_base_url == "http://discord_bot:3000"
 
 
-def test_google_forms_allowed_form_ids_parses_as_set() -> None:
+def test_google_forms_allowed_form_ids_parses_as_set(
+    default_settings: WorkerSettings,
+) -> None:
     """Allowed form IDs should be parsed into a normalized set."""
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-        google_forms_allowed_form_ids="form-1, form-2,,  form-3 ",
+    settings = default_settings.model_copy(
+        update={"google_forms_allowed_form_ids": "form-1, form-2,,  form-3 "}
     )
 
     assert settings.google_forms_allowed_form_ids_set == {"form-1", "form-2", "form-3"}
 
 
-def test_oidc_admin_groups_default_matches_authentik_admins() -> None:
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-    )
-
-    assert settings.oidc_admin_group_names == {"authentik admins"}
-
+def test_oidc_admin_groups_default_matches_authentik_admins(
+    default_settings: WorkerSettings,
+) -> None:
+    assert default_settings.oidc_admin_group_names == {"authentik admins"}
 
-def test_discord_admin_roles_default_is_admin_owner() -> None:
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-    )
 
-    assert settings.discord_admin_role_names == {"admin", "owner"}
+def test_discord_admin_roles_default_is_admin_owner(
+    default_settings: WorkerSettings,
+) -> None:
+    assert default_settings.discord_admin_role_names == {"admin", "owner"}
 
 
 def test_intake_resume_fetch_timeout_must_be_positive() -> None:
@@ -146,11 +155,13 @@ def test_intake_resume_max_redirects_must_be_non_negative() -> None:
         )
 
 
-def test_intake_resume_allowed_hostnames_normalizes_dots_and_empties() -> None:
-    settings = WorkerSettings(
-        espo_base_url="https://crm.test.com",
-        espo_api_key="test-key",
-        intake_resume_allowed_hosts=" .Example.com., ., sub.example.com., , ",
+def test_intake_resume_allowed_hostnames_normalizes_dots_and_empties(
+    default_settings: WorkerSettings,
+) -> None:
+    settings = default_settings.model_copy(
+        update={
+            "intake_resume_allowed_hosts": " .Example.com., ., sub.example.com., , "
+        }
     )
 
     assert settings.intake_resume_allowed_hostnames == {
@@ -2,39 +2,41 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from email.message import EmailMessage
 from types import SimpleNamespace
-from unittest.mock import Mock
-
-from five08.worker.mailbox_resume_ingest import ResumeAttachment, ResumeMailboxProcessor
+from unittest.mock import Mock, create_autospec
 
+import pytest
 
-class _MinimalProfile:
-    def __init__(self, email: str | None = None) -> None:
-        self.email = email
+from five08.worker.crm.resume_profile_processor import ResumeProfileProcessor
+from five08.worker.mailbox_resume_ingest import ResumeAttachment, ResumeMailboxProcessor
 
-    def model_dump(self) -> dict[str, str | None]:
-        return {"email": self.email}
 
+def _profile(email: str | None = None) -> SimpleNamespace:
+    """Extracted-profile stub; the processor only calls model_dump()."""
+    return SimpleNamespace(model_dump=lambda: {"email": email})
 
-class _MinimalProfileWithExtras(_MinimalProfile):
-    def __init__(
-        self,
-        *,
-        email: str | None = None,
-        additional_emails: list[str] | None = None,
-    ) -> None:
-        super().__init__(email=email)
-        self.additional_emails = additional_emails
 
-    def model_dump(self) -> dict[str, object]:
-        return {
-            "email": self.email,
-            "additional_emails": self.additional_emails or [],
-        }
+# Read-only extract results: the staging pass finds the candidate email, the
+# candidate pass proposes the contact updates.
+_STAGING_THEN_CANDIDATE_EXTRACTS = (
+    SimpleNamespace(
+        success=True,
+        extracted_profile=_profile("candidate@example.com"),
+        proposed_updates={},
+    ),
+    SimpleNamespace(
+        success=True,
+        extracted_profile=_profile(),
+        proposed_updates={"phoneNumber": "14155551234"},
+    ),
+)
 
 
-def _build_settings() -> SimpleNamespace:
+@pytest.fixture(scope="module")
+def mailbox_settings() -> SimpleNamespace:
+    """Worker settings stub shared by the module; processors only read it."""
     return SimpleNamespace(
         espo_base_url="https://crm.test.com",
         espo_api_key="test_key",
@@ -65,15 +67,51 @@ def _build_message(*, include_attachment: bool = True) -> EmailMessage:
     return message
 
 
-def test_process_message_happy_path() -> None:
-    processor = ResumeMailboxProcessor(_build_settings())
-    processor._audit_mailbox_outcome = Mock()
-    processor._sender_is_authorized = Mock(return_value=True)
-    processor._has_authenticated_sender = Mock(return_value=True)
-    processor._find_or_create_staging_contact = Mock(return_value={"id": "staging-1"})
-    processor._process_attachment = Mock(return_value=True)
+@pytest.fixture(scope="module")
+def _shared_processor(mailbox_settings: SimpleNamespace) -> ResumeMailboxProcessor:
+    return ResumeMailboxProcessor(mailbox_settings)
+
+
+@pytest.fixture
+def processor(_shared_processor: ResumeMailboxProcessor) -> ResumeMailboxProcessor:
+    """Processor shared by the module; tests stub methods via monkeypatch."""
+    return _shared_processor
+
+
+@pytest.fixture(scope="module")
+def _resume_processor_double() -> Mock:
+    return create_autospec(ResumeProfileProcessor, instance=True)
+
+
+@pytest.fixture
+def resume_processor(_resume_processor_double: Mock) -> Iterator[Mock]:
+    """Autospecced resume processor, built once and reset after each test."""
+    yield _resume_processor_double
+    _resume_processor_double.reset_mock(return_value=True, side_effect=True)
 
-    result = processor.process_message(_build_message())
+
+@pytest.fixture(scope="module")
+def resume_message() -> EmailMessage:
+    """Build the MIME resume message once; tests only read it."""
+    return _build_message()
+
+
+def test_process_message_happy_path(
+    processor: ResumeMailboxProcessor,
+    resume_message: EmailMessage,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(processor, "_audit_mailbox_outcome", Mock())
+    monkeypatch.setattr(processor, "_sender_is_authorized", Mock(return_value=True))
+    monkeypatch.setattr(processor, "_has_authenticated_sender", Mock(return_value=True))
+    monkeypatch.setattr(
+        processor,
+        "_find_or_create_staging_contact",
+        Mock(return_value={"id": "staging-1"}),
+    )
+    monkeypatch.setattr(processor, "_process_attachment", Mock(return_value=True))
+
+    result = processor.process_message(resume_message)
 
     assert result.skipped_reason is None
     assert result.processed_attachments == 1
@@ -81,48 +119,47 @@ def test_process_message_happy_path() -> None:
     processor._process_attachment.assert_called_once()
 
 
-def test_process_message_denies_unauthorized_sender() -> None:
-    processor = ResumeMailboxProcessor(_build_settings())
-    processor._audit_mailbox_outcome = Mock()
-    processor._sender_is_authorized = Mock(return_value=False)
-    processor._has_authenticated_sender = Mock(return_value=True)
+def test_process_message_denies_unauthorized_sender(
+    processor: ResumeMailboxProcessor,
+    resume_message: EmailMessage,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(processor, "_audit_mailbox_outcome", Mock())
+    monkeypatch.setattr(processor, "_sender_is_authorized", Mock(return_value=False))
+    monkeypatch.setattr(processor, "_has_authenticated_sender", Mock(return_value=True))
 
-    result = processor.process_message(_build_message())
+    result = processor.process_message(resume_message)
 
     assert result.skipped_reason == "sender_not_authorized"
     assert result.processed_attachments == 0
 
 
-def test_process_attachment_updates_candidate_contact() -> None:
-    processor = ResumeMailboxProcessor(_build_settings())
-    processor._upload_contact_resume = Mock(
-        side_effect=["att-staging", "att-candidate"]
+def test_process_attachment_updates_candidate_contact(
+    processor: ResumeMailboxProcessor,
+    resume_processor: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        processor,
+        "_upload_contact_resume",
+        Mock(side_effect=["att-staging", "att-candidate"]),
     )
-    processor._append_contact_resume = Mock(return_value=True)
-    processor._find_contact_by_email = Mock(return_value=None)
-    processor._create_contact_for_email = Mock(return_value={"id": "candidate-1"})
-    processor._candidate_email_from_extract_result = Mock(
-        side_effect=["candidate@example.com", None]
+    monkeypatch.setattr(processor, "_append_contact_resume", Mock(return_value=True))
+    monkeypatch.setattr(processor, "_find_contact_by_email", Mock(return_value=None))
+    monkeypatch.setattr(
+        processor, "_create_contact_for_email", Mock(return_value={"id": "candidate-1"})
     )
-
-    staging_extract = SimpleNamespace(
-        success=True,
-        extracted_profile=_MinimalProfile("candidate@example.com"),
-        proposed_updates={},
-    )
-    candidate_extract = SimpleNamespace(
-        success=True,
-        extracted_profile=_MinimalProfile(),
-        proposed_updates={"phoneNumber": "14155551234"},
+    monkeypatch.setattr(
+        processor,
+        "_candidate_email_from_extract_result",
+        Mock(side_effect=["candidate@example.com", None]),
     )
-    apply_result = SimpleNamespace(success=True)
 
-    processor.resume_processor = Mock()
-    processor.resume_processor.extract_profile_proposal.side_effect = [
-        staging_extract,
-        candidate_extract,
-    ]
-    processor.resume_processor.apply_profile_updates.return_value = apply_result
+    resume_processor.extract_profile_proposal.side_effect = iter(
+        _STAGING_THEN_CANDIDATE_EXTRACTS
+    )
+    resume_processor.apply_profile_updates.return_value = SimpleNamespace(success=True)
+    monkeypatch.setattr(processor, "resume_processor", resume_processor)
 
     ok = processor._process_attachment(
         staging_contact_id="staging-1",
@@ -133,21 +170,22 @@ def test_process_attachment_updates_candidate_contact() -> None:
     processor._create_contact_for_email.assert_called_once_with(
         "candidate@example.com", None
     )
-    processor.resume_processor.apply_profile_updates.assert_called_once_with(
+    resume_processor.apply_profile_updates.assert_called_once_with(
         contact_id="candidate-1",
         updates={"phoneNumber": "14155551234"},
         link_discord=None,
     )
 
 
-def test_candidate_email_from_extract_result_falls_back_to_additional_email() -> None:
-    processor = ResumeMailboxProcessor(_build_settings())
-
+def test_candidate_email_from_extract_result_falls_back_to_additional_email(
+    processor: ResumeMailboxProcessor,
+) -> None:
     result = processor._candidate_email_from_extract_result(
         {
-            "extracted_profile": _MinimalProfileWithExtras(
-                additional_emails=["secondary@example.com"]
-            ).model_dump(),
+            "extracted_profile": {
+                "email": None,
+                "additional_emails": ["secondary@example.com"],
+            },
         }
     )
 
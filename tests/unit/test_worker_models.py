@@ -1,5 +1,7 @@
 """Unit tests for worker models."""
 
+import pytest
+
 from five08.worker.models import (
     AuditEventPayload,
     DocusealWebhookPayload,
@@ -18,15 +20,28 @@ def test_espocrm_webhook_payload_from_list() -> None:
     assert payload.events[0].name == "Jane"
 
 
-def test_audit_event_payload_defaults_metadata() -> None:
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {
+            "source": "discord",
+            "action": "crm.search",
+            "result": "success",
+            "actor_provider": "discord",
+            "actor_subject": "12345",
+        },
+        {
+            "source": "admin_dashboard",
+            "action": "people.sync",
+            "actor_provider": "admin_sso",
+            "actor_subject": "admin@508.dev",
+        },
+    ],
+    ids=["discord", "admin_dashboard"],
+)
+def test_audit_event_payload_defaults_metadata(fields: dict[str, str]) -> None:
     """Audit payload should default metadata to an empty object."""
-    payload = AuditEventPayload(
-        source="discord",
-        action="crm.search",
-        result="success",
-        actor_provider="discord",
-        actor_subject="12345",
-    )
+    payload = AuditEventPayload.model_validate(fields)
     assert payload.metadata == {}
 
 
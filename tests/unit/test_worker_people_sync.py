@@ -43,6 +43,17 @@ def test_to_person_record_parses_discord_snapshot_fields() -> None:
     assert person.address_state == "Washington"
 
 
+def test_discord_roles_string_tolerates_irregular_separators() -> None:
+    """Comma-separated roles should be trimmed and empty entries dropped."""
+    processor = PeopleSyncProcessor()
+
+    assert processor._discord_roles("Member,  Admin,, ,Mentor ") == [
+        "Member",
+        "Admin",
+        "Mentor",
+    ]
+
+
 def test_email_falls_back_to_email_address_data() -> None:
     """People sync should use primary emailAddressData when emailAddress is missing."""
     processor = PeopleSyncProcessor()
@@ -60,3 +71,22 @@ def test_email_falls_back_to_email_address_data() -> None:
 
     assert person is not None
     assert person.email == "primary@example.com"
+
+
+def test_email_uses_first_address_data_entry_without_primary() -> None:
+    """People sync should fall back to the first usable email when none is primary."""
+    processor = PeopleSyncProcessor()
+
+    person = processor._to_person_record(
+        {
+            "id": "contact-3",
+            "emailAddressData": [
+                {"emailAddress": " ", "primary": True},
+                {"emailAddress": "first@example.com", "primary": False},
+                {"emailAddress": "second@example.com"},
+            ],
+        }
+    )
+
+    assert person is not None
+    assert person.email == "first@example.com"
@@ -1,5 +1,6 @@
 """Unit tests for contact skills processor."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 from five08.worker.crm.processor import ContactSkillsProcessor
@@ -10,32 +11,34 @@ def test_process_contact_skills_merges_and_updates() -> None:
     """Processor should merge extracted skills with existing and update CRM."""
     processor = ContactSkillsProcessor()
 
-    processor.espocrm_client = Mock()
-    processor.document_processor = Mock()
-    processor.skills_extractor = Mock()
-
-    processor.espocrm_client.get_contact.return_value = Mock(skills="Python, Redis")
-    processor.espocrm_client.get_contact_attachments.return_value = [
-        {"id": "a-1", "name": "resume.pdf"}
-    ]
-    processor.espocrm_client.download_attachment.return_value = b"file-content"
-    processor.document_processor.extract_text.return_value = "Python FastAPI Docker"
-    processor.skills_extractor.extract_skills.return_value = ExtractedSkills(
-        skills=["python", "fastapi", "docker"],
-        confidence=0.9,
-        source="heuristic",
+    update_contact_skills = Mock(return_value=True)
+    processor.espocrm_client = SimpleNamespace(
+        get_contact=lambda _contact_id: SimpleNamespace(skills="Python, Redis"),
+        get_contact_attachments=lambda _contact_id: [
+            {"id": "a-1", "name": "resume.pdf"}
+        ],
+        download_attachment=lambda _attachment_id: b"file-content",
+        update_contact_skills=update_contact_skills,
+    )
+    processor.document_processor = SimpleNamespace(
+        extract_text=lambda _content, _filename: "Python FastAPI Docker"
     )
-    processor.skills_extractor.canonicalize_skill.side_effect = lambda value: (
-        str(value).strip().lower()
+    processor.skills_extractor = SimpleNamespace(
+        extract_skills=lambda _text: ExtractedSkills(
+            skills=["python", "fastapi", "docker"],
+            confidence=0.9,
+            source="heuristic",
+        )
     )
-    processor.espocrm_client.update_contact_skills.return_value = True
 
     result = processor.process_contact_skills("contact-1")
 
     assert result.success is True
-    assert sorted(result.new_skills) == ["docker", "fastapi"]
+    assert result.extracted_skills.confidence == 0.9
+    assert result.extracted_skills.source == "document_analysis"
+    assert result.new_skills == ["fastapi", "docker"]
     assert set(result.updated_skills) == {"python", "redis", "fastapi", "docker"}
-    processor.espocrm_client.update_contact_skills.assert_called_once_with(
+    update_contact_skills.assert_called_once_with(
         "contact-1",
         ["python", "redis", "fastapi", "docker"],
     )